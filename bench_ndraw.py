@@ -0,0 +1,607 @@
+#!/usr/bin/env python3
+"""
+Benchmark-Suite für Vector Network Designer Pro
+Misst Laufzeit und Speicherspitzen zentraler Operationen auf synthetischen Netzwerken.
+
+Headless ausführen:
+    QT_QPA_PLATFORM=offscreen python3 bench_ndraw.py --sizes 1000,10000 --output bench.json
+    QT_QPA_PLATFORM=offscreen python3 bench_ndraw.py --baseline bench.json
+    QT_QPA_PLATFORM=offscreen python3 bench_ndraw.py --startup --sizes 10000
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from PyQt6.QtWidgets import QApplication, QStyleOptionGraphicsItem
+from PyQt6.QtGui import QImage, QPainter, QColor
+from ndraw import DirectedEdge, MainWindow, Node
+
+DEFAULT_SIZES = [1000, 10000]
+DEFAULT_THRESHOLD = 1.25
+DEFAULT_MEMORY_THRESHOLD = 1.25
+MEMORY_SLACK_KIB = 256  # kleinere Zuwächse der Speicherspitze sind Rauschen
+SPACING = 80
+
+
+# --- Synthetische Netzwerke -------------------------------------------------
+
+def generate_random(n, seed=42):
+    """Zufallsgraph mit ca. 2n Kanten, Knoten gleichverteilt in einem Quadrat."""
+    rng = random.Random(seed)
+    side = math.sqrt(n) * SPACING
+    nodes = [(i, rng.uniform(0, side), rng.uniform(0, side)) for i in range(n)]
+    edges = []
+    for _ in range(2 * n):
+        a, b = rng.randrange(n), rng.randrange(n)
+        if a != b:
+            edges.append((a, b))
+    return nodes, edges
+
+
+def generate_grid(n, seed=42):
+    """Gitter mit Kanten nach rechts und unten."""
+    cols = max(1, math.ceil(math.sqrt(n)))
+    nodes = [(i, (i % cols) * SPACING, (i // cols) * SPACING) for i in range(n)]
+    edges = []
+    for i in range(n):
+        if (i + 1) % cols and i + 1 < n:
+            edges.append((i, i + 1))
+        if i + cols < n:
+            edges.append((i, i + cols))
+    return nodes, edges
+
+
+def generate_scale_free(n, seed=42, m=2):
+    """Barabási-Albert-Graph: neue Knoten verbinden sich bevorzugt mit Hubs."""
+    rng = random.Random(seed)
+    side = math.sqrt(n) * SPACING
+    nodes = [(i, rng.uniform(0, side), rng.uniform(0, side)) for i in range(n)]
+    edges = []
+    targets = list(range(min(m, n)))
+    repeated = []
+    for source in range(len(targets), n):
+        chosen = set()
+        while len(chosen) < len(targets):
+            chosen.add(rng.choice(repeated) if repeated else rng.choice(targets))
+        for target in chosen:
+            edges.append((source, target))
+        repeated.extend(chosen)
+        repeated.extend([source] * len(chosen))
+    return nodes, edges
+
+
+GENERATORS = {
+    "random": generate_random,
+    "grid": generate_grid,
+    "scale_free": generate_scale_free,
+}
+
+
+# --- Hilfsfunktionen --------------------------------------------------------
+
+def populate(window, nodes, edges):
+    """Baut das Netzwerk über die öffentliche Canvas-API auf."""
+    canvas = window.canvas
+    node_map = {}
+    for node_id, x, y in nodes:
+        node_map[node_id] = canvas.add_new_node(x, y, node_id)
+    for a, b in edges:
+        canvas.add_new_edge(node_map[a], node_map[b])
+
+
+def write_json(path, nodes, edges):
+    data = {
+        "nodes": [{"id": i, "x": x, "y": y, "label": str(i)} for i, x, y in nodes],
+        "edges": [{"from": a, "to": b} for a, b in edges],
+    }
+    with open(path, "w") as f:
+        json.dump(data, f)
+
+
+def write_csv(path, nodes, edges):
+    with open(path, "w") as f:
+        f.write("source,target\n")
+        for a, b in edges:
+            f.write(f"{a},{b}\n")
+
+
+def paint_edges(window):
+    """Zeichnet alle Kanten über DirectedEdge.paint in ein Offscreen-Bild."""
+    image = QImage(1024, 1024, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(QColor("#ffffff"))
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    rect = window.canvas.scene.itemsBoundingRect()
+    if rect.width() > 0 and rect.height() > 0:
+        scale = min(image.width() / rect.width(), image.height() / rect.height())
+        painter.scale(scale, scale)
+        painter.translate(-rect.left(), -rect.top())
+    option = QStyleOptionGraphicsItem()
+    for edge in window.canvas.edges:
+        DirectedEdge.paint(edge, painter, option)
+    painter.end()
+
+
+# --- Operationen ------------------------------------------------------------
+# Jede Operation liefert (setup, run). setup baut einen frischen Zustand auf,
+# run führt nur die gemessene Operation aus.
+
+def op_load_json(window, nodes, edges, tmpdir):
+    path = Path(tmpdir) / "bench_load.json"
+    def setup():
+        write_json(path, nodes, edges)
+    def run():
+        window.load_json_file(str(path))
+    return setup, run
+
+
+def op_import_csv(window, nodes, edges, tmpdir):
+    path = Path(tmpdir) / "bench_import.csv"
+    def setup():
+        write_csv(path, nodes, edges)
+    def run():
+        window.import_graph_file(str(path))
+    return setup, run
+
+
+def op_save_json(window, nodes, edges, tmpdir):
+    path = Path(tmpdir) / "bench_save.json"
+    def setup():
+        reset(window)
+        populate(window, nodes, edges)
+    def run():
+        window.save_json_file(str(path))
+    return setup, run
+
+
+def op_export_svg(window, nodes, edges, tmpdir):
+    path = Path(tmpdir) / "bench_export.svg"
+    def setup():
+        reset(window)
+        populate(window, nodes, edges)
+    def run():
+        window.export_svg_file(str(path))
+    return setup, run
+
+
+def op_export_svg_after_move(window, nodes, edges, tmpdir):
+    path = Path(tmpdir) / "bench_export.svg"
+    def setup():
+        reset(window)
+        populate(window, nodes, edges)
+        window.export_svg_file(str(path))
+        window.canvas.nodes[0].moveBy(10, 10)
+    def run():
+        window.export_svg_file(str(path))
+    return setup, run
+
+
+def op_export_graphml(window, nodes, edges, tmpdir):
+    path = Path(tmpdir) / "bench_export.graphml"
+    def setup():
+        reset(window)
+        populate(window, nodes, edges)
+    def run():
+        window.export_graph_file(str(path))
+    return setup, run
+
+
+def op_paste(window, nodes, edges, tmpdir):
+    def setup():
+        reset(window)
+        populate(window, nodes, edges)
+        window.canvas.select_all()
+        window.canvas.copy_selection()
+    def run():
+        window.canvas.paste()
+    return setup, run
+
+
+def op_is_connected(window, nodes, edges, tmpdir):
+    def setup():
+        reset(window)
+        populate(window, nodes, edges)
+    def run():
+        window.is_connected()
+    return setup, run
+
+
+def op_build_adjacency(window, nodes, edges, tmpdir):
+    def setup():
+        reset(window)
+        populate(window, nodes, edges)
+    def run():
+        window.canvas.adjacency()
+    return setup, run
+
+
+def op_delete_selected_items(painted):
+    """Löscht jeden zweiten Knoten samt Kanten.
+    
+    painted: Das Fenster wurde vorher gezeichnet, Polish und BSP-Index der
+    Scene sind also abgearbeitet - der Normalfall, wenn Nutzer auswählen.
+    Sonst wird direkt nach dem Einfügen gelöscht (Skripte, Import).
+    """
+    def op(window, nodes, edges, tmpdir):
+        def setup():
+            reset(window)
+            populate(window, nodes, edges)
+            if painted:
+                window.resize(1000, 800)
+                window.show()
+                QApplication.processEvents()
+            for node in window.canvas.nodes[::2]:
+                node.setSelected(True)
+        def run():
+            window.canvas.delete_selected_items()
+        return setup, run
+    return op
+
+
+def op_edge_paint(window, nodes, edges, tmpdir):
+    def setup():
+        reset(window)
+        populate(window, nodes, edges)
+    def run():
+        paint_edges(window)
+    return setup, run
+
+
+SEARCH_QUERIES = ["1", "12", "123", "99", "x", "0"]
+
+
+def op_label_search(window, nodes, edges, tmpdir):
+    def setup():
+        reset(window)
+        populate(window, nodes, edges)
+        window.canvas.label_index.flush()
+    def run():
+        for query in SEARCH_QUERIES:
+            window.canvas.label_index.search(query)
+    return setup, run
+
+
+PAN_STEPS = 30
+PAN_STEP_PX = 40
+
+
+def pan(window, steps=PAN_STEPS):
+    """Verschiebt die Ansicht schrittweise und zeichnet jeden Schritt synchron neu."""
+    canvas = window.canvas
+    bar = canvas.horizontalScrollBar()
+    for i in range(steps):
+        direction = 1 if (i // 10) % 2 == 0 else -1
+        bar.setValue(bar.value() + direction * PAN_STEP_PX)
+        canvas.viewport().repaint()
+
+
+def op_pan(cached):
+    def op(window, nodes, edges, tmpdir):
+        def setup():
+            reset(window)
+            populate(window, nodes, edges)
+            window.canvas.set_item_caching(cached)
+            window.resize(1000, 800)
+            window.show()
+            QApplication.processEvents()
+            window.canvas.centerOn(window.canvas.scene.itemsBoundingRect().center())
+            # Ein Durchlauf zum Füllen der Caches, gemessen wird der zweite
+            pan(window)
+        def run():
+            pan(window)
+        return setup, run
+    return op
+
+
+DRAG_STEPS = 30
+
+
+def op_drag(background):
+    def op(window, nodes, edges, tmpdir):
+        def setup():
+            reset(window)
+            populate(window, nodes, edges)
+            window.canvas.set_background_caching(background)
+            window.resize(1000, 800)
+            window.show()
+            QApplication.processEvents()
+            canvas = window.canvas
+            canvas.centerOn(canvas.scene.itemsBoundingRect().center())
+            node = canvas.itemAt(canvas.viewport().rect().center())
+            canvas.select_items([node if isinstance(node, Node) else canvas.nodes[0]])
+            canvas.viewport().repaint()
+        def run():
+            # Zieht den ausgewählten Knoten und zeichnet jeden Schritt synchron neu
+            canvas = window.canvas
+            node = canvas.scene.selectedItems()[0]
+            for i in range(DRAG_STEPS):
+                node.moveBy(3, 2)
+                canvas.viewport().repaint()
+        return setup, run
+    return op
+
+
+OVERVIEW_ZOOM = 0.1
+OVERVIEW_REPAINTS = 5
+
+
+def op_overview(semantic):
+    def op(window, nodes, edges, tmpdir):
+        def setup():
+            reset(window)
+            populate(window, nodes, edges)
+            window.resize(1000, 800)
+            window.show()
+            QApplication.processEvents()
+            canvas = window.canvas
+            canvas.scale(OVERVIEW_ZOOM, OVERVIEW_ZOOM)
+            canvas.zoom_factor = OVERVIEW_ZOOM
+            canvas.centerOn(canvas.scene.itemsBoundingRect().center())
+            canvas.set_semantic_zoom(semantic)
+            canvas.viewport().repaint()
+        def run():
+            # Zeichnet die weit herausgezoomte Ansicht wiederholt synchron neu
+            for i in range(OVERVIEW_REPAINTS):
+                window.canvas.viewport().repaint()
+        return setup, run
+    return op
+
+
+def op_layout_components(window, nodes, edges, tmpdir):
+    def setup():
+        reset(window)
+        populate(window, nodes, edges)
+    def run():
+        window.canvas.layout_components()
+    return setup, run
+
+OPERATIONS = {
+    "load_json": op_load_json,
+    "import_csv": op_import_csv,
+    "save_json": op_save_json,
+    "export_svg": op_export_svg,
+    "export_svg_after_move": op_export_svg_after_move,
+    "export_graphml": op_export_graphml,
+    "paste": op_paste,
+    "is_connected": op_is_connected,
+    "build_adjacency": op_build_adjacency,
+    "delete_selected_items": op_delete_selected_items(True),
+    "delete_selected_items_fresh": op_delete_selected_items(False),
+    "layout_components": op_layout_components,
+    "edge_paint": op_edge_paint,
+    "label_search": op_label_search,
+    "pan_cached": op_pan(True),
+    "pan_uncached": op_pan(False),
+    "drag_background": op_drag(True),
+    "drag_live": op_drag(False),
+    "overview_clusters": op_overview(True),
+    "overview_items": op_overview(False),
+}
+
+
+def reset(window):
+    canvas = window.canvas
+    canvas.clear_network()
+    canvas.set_item_caching(False)
+    canvas.set_background_caching(False)
+    canvas.set_semantic_zoom(False)
+    canvas.resetTransform()
+    canvas.zoom_factor = 1.0
+
+
+def measure(setup, run):
+    """Misst Laufzeit (ohne tracemalloc) und Python-Speicherspitze (separater Lauf)."""
+    setup()
+    gc.collect()
+    start = time.perf_counter()
+    run()
+    seconds = time.perf_counter() - start
+
+    setup()
+    gc.collect()
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": seconds, "peak_kib": peak / 1024}
+
+
+def run_suite(sizes, graphs, operations, verbose=True):
+    app = QApplication.instance() or QApplication(sys.argv)
+    window = MainWindow()
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for graph in graphs:
+            for size in sizes:
+                nodes, edges = GENERATORS[graph](size)
+                for name in operations:
+                    setup, run = OPERATIONS[name](window, nodes, edges, tmpdir)
+                    key = f"{graph}/{size}/{name}"
+                    results[key] = measure(setup, run)
+                    if name.startswith("pan_"):
+                        results[key]["frame_ms"] = results[key]["seconds"] * 1000 / PAN_STEPS
+                    if verbose:
+                        r = results[key]
+                        print(f"{key:40s} {r['seconds']*1000:10.1f} ms {r['peak_kib']:10.0f} KiB")
+                reset(window)
+    window.close()
+    return results
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD,
+            memory_threshold=DEFAULT_MEMORY_THRESHOLD, memory_slack_kib=MEMORY_SLACK_KIB):
+    """Liefert (Schlüssel, Größe, alt, neu, Faktor) für jede Regression.
+    
+    Laufzeit zählt ab baseline * threshold, die Speicherspitze ab
+    baseline * memory_threshold und mindestens memory_slack_kib mehr.
+    """
+    regressions = []
+    for key, result in results.items():
+        reference = baseline.get(key)
+        if not reference:
+            continue
+        if reference["seconds"] > 0:
+            ratio = result["seconds"] / reference["seconds"]
+            if ratio > threshold:
+                regressions.append((key, "seconds", reference["seconds"], result["seconds"], ratio))
+        old, new = reference.get("peak_kib"), result.get("peak_kib")
+        if old and new is not None and new - old > memory_slack_kib:
+            ratio = new / old
+            if ratio > memory_threshold:
+                regressions.append((key, "peak_kib", old, new, ratio))
+    return regressions
+
+
+# --- Startzeit --------------------------------------------------------------
+# Jeder Lauf startet einen frischen Prozess über ndraw.main; gemessen wird ab
+# dem Start bis zum ersten Frame des Canvas bzw. bis eine übergebene Datei
+# geladen und gezeichnet ist.
+
+STARTUP_TARGET_MS = 250
+STARTUP_RUNS = 5
+STARTUP_TIMEOUT = 120
+
+STARTUP_PROBE = """
+import sys
+sys.path.insert(0, sys.argv[1])
+from PyQt6.QtCore import QObject, QEvent
+from PyQt6.QtWidgets import QApplication
+import ndraw
+
+class Probe(QObject):
+    painted = False
+
+    def eventFilter(self, obj, event):
+        canvas = obj.parent() if event.type() == QEvent.Type.Paint else None
+        if isinstance(canvas, ndraw.NetworkCanvas) and obj is canvas.viewport():
+            if not self.painted:
+                self.painted = True
+                print("first_paint", flush=True)
+            if len(sys.argv) < 3 or canvas.stats.node_count:
+                print("loaded", flush=True)
+                app.quit()
+        return False
+
+app = QApplication(sys.argv[:1])
+probe = Probe()
+app.installEventFilter(probe)
+ndraw.main(["ndraw"] + sys.argv[2:])
+"""
+
+
+def startup_run(path=None):
+    """Ein Programmstart; liefert die Sekunden bis zum ersten Frame und bis zum Laden."""
+    args = [sys.executable, "-c", STARTUP_PROBE, str(Path(__file__).parent / "src")]
+    if path:
+        args.append(str(path))
+    start = time.perf_counter()
+    proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    times = {}
+    try:
+        for line in proc.stdout:
+            times[line.strip()] = time.perf_counter() - start
+        proc.wait(STARTUP_TIMEOUT)
+    finally:
+        proc.kill()
+        proc.stdout.close()
+    if set(times) != {"first_paint", "loaded"}:
+        raise RuntimeError(f"Start fehlgeschlagen (Exit-Code {proc.returncode})")
+    return times["first_paint"], times["loaded"]
+
+
+def measure_startup(sizes, graphs, runs=STARTUP_RUNS, verbose=True):
+    """Median über mehrere Starts: leer und mit je einer JSON-Datei pro Graph und Größe."""
+    cases = [("startup/empty", None)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for graph in graphs:
+            for size in sizes:
+                path = Path(tmpdir) / f"{graph}_{size}.json"
+                write_json(path, *GENERATORS[graph](size))
+                cases.append((f"startup/{graph}/{size}", path))
+        startup_run()  # Aufwärmen: Dateicache und Qt-Plugins
+        results = {}
+        for prefix, path in cases:
+            first, loaded = zip(*(startup_run(path) for _ in range(runs)))
+            results[f"{prefix}/first_paint"] = {"seconds": statistics.median(first)}
+            if path:
+                results[f"{prefix}/loaded"] = {"seconds": statistics.median(loaded)}
+            if verbose:
+                for key in (f"{prefix}/first_paint", f"{prefix}/loaded"):
+                    if key in results:
+                        print(f"{key:40s} {results[key]['seconds']*1000:10.1f} ms")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ndraw Benchmark-Suite")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Knotenanzahlen, z.B. 1000,10000,100000")
+    parser.add_argument("--graphs", default=",".join(GENERATORS),
+                        help="Graphtypen: " + ", ".join(GENERATORS))
+    parser.add_argument("--ops", default=",".join(OPERATIONS),
+                        help="Operationen: " + ", ".join(OPERATIONS))
+    parser.add_argument("--output", help="Ergebnisse als JSON speichern")
+    parser.add_argument("--baseline", help="Vergleich mit gespeicherter Baseline (JSON)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Faktor, ab dem eine Laufzeit als Regression gilt")
+    parser.add_argument("--memory-threshold", type=float, default=DEFAULT_MEMORY_THRESHOLD,
+                        help="Faktor, ab dem eine Speicherspitze als Regression gilt")
+    parser.add_argument("--startup", action="store_true",
+                        help=f"Startzeit messen (Ziel erster Frame: {STARTUP_TARGET_MS} ms)")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    graphs = [g for g in args.graphs.split(",") if g]
+    operations = [o for o in args.ops.split(",") if o]
+
+    if args.startup:
+        results = measure_startup(sizes, graphs)
+    else:
+        results = run_suite(sizes, graphs, operations)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"python": sys.version.split()[0], "results": results}, f, indent=2)
+        print(f"\n✓ Ergebnisse gespeichert: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold, args.memory_threshold)
+        if regressions:
+            print(f"\n✗ {len(regressions)} Regression(en) "
+                  f"(Schwelle Zeit x{args.threshold}, Speicher x{args.memory_threshold}):")
+            for key, metric, old, new, ratio in regressions:
+                if metric == "seconds":
+                    print(f"  {key:40s} {old*1000:8.1f} ms -> {new*1000:8.1f} ms (x{ratio:.2f})")
+                else:
+                    print(f"  {key:40s} {old:8.0f} KiB -> {new:8.0f} KiB (x{ratio:.2f})")
+            return 1
+        print("\n✓ Keine Regressionen gegenüber der Baseline")
+
+    if args.startup:
+        first_paint = results["startup/empty/first_paint"]["seconds"] * 1000
+        if first_paint > STARTUP_TARGET_MS:
+            print(f"\n✗ Erster Frame nach {first_paint:.0f} ms (Ziel {STARTUP_TARGET_MS} ms)")
+            return 1
+        print(f"\n✓ Erster Frame nach {first_paint:.0f} ms (Ziel {STARTUP_TARGET_MS} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,20 +1,471 @@
 import sys
+import os
 import json
 import math
+import time
+import cProfile
+import functools
+import contextlib
+import importlib
+import bisect
+import struct
+import heapq
+import re
+import csv
+import itertools
+import operator
+from array import array
+from collections import deque, Counter
 from pathlib import Path
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QGraphicsView, QGraphicsScene, 
-                             QGraphicsEllipseItem, QGraphicsLineItem, QGraphicsTextItem,
+                             QGraphicsItem, QGraphicsEllipseItem, QGraphicsLineItem, QGraphicsTextItem,
                              QVBoxLayout, QWidget, QPushButton, QHBoxLayout, QMessageBox, 
-                             QFileDialog, QInputDialog, QStatusBar)  # QStatusBar hinzufügen
-from PyQt6.QtCore import Qt, QPointF, QLineF, QRectF
-from PyQt6.QtGui import QPainter, QPen, QColor, QBrush, QPolygonF, QFont, QIcon, QPixmap
+                             QFileDialog, QInputDialog, QStatusBar,  # QStatusBar hinzufügen
+                             QLineEdit, QCompleter, QDockWidget, QFormLayout, QLabel,
+                             QStyleOptionGraphicsItem)
+from PyQt6.QtCore import (Qt, QPointF, QLineF, QRectF, QRect, QSize, QTimer, QSignalBlocker, QStringListModel, pyqtSignal,
+                          QMimeData, QByteArray, QMetaObject)
+from PyQt6 import sip
+from PyQt6.QtGui import (QPainter, QPen, QColor, QBrush, QPolygonF, QFont, QIcon, QPixmap, QAction,
+                         QStaticText, QTransform, QPixmapCache, QImage, QCursor, QKeySequence, QActionGroup,
+                         QFontMetricsF)
+
+class LazyModule:
+    """Platzhalter, der das Modul erst beim ersten Attributzugriff importiert.
+
+    Danach ersetzt das echte Modul den Platzhalter im Modul-Namensraum.
+    """
+    def __init__(self, name, alias):
+        self._name = name
+        self._alias = alias
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self._name)
+        globals()[self._alias] = module
+        return getattr(module, attr)
+
+
+# NumPy kostet beim Start so viel wie das ganze übrige Programm, wird aber erst
+# für virtualisierte Graphen, Snapshots und Layouts gebraucht
+np = LazyModule("numpy", "np")
+
+class PerfRegistry:
+    """Sammelt Laufzeiten und Aufrufzähler der Hauptoperationen im Prozess.
+
+    Aktivierung über NDRAW_PERF=1 (nur Zeiten) oder NDRAW_PROFILE=1
+    (Zeiten plus cProfile-Mitschnitt) bzw. über das Extras-Menü.
+    """
+    def __init__(self):
+        self.enabled = False     # Zeiten messen: timing oder profiling
+        self.timing = False      # per NDRAW_PERF angefordert
+        self.profiling = False   # cProfile läuft
+        self.stats = {}
+        self.profiler = None
+
+    def configure_from_env(self, environ=os.environ):
+        if environ.get("NDRAW_PROFILE") == "1":
+            self.start_profiling()
+        elif environ.get("NDRAW_PERF") == "1":
+            self.timing = True
+            self.enabled = True
+
+    def record(self, name, seconds):
+        entry = self.stats.get(name)
+        if entry is None:
+            self.stats[name] = [1, seconds, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+            if seconds > entry[2]:
+                entry[2] = seconds
+
+    def start_profiling(self):
+        if self.profiler is None:
+            self.profiler = cProfile.Profile()
+        # Auch nach stop_profiling wieder einschalten; der Mitschnitt läuft weiter
+        self.profiler.enable()
+        self.profiling = self.enabled = True
+
+    def stop_profiling(self):
+        if self.profiler is not None:
+            self.profiler.disable()
+        # Per NDRAW_PERF eingeschaltete Zeitmessung bleibt aktiv
+        self.profiling = False
+        self.enabled = self.timing
+
+    def reset(self):
+        self.stats = {}
+        if self.profiler is not None:
+            self.profiler.disable()
+            self.profiler = cProfile.Profile()
+            if self.profiling:
+                self.profiler.enable()
+
+    def summary(self):
+        return {
+            name: {
+                "count": count,
+                "total_ms": total * 1000,
+                "mean_ms": total * 1000 / count,
+                "max_ms": peak * 1000,
+            }
+            for name, (count, total, peak) in sorted(self.stats.items())
+        }
+
+    def export(self, path):
+        """Schreibt die Statistik als JSON; ein cProfile-Mitschnitt landet daneben als .prof."""
+        path = Path(path)
+        with open(path, "w") as f:
+            json.dump({"operations": self.summary()}, f, indent=4)
+        if self.profiler is not None:
+            self.profiler.create_stats()
+            self.profiler.dump_stats(str(path.with_suffix(".prof")))
+            if self.profiling:
+                self.profiler.enable()
+
+
+PERF = PerfRegistry()
+
+
+def timed(name):
+    """Misst die Laufzeit der dekorierten Funktion, sofern PERF aktiv ist."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not PERF.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                PERF.record(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+# Gemeinsam genutzte Stile, damit Stilwechsel keine neuen Pens/Brushes erzeugen
+NODE_BRUSH = QBrush(QColor("#ffffff"))
+NODE_PEN = QPen(QColor("#2c3e50"), 2)
+NODE_SELECTED_BRUSH = QBrush(QColor("#e3f2fd"))
+NODE_SELECTED_PEN = QPen(QColor("#2196f3"), 3)
+NODE_EDITING_BRUSH = QBrush(QColor("#ff9500"))
+NODE_EDITING_PEN = QPen(QColor("#ff6600"), 3)
+NODE_CONNECTING_BRUSH = QBrush(QColor("#e74c3c"))
+EDGE_PEN = QPen(Qt.GlobalColor.black, 2)
+EDGE_SELECTED_PEN = QPen(QColor("#2196f3"), 4)
+EDGE_BRUSH = QBrush(Qt.GlobalColor.black)
+EDGE_SELECTED_BRUSH = QBrush(QColor("#2196f3"))
+# Plakette mit der Vielfachheit zusammengefasster Kanten
+EDGE_BADGE_RADIUS = 8
+EDGE_BADGE_BRUSH = QBrush(QColor("#2c3e50"))
+EDGE_BADGE_PEN = QPen(QColor("#ffffff"))
+
+# Speicherbudget für die Pixmap-Caches der Items (QPixmapCache, in KiB)
+ITEM_CACHE_BUDGET_KB = 64 * 1024
+
+LABEL_COLOR = QColor("#2c3e50")
+LABEL_CACHE_LIMIT = 20000
+_label_font = None
+_label_cache = {}
+
+def label_font():
+    global _label_font
+    if _label_font is None:
+        _label_font = QFont("Arial", 10, QFont.Weight.Bold)
+    return _label_font
+
+_badge_font = None
+
+def badge_font():
+    global _badge_font
+    if _badge_font is None:
+        _badge_font = QFont("Arial", 8, QFont.Weight.Bold)
+    return _badge_font
+
+def label_static_text(text):
+    """Liefert vorbereiteten QStaticText und Größe, gecacht pro Labeltext."""
+    entry = _label_cache.get(text)
+    if entry is None:
+        if len(_label_cache) >= LABEL_CACHE_LIMIT:
+            _label_cache.clear()
+        static = QStaticText(text)
+        static.setTextFormat(Qt.TextFormat.PlainText)
+        static.setPerformanceHint(QStaticText.PerformanceHint.AggressiveCaching)
+        static.prepare(QTransform(), label_font())
+        entry = (static, static.size())
+        _label_cache[text] = entry
+    return entry
+
+def svg_node_fragment(label, x, y):
+    """SVG-Elemente eines Knotens (Kreis und Beschriftung)."""
+    return (f'  <circle cx="{x}" cy="{y}" r="20" fill="#ffffff" stroke="#2c3e50" stroke-width="2" />\n'
+            f'  <text x="{x}" y="{y}" font-family="Arial" font-size="10" font-weight="bold" text-anchor="middle" fill="#2c3e50" dy=".35em">{label}</text>\n')
+
+def svg_edge_fragment(source, target):
+    """SVG-Linie einer Kante zwischen zwei Mittelpunkten, gekürzt um den
+    Knotenradius; leer, wenn sich die Knoten überlappen."""
+    line = QLineF(source, target)
+    l = line.length()
+    if l <= 40:
+        return ''
+    p1, p2 = line.pointAt(20/l), line.pointAt(1-20/l)
+    return f'  <line x1="{p1.x()}" y1="{p1.y()}" x2="{p2.x()}" y2="{p2.y()}" stroke="black" stroke-width="2" marker-end="url(#arrow)" />\n'
+
+class LabelIndex:
+    """Suchindex über die Labels der Knoten (ohne Groß-/Kleinschreibung).
+    
+    Präfixe werden per bisect in einer sortierten Schlüsselliste gesucht,
+    Teilstrings per str.find in der verketteten Labelliste. Neue Schlüssel
+    werden gesammelt und erst bei der nächsten Suche einsortiert, gelöschte
+    nur als ungültig verworfen. Schlüssel sind Knoten-Items, im
+    virtualisierten Modus Modellindizes; dort entsteht der Index erst bei
+    der ersten Suche (defer).
+    """
+    SEPARATOR = "\0"
+    PENDING_LIMIT = 256
+    
+    def __init__(self):
+        self.clear()
+    
+    def clear(self):
+        self.keys = []       # sortiert: (label, serial), enthält ggf. verworfene
+        self.pending = []    # noch nicht einsortierte Schlüssel
+        self.entries = {}    # node -> (label, serial)
+        self.nodes = {}      # serial -> node, nur gültige Einträge
+        self.text = ""       # Labels aus keys, durch SEPARATOR getrennt
+        self.starts = []     # Startoffset jedes Labels in text
+        self.serial = 0
+        self.source = None   # liefert (nodes, labels) für den verzögerten Aufbau
+    
+    def __len__(self):
+        self.load_deferred()
+        return len(self.entries)
+    
+    def add(self, node):
+        """Nimmt einen Knoten auf bzw. aktualisiert sein Label."""
+        self.set(node, node.label_text)
+    
+    def set(self, node, label):
+        if self.source is not None:
+            return  # der verzögerte Aufbau liest den aktuellen Stand
+        self.discard(node)
+        key = (label.casefold(), self.serial)
+        self.serial += 1
+        self.entries[node] = key
+        self.nodes[key[1]] = node
+        self.pending.append(key)
+    
+    def load(self, nodes, labels):
+        """Baut den Index aus parallelen Folgen auf einmal auf (Modellwechsel)."""
+        self.clear()
+        keys = [(label.casefold(), serial) for serial, label in enumerate(labels)]
+        self.serial = len(keys)
+        self.nodes = dict(enumerate(nodes))
+        self.entries = {node: key for node, key in zip(self.nodes.values(), keys)}
+        self.pending = keys
+        self.flush()
+    
+    def defer(self, source):
+        """Wie load, aber erst vor der ersten Suche mit den Folgen aus source()."""
+        self.clear()
+        self.source = source
+    
+    def load_deferred(self):
+        if self.source is not None:
+            self.load(*self.source())
+    
+    def discard(self, node):
+        key = self.entries.pop(node, None)
+        if key is not None:
+            del self.nodes[key[1]]
+    
+    def flush(self):
+        """Sortiert ausstehende Schlüssel ein und baut den Suchtext neu auf."""
+        self.load_deferred()
+        stale = len(self.keys) > 2 * len(self.nodes)
+        if not self.pending and not stale:
+            return
+        self.keys.extend(self.pending)
+        self.pending = []
+        if stale:
+            self.keys = [key for key in self.keys if key[1] in self.nodes]
+        self.keys.sort()
+        self.starts = []
+        offset = 0
+        for label, _ in self.keys:
+            self.starts.append(offset)
+            offset += len(label) + 1
+        self.text = self.SEPARATOR.join(label for label, _ in self.keys)
+    
+    def search(self, query, limit=50):
+        """Bis zu limit Knoten: erst Präfix-, dann Teilstring-Treffer, je nach Label sortiert."""
+        query = query.casefold()
+        if not query:
+            return []
+        self.load_deferred()
+        # Einzelne Änderungen (z.B. Umbenennen) werden direkt durchsucht,
+        # erst viele ausstehende lohnen den Neuaufbau
+        if len(self.pending) > self.PENDING_LIMIT:
+            self.flush()
+        keys, nodes, starts = self.keys, self.nodes, self.starts
+        # Alle Labels mit diesem Präfix liegen in keys[lo:hi]
+        lo = bisect.bisect_left(keys, (query,))
+        hi = bisect.bisect_left(keys, (query + "\U0010ffff",))
+        prefix = []
+        for key in keys[lo:hi]:
+            if key[1] in nodes:
+                prefix.append(key)
+                if len(prefix) >= limit:
+                    break
+        
+        # Teilstrings außerhalb des Präfixbereichs, in Label-Reihenfolge
+        substring = []
+        end_lo = starts[lo] if lo < len(keys) else len(self.text)
+        start_hi = starts[hi] if hi < len(keys) else len(self.text)
+        for begin, end in ((0, end_lo), (start_hi, len(self.text))):
+            pos = self.text.find(query, begin, end)
+            while pos >= 0 and len(substring) < limit:
+                k = bisect.bisect_right(starts, pos) - 1
+                if keys[k][1] in nodes:
+                    substring.append(keys[k])
+                # Weitere Treffer im selben Label überspringen
+                if k + 1 == len(keys):
+                    break
+                pos = self.text.find(query, starts[k + 1], end)
+        
+        for key in self.pending:
+            if key[1] in nodes and query in key[0]:
+                (prefix if key[0].startswith(query) else substring).append(key)
+        found = sorted(prefix)[:limit] + sorted(substring)
+        return [nodes[serial] for _, serial in found[:limit]]
+
+# Umgang mit parallelen Kanten (gleiche Quelle, gleiches Ziel) beim Einfügen
+EDGE_POLICIES = {
+    "allow": "Erlauben",
+    "merge": "Zusammenfassen",
+    "reject": "Ablehnen",
+}
+
+class EdgeIndex:
+    """Hash-Index der Kanten nach (Quelle, Ziel) für Duplikatprüfungen in O(1).
+    
+    Im Item-Modus sind Schlüssel Knoten-Items und Werte Kanten-Items, im
+    virtualisierten Modus Modellindizes; dort wird der Index erst beim
+    ersten Bedarf aufgebaut. Parallele Kanten stehen gemeinsam in einer Liste.
+    """
+    def __init__(self):
+        self.clear()
+    
+    def clear(self, built=True):
+        self.edges = {}
+        self.built = built  # False: Änderungen werden bis zum Aufbau ignoriert
+    
+    def build(self, keys, edges):
+        self.clear()
+        for key, edge in zip(keys, edges):
+            self.add(key, edge)
+    
+    def find(self, key):
+        edges = self.edges.get(key)
+        return edges[0] if edges else None
+    
+    def add(self, key, edge):
+        if self.built:
+            self.edges.setdefault(key, []).append(edge)
+    
+    def discard(self, key, edge):
+        edges = self.edges.get(key)
+        if edges and edge in edges:
+            edges.remove(edge)
+            if not edges:
+                del self.edges[key]
+    
+    def discard_many(self, keys, edges):
+        """Wie discard für parallele Folgen von Schlüsseln und Kanten."""
+        index = self.edges
+        for key, edge in zip(keys, edges):
+            bucket = index.get(key)
+            if bucket and edge in bucket:
+                if len(bucket) == 1:
+                    del index[key]
+                else:
+                    bucket.remove(edge)
+
+class BoundsIndex:
+    """Begrenzungsrechteck einer Punktmenge, inkrementell nachgeführt.
+    
+    Je Richtung (min x, max x, min y, max y) ein Heap mit verzögertem
+    Löschen: Setzen kostet O(log N), Entfernen O(1); veraltete Einträge
+    fallen erst heraus, wenn sie oben liegen. Wächst ein Heap über das
+    Doppelte der Punkte, wird er neu aufgebaut. Eine Teilmenge (subset, die
+    Auswahl) wird beim Verschieben und Entfernen mitgeführt.
+    """
+    SIGNS = (1, -1, 1, -1)
+    
+    def __init__(self, subset=None):
+        self.subset = subset
+        self.clear()
+    
+    def clear(self):
+        self.points = {}
+        self.heaps = ([], [], [], [])
+        self.serial = 0
+        if self.subset is not None:
+            self.subset.clear()
+    
+    def __len__(self):
+        return len(self.points)
+    
+    def __contains__(self, key):
+        return key in self.points
+    
+    def set(self, key, x, y):
+        self.points[key] = (x, y)
+        self.serial += 1
+        for heap, value in zip(self.heaps, (x, -x, y, -y)):
+            heapq.heappush(heap, (value, self.serial, key))
+        if len(self.heaps[0]) > 2 * len(self.points) + 64:
+            self.compact()
+        if self.subset is not None and key in self.subset.points:
+            self.subset.set(key, x, y)
+    
+    def discard(self, key):
+        self.points.pop(key, None)
+        if self.subset is not None:
+            self.subset.discard(key)
+    
+    def compact(self):
+        self.serial = 0
+        heaps = ([], [], [], [])
+        for key, (x, y) in self.points.items():
+            self.serial += 1
+            for heap, value in zip(heaps, (x, -x, y, -y)):
+                heap.append((value, self.serial, key))
+        for heap in heaps:
+            heapq.heapify(heap)
+        self.heaps = heaps
+    
+    def extent(self):
+        """(min_x, min_y, max_x, max_y) oder None für eine leere Menge."""
+        if not self.points:
+            return None
+        result = []
+        for axis, (heap, sign) in enumerate(zip(self.heaps, self.SIGNS)):
+            while True:
+                value, _, key = heap[0]
+                point = self.points.get(key)
+                if point is not None and point[axis // 2] * sign == value:
+                    break
+                heapq.heappop(heap)
+            result.append(value * sign)
+        min_x, max_x, min_y, max_y = result
+        return min_x, min_y, max_x, max_y
 
 class Node(QGraphicsEllipseItem):
     def __init__(self, x, y, node_id, label=None):
         super().__init__(-20, -20, 40, 40)
         self.setPos(x, y)
-        self.setBrush(QBrush(QColor("#ffffff")))
-        self.setPen(QPen(QColor("#2c3e50"), 2))
+        self.setBrush(NODE_BRUSH)
+        self.setPen(NODE_PEN)
         self.setFlags(QGraphicsEllipseItem.GraphicsItemFlag.ItemIsMovable | 
                       QGraphicsEllipseItem.GraphicsItemFlag.ItemSendsGeometryChanges |
                       QGraphicsEllipseItem.GraphicsItemFlag.ItemIsSelectable)
@@ -22,29 +473,92 @@ class Node(QGraphicsEllipseItem):
         self.lines = []
         self.is_editing = False
         
+        # Label wird in paint() als QStaticText gezeichnet; ein editierbares
+        # QGraphicsTextItem existiert nur während edit_node_label
+        self.label_editor = None
+        self.label_index = None
+        self.background = None
+        self.cluster_index = None
+        self.bounds_index = None
+        # Im virtualisierten Modus: Modell und Index für das Zurückschreiben
+        self.model = None
+        self.model_index = None
+        # [Fragment] für den SVG-Export, gefüllt vom Schreiber im Hintergrund;
+        # None nach Verschieben/Umbenennen
+        self.svg_fragment = None
         self.label_text = label if label is not None else str(node_id)
-        self.label = QGraphicsTextItem(self.label_text, self)
-        self.label.setDefaultTextColor(QColor("#2c3e50"))
-        font = QFont("Arial", 10, QFont.Weight.Bold)
-        self.label.setFont(font)
-        self.label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction) 
-        self.label.setTabChangesFocus(True) 
         self.update_label_position()
 
     def update_label_position(self):
-        br = self.label.boundingRect()
-        self.label.setPos(-br.width()/2, -br.height()/2)
+        self.prepareGeometryChange()
+        self.label_static, size = label_static_text(self.label_text)
+        self.label_rect = QRectF(-size.width()/2, -size.height()/2, size.width(), size.height())
+        self.update_bounds()
     
     def set_label(self, text):
+        if self.background is not None:
+            self.background.invalidate_item(self)
         self.label_text = text
-        self.label.setPlainText(text)
+        self.svg_fragment = None
+        if self.model is not None:
+            self.model.labels[self.model_index] = text
+            if self.label_index is not None:
+                self.label_index.set(self.model_index, text)
+        elif self.label_index is not None:
+            self.label_index.add(self)
         self.update_label_position()
+        self.update()
+        if self.background is not None:
+            self.background.invalidate_item(self)
+    
+    def update_bounds(self):
+        """Cacht boundingRect (Ellipse samt Pen und Label) für Index und Paint."""
+        self.bounds = super().boundingRect().united(self.label_rect)
+    
+    def boundingRect(self):
+        return self.bounds
+    
+    def paint(self, painter, option, widget=None):
+        super().paint(painter, option, widget)
+        if self.label_editor is None:
+            painter.setPen(LABEL_COLOR)
+            painter.setFont(label_font())
+            painter.drawStaticText(self.label_rect.topLeft(), self.label_static)
+    
+    def open_label_editor(self):
+        editor = QGraphicsTextItem(self.label_text, self)
+        editor.setDefaultTextColor(LABEL_COLOR)
+        editor.setFont(label_font())
+        editor.setTabChangesFocus(True)
+        br = editor.boundingRect()
+        editor.setPos(-br.width()/2, -br.height()/2)
+        self.label_editor = editor
+        self.update()
+        return editor
+    
+    def close_label_editor(self):
+        """Entfernt den Editor; gelöscht wird erst im Event-Loop, da dies aus
+        dessen eigenem focusOutEvent heraus geschehen kann."""
+        editor = self.label_editor
+        self.label_editor = None
+        if editor is not None:
+            editor.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+            editor.hide()
+            editor.deleteLater()
+        self.update()
+    
+    def apply_style(self, brush, pen):
+        """Setzt Brush/Pen nur bei echter Änderung, damit der Item-Cache gültig bleibt."""
+        if self.brush() != brush:
+            self.setBrush(brush)
+        if self.pen() != pen:
+            self.setPen(pen)
+            self.update_bounds()
     
     def set_editing_mode(self, editing):
         self.is_editing = editing
         if editing:
-            self.setBrush(QBrush(QColor("#ff9500")))
-            self.setPen(QPen(QColor("#ff6600"), 3))
+            self.apply_style(NODE_EDITING_BRUSH, NODE_EDITING_PEN)
         else:
             self.update_selection_style()
     
@@ -53,32 +567,63 @@ class Node(QGraphicsEllipseItem):
             return
         
         if self.isSelected():
-            self.setBrush(QBrush(QColor("#e3f2fd")))
-            self.setPen(QPen(QColor("#2196f3"), 3))
+            self.apply_style(NODE_SELECTED_BRUSH, NODE_SELECTED_PEN)
         else:
-            self.setBrush(QBrush(QColor("#ffffff")))
-            self.setPen(QPen(QColor("#2c3e50"), 2))
+            self.apply_style(NODE_BRUSH, NODE_PEN)
+    
+    def svg_slot(self):
+        """Platz für das SVG-Fragment, geteilt mit dem Snapshot; gültig bis zur nächsten Änderung.
+        
+        Formatiert wird nicht hier, sondern in write_svg_file im Worker-Thread,
+        der einen leeren Platz füllt. Eine Änderung hängt den Platz ab, ein
+        noch laufender Export füllt dann nur noch seine eigene Kopie.
+        """
+        if self.svg_fragment is None:
+            self.svg_fragment = [None]
+        return self.svg_fragment
+
+    # itemChange läuft für jedes Item mehrfach (auch beim Polish neuer Items),
+    # die Enum-Werte werden deshalb nur einmal aufgelöst
+    POSITION_CHANGE = QGraphicsEllipseItem.GraphicsItemChange.ItemPositionChange
+    POSITION_CHANGED = QGraphicsEllipseItem.GraphicsItemChange.ItemPositionHasChanged
 
     def itemChange(self, change, value):
-        if change == QGraphicsEllipseItem.GraphicsItemChange.ItemPositionChange:
+        # Auswahl-Stil setzt NetworkCanvas.apply_selection_styles gesammelt
+        if change == self.POSITION_CHANGE:
+            if self.background is not None:
+                self.background.node_moved(self, value)
+            if self.cluster_index is not None:
+                self.cluster_index.move_node(self, value.x(), value.y())
+            if self.bounds_index is not None:
+                self.bounds_index.set(self, value.x(), value.y())
+            self.svg_fragment = None
             for line in self.lines:
                 line.update_position()
-        elif change == QGraphicsEllipseItem.GraphicsItemChange.ItemSelectedChange:
-            self.update_selection_style()
-        return super().itemChange(change, value)
+            if self.model is not None:
+                self.model.move_node(self.model_index, value.x(), value.y())
+        elif change == self.POSITION_CHANGED:
+            if self.background is not None:
+                self.background.view.rebucket(self)
+        # QGraphicsItem::itemChange gibt value unverändert zurück; der Aufruf
+        # zurück nach C++ würde nur Argumente und Ergebnis erneut umwandeln
+        return value
 
 class DirectedEdge(QGraphicsLineItem):
     def __init__(self, source, target):
         super().__init__()
         self.source = source
         self.target = target
-        self.setPen(QPen(Qt.GlobalColor.black, 2))
+        self.setPen(EDGE_PEN)
         self.setFlags(QGraphicsLineItem.GraphicsItemFlag.ItemIsSelectable)
         self.arrow_size = 12
         self.node_radius = 20
+        self.model_index = None
+        self.svg_fragment = None
+        self.multiplicity = 1  # > 1: zusammengefasste parallele Kanten
         self.update_position()
 
     def update_position(self):
+        self.svg_fragment = None
         raw_line = QLineF(self.source.pos(), self.target.pos())
         length = raw_line.length()
         if length > self.node_radius * 2:
@@ -88,17 +633,35 @@ class DirectedEdge(QGraphicsLineItem):
             self.setLine(QLineF(p1, p2))
         else:
             self.setLine(QLineF(self.source.pos(), self.source.pos()))
+        self.update_bounds()
     
     def update_selection_style(self):
-        if self.isSelected():
-            self.setPen(QPen(QColor("#2196f3"), 4))
-        else:
-            self.setPen(QPen(Qt.GlobalColor.black, 2))
+        pen = EDGE_SELECTED_PEN if self.isSelected() else EDGE_PEN
+        if self.pen() != pen:
+            self.setPen(pen)
+    
+    def svg_slot(self):
+        """Platz für das SVG-Fragment (siehe Node.svg_slot), gültig bis sich ein Endknoten bewegt."""
+        if self.svg_fragment is None:
+            self.svg_fragment = [None]
+        return self.svg_fragment
+    
+    def line_ends(self):
+        """Mittelpunkte der Endknoten als (x1, y1, x2, y2)."""
+        p1, p2 = self.source.pos(), self.target.pos()
+        return p1.x(), p1.y(), p2.x(), p2.y()
 
-    def itemChange(self, change, value):
-        if change == QGraphicsLineItem.GraphicsItemChange.ItemSelectedChange:
-            self.update_selection_style()
-        return super().itemChange(change, value)
+    def update_bounds(self):
+        """Cacht boundingRect; setLine hat prepareGeometryChange bereits mit dem
+        alten Rechteck aufgerufen."""
+        # Pfeilspitze ragt seitlich über die Linie hinaus (wichtig für den Item-Cache);
+        # der Rand deckt auch den breiteren Auswahl-Pen ab
+        line = self.line()
+        m = self.arrow_size + EDGE_SELECTED_PEN.widthF()
+        self.bounds = QRectF(line.p1(), line.p2()).normalized().adjusted(-m, -m, m, m)
+
+    def boundingRect(self):
+        return self.bounds
 
     def paint(self, painter, option, widget=None):
         line = self.line()
@@ -110,13 +673,1126 @@ class DirectedEdge(QGraphicsLineItem):
         arrow_p2 = line.p2() - QPointF(math.cos(angle - math.pi/8) * self.arrow_size, -math.sin(angle - math.pi/8) * self.arrow_size)
         
         if self.isSelected():
-            painter.setBrush(QBrush(QColor("#2196f3")))
+            painter.setBrush(EDGE_SELECTED_BRUSH)
         else:
-            painter.setBrush(QBrush(Qt.GlobalColor.black))
+            painter.setBrush(EDGE_BRUSH)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawPolygon(QPolygonF([line.p2(), arrow_p1, arrow_p2]))
+        if self.multiplicity > 1:
+            self.paint_badge(painter, line.center())
+    
+    def paint_badge(self, painter, center):
+        # Liegt in der Linienmitte und bleibt schmaler als der Rand von boundingRect
+        r = EDGE_BADGE_RADIUS
+        text = str(self.multiplicity) if self.multiplicity < 100 else "99+"
+        font = badge_font()
+        width = max(2 * r, QFontMetricsF(font).horizontalAdvance(text) + r)
+        rect = QRectF(center.x() - width / 2, center.y() - r, width, 2 * r)
+        painter.setBrush(EDGE_BADGE_BRUSH)
+        painter.drawRoundedRect(rect, r, r)
+        painter.setPen(EDGE_BADGE_PEN)
+        painter.setFont(font)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+
+# Kantenlänge der räumlichen Buckets (Scene-Einheiten) und Stapelgröße, ab der
+# remove_items die Warteschlangen der Scene vor dem Löschen abarbeitet
+BUCKET_SIZE = 512
+REMOVE_FLUSH_MIN = 1000
+
+class ItemBucket(QGraphicsItem):
+    """Unsichtbarer Elternknoten für die Items einer räumlichen Zelle.
+
+    QGraphicsScene entfernt Top-Level-Items mit einer linearen Suche über alle
+    Top-Level-Items. Als Kinder kleiner Buckets kostet das Entfernen nur
+    O(Bucketgröße); über den BSP-Index findet die Scene weiterhin nur die
+    Buckets im sichtbaren Bereich.
+    
+    Abfragen durchlaufen alle Kinder eines getroffenen Buckets. Das leere
+    boundingRect liegt deshalb in der Zellmitte statt im Ursprung, sonst
+    träfe jede Abfrage bei (0, 0) sämtliche Buckets.
+    """
+    def __init__(self, z, center):
+        super().__init__()
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemHasNoContents)
+        self.setZValue(z)
+        self.bounds = QRectF(center, center)
+
+    def boundingRect(self):
+        return self.bounds
+
+    def paint(self, painter, option, widget=None):
+        pass
+
+class LiveBucket(ItemBucket):
+    """Elternknoten der Kanten gezogener Knoten, außerhalb des BSP-Index.
+    
+    Jede Geometrieänderung nimmt ein Item aus allen BSP-Blättern, die sein
+    Rechteck berührt, und durchsucht deren Listen linear. Bei langen Kanten
+    sind das fast alle Blätter: im Zufallsgraphen mit 20.000 Knoten rund
+    7-60 ms pro Kante und Frame. Kinder eines Items mit
+    ItemContainsChildrenInShape indiziert die Scene nicht einzeln; dieser
+    Bucket deckt dafür jede mögliche Position ab.
+    """
+    EXTENT = 1e9
+    
+    def __init__(self):
+        super().__init__(0, QPointF())
+        self.bounds = QRectF(-self.EXTENT, -self.EXTENT, 2 * self.EXTENT, 2 * self.EXTENT)
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemContainsChildrenInShape)
+        # Die Scene sucht Kinder nur in getroffenen Eltern, der Bucket muss
+        # also überall treffen; Klicks reicht er an die Scene weiter
+        self.setAcceptedMouseButtons(Qt.MouseButton.NoButton)
+
+# Kantenlänge der Hintergrundkacheln in Gerätepixeln, Obergrenze des Kachel-Caches
+# und Wartezeit nach dem letzten Zoomschritt bis zum Neuzeichnen in voller Schärfe
+BACKGROUND_TILE_SIZE = 256
+BACKGROUND_TILE_LIMIT = 512
+BACKGROUND_RESCALE_MS = 150
+
+class BackgroundLayer:
+    """Gecachte Kacheln mit allen ruhenden Knoten und Kanten.
+    
+    Ist die Ebene aktiv, tragen ruhende Items ItemHasNoContents: Die Scene
+    ruft ihr paint() nicht mehr auf, Auswahl und Klicks treffen sie aber
+    weiterhin. Nur lebende Items (ausgewählt, gezogen, bearbeitet,
+    Verbindungsstart) werden live gezeichnet, alle übrigen kommen aus den
+    Kacheln.
+    Ändert sich ein ruhendes Item oder wechselt eines zwischen ruhend und
+    lebend, werden nur die berührten Kacheln verworfen. Nach einem Zoom
+    werden die vorhandenen Kacheln skaliert gezeigt, bis der Zoom ruht.
+    """
+    def __init__(self, view):
+        self.view = view
+        self.enabled = False
+        self.tiles = {}      # (ix, iy) -> QPixmap im Maßstab scale
+        self.scale = None
+        self.live = set()
+        self.live_bucket = None   # LiveBucket für die Kanten gezogener lebender Knoten
+        self.option = QStyleOptionGraphicsItem()
+        self.rescale_timer = QTimer(view)
+        self.rescale_timer.setSingleShot(True)
+        self.rescale_timer.setInterval(BACKGROUND_RESCALE_MS)
+        self.rescale_timer.timeout.connect(self.rescale)
+    
+    def clear(self):
+        self.tiles = {}
+    
+    def adopt(self, item):
+        """Neues Item: ruhend, also nur noch über die Kacheln gezeichnet."""
+        if self.enabled:
+            item.setFlag(QGraphicsItem.GraphicsItemFlag.ItemHasNoContents)
+            self.invalidate(item.sceneBoundingRect())
+    
+    def rescale(self):
+        self.tiles = {}
+        self.scale = None
+        self.view.viewport().update()
+    
+    def tile_span(self, rect):
+        """Kachelindizes, die rect (Scene-Koordinaten) berührt."""
+        size = BACKGROUND_TILE_SIZE / self.scale
+        return (range(math.floor(rect.left() / size), math.floor(rect.right() / size) + 1),
+                range(math.floor(rect.top() / size), math.floor(rect.bottom() / size) + 1))
+    
+    def invalidate(self, rect):
+        if not self.enabled:
+            return
+        if self.tiles:
+            xs, ys = self.tile_span(rect)
+            for ix in xs:
+                for iy in ys:
+                    self.tiles.pop((ix, iy), None)
+        # Ruhende Items zeichnen nichts, ihr Bereich muss explizit neu gezeichnet werden
+        self.view.scene.update(rect)
+    
+    def invalidate_item(self, item):
+        if item not in self.live:
+            self.invalidate(item.sceneBoundingRect())
+
+    def invalidate_items(self, items):
+        """Wie invalidate_item für viele Items, mit einem einzigen scene.update."""
+        if not self.enabled:
+            return
+        rect = QRectF()
+        for item in items:
+            if item in self.live:
+                continue
+            item_rect = item.sceneBoundingRect()
+            if self.tiles:
+                xs, ys = self.tile_span(item_rect)
+                for key in itertools.product(xs, ys):
+                    self.tiles.pop(key, None)
+            rect = rect.united(item_rect)
+        if not rect.isNull():
+            self.view.scene.update(rect)
+    
+    def node_moved(self, node, pos):
+        """Ruhender Knoten wird verschoben: alte und neue Fläche samt Kanten verwerfen.
+        
+        Die Kanten eines lebenden Knotens wandern beim ersten Verschieben in
+        den LiveBucket, bis sie wieder ruhen (siehe attach).
+        """
+        if not self.enabled:
+            return
+        if node in self.live:
+            bucket = self.live_bucket
+            if bucket is None or sip.isdeleted(bucket):
+                bucket = self.live_bucket = LiveBucket()
+                self.view.scene.addItem(bucket)
+            for line in node.lines:
+                if line.parentItem() is not bucket:
+                    line.setParentItem(bucket)
+            return
+        rect = node.sceneBoundingRect()
+        self.invalidate(rect)
+        self.invalidate(rect.translated(pos - node.pos()))
+        for line in node.lines:
+            self.invalidate(line.sceneBoundingRect())
+    
+    def attach(self, edge):
+        """Gibt eine Kante aus dem LiveBucket an den Bucket ihrer Mitte zurück."""
+        bucket = self.live_bucket
+        if bucket is None or sip.isdeleted(bucket) or edge.parentItem() is not bucket:
+            return
+        if self.view.model is not None:
+            edge.setParentItem(None)
+            return
+        mid = (edge.source.pos() + edge.target.pos()) / 2
+        edge.setParentItem(self.view.bucket_for(mid.x(), mid.y(), 0))
+    
+    def draw(self, painter, rect):
+        """Zeichnet die Kacheln für den freigelegten Bereich rect."""
+        scale = self.view.transform().m11()
+        if self.scale is None:
+            self.scale = scale
+        elif scale != self.scale:
+            self.rescale_timer.start()
+            if not all(key in self.tiles for key in itertools.product(*self.tile_span(rect))):
+                # Fehlende Kacheln im alten Maßstab wären beim Herauszoomen
+                # beliebig viele; dann lieber sofort im neuen Maßstab rendern
+                self.tiles = {}
+                self.scale = scale
+        size = BACKGROUND_TILE_SIZE / self.scale
+        xs, ys = self.tile_span(rect)
+        for ix in xs:
+            for iy in ys:
+                tile = self.tiles.get((ix, iy))
+                if tile is None:
+                    tile = self.render_tile(ix, iy)
+                painter.drawPixmap(QRectF(ix * size, iy * size, size, size), tile, QRectF(tile.rect()))
+        if len(self.tiles) > BACKGROUND_TILE_LIMIT:
+            # Älteste Kacheln zuerst verwerfen
+            for key in list(itertools.islice(self.tiles, len(self.tiles) - BACKGROUND_TILE_LIMIT)):
+                del self.tiles[key]
+    
+    def render_tile(self, ix, iy):
+        size = BACKGROUND_TILE_SIZE / self.scale
+        rect = QRectF(ix * size, iy * size, size, size)
+        ratio = self.view.devicePixelRatioF()
+        pixels = math.ceil(BACKGROUND_TILE_SIZE * ratio)
+        tile = QPixmap(pixels, pixels)
+        tile.setDevicePixelRatio(ratio)
+        tile.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(tile)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.scale(self.scale, self.scale)
+        painter.translate(-rect.topLeft())
+        items = self.view.scene.items(rect, Qt.ItemSelectionMode.IntersectsItemBoundingRect,
+                                      Qt.SortOrder.AscendingOrder)
+        for item in items:
+            if isinstance(item, (Node, DirectedEdge)) and item not in self.live:
+                painter.save()
+                painter.translate(item.scenePos())
+                item.paint(painter, self.option)
+                painter.restore()
+        painter.end()
+        self.tiles[ix, iy] = tile
+        return tile
+
+# Semantischer Zoom: Kantenlänge der feinsten Cluster-Zelle (Scene-Einheiten),
+# Anzahl der Ebenen, angestrebte Zellgröße auf dem Bildschirm sowie Zoomstufe
+# und Netzgröße, ab denen statt der Items Cluster gezeichnet werden; von den
+# Kantenbündeln werden höchstens die CLUSTER_BUNDLE_LIMIT schwersten gezeichnet
+CLUSTER_BASE_SIZE = 32
+CLUSTER_LEVELS = 12
+CLUSTER_CELL_PX = 48
+CLUSTER_ZOOM_THRESHOLD = 0.5
+CLUSTER_MIN_NODES = 500
+CLUSTER_BUNDLE_LIMIT = 2000
+CLUSTER_BUNDLE_PEN = QPen(QColor(44, 62, 80, 120))
+
+# Rand um den Inhalt bei "Alles anzeigen" / "Auswahl anzeigen" (Scene-Einheiten)
+FIT_PADDING = 40
+
+class ClusterIndex:
+    """Hierarchische Cluster als Quadtree über die Knotenpositionen.
+    
+    Ebene k besteht aus Gitterzellen der Kantenlänge CLUSTER_BASE_SIZE * 2**k;
+    die Zelle eines Knotens auf Ebene k entsteht aus seiner feinsten Zelle
+    durch Rechtsschieben um k, vier Zellen bilden also je eine Elternzelle.
+    Je Zelle werden Anzahl und Koordinatensummen (Schwerpunkt) geführt, je
+    Zellpaar die Zahl der Kanten dazwischen. Aufgebaut wird erst bei der
+    ersten Verwendung, danach werden Verschieben, Einfügen und Löschen
+    inkrementell nachgeführt.
+    """
+    def __init__(self):
+        self.clear()
+    
+    def clear(self):
+        self.built = False
+        self.keys = {}        # Knoten -> feinste Zelle (cx, cy)
+        self.positions = {}   # Knoten -> (x, y), wie in den Summen enthalten
+        self.cells = [{} for _ in range(CLUSTER_LEVELS)]    # Zelle -> [Anzahl, Summe x, Summe y]
+        self.bundles = [{} for _ in range(CLUSTER_LEVELS)]  # Zelle -> {Nachbarzelle: Kantenzahl}
+    
+    @staticmethod
+    def cell(x, y):
+        return (math.floor(x / CLUSTER_BASE_SIZE), math.floor(y / CLUSTER_BASE_SIZE))
+    
+    @timed("build_clusters")
+    def build(self, nodes, edges):
+        """Baut alle Ebenen auf einmal auf (NumPy statt Einzelupdates)."""
+        self.clear()
+        self.built = True
+        if not nodes:
+            return
+        index = {node: i for i, node in enumerate(nodes)}
+        points = [node.pos() for node in nodes]
+        xs = np.array([p.x() for p in points])
+        ys = np.array([p.y() for p in points])
+        cx = np.floor(xs / CLUSTER_BASE_SIZE).astype(np.int64)
+        cy = np.floor(ys / CLUSTER_BASE_SIZE).astype(np.int64)
+        self.keys = dict(zip(nodes, zip(cx.tolist(), cy.tolist())))
+        self.positions = dict(zip(nodes, zip(xs.tolist(), ys.tolist())))
+        sources = np.array([index[edge.source] for edge in edges], np.int64)
+        targets = np.array([index[edge.target] for edge in edges], np.int64)
+        for k in range(CLUSTER_LEVELS):
+            cells, inverse = np.unique(np.stack([cx >> k, cy >> k], 1), axis=0, return_inverse=True)
+            inverse = inverse.ravel()
+            keys = [tuple(cell) for cell in cells.tolist()]
+            self.cells[k] = {key: [count, sx, sy] for key, count, sx, sy in zip(
+                keys, np.bincount(inverse).tolist(),
+                np.bincount(inverse, xs).tolist(), np.bincount(inverse, ys).tolist())}
+            a, b = inverse[sources], inverse[targets]
+            between = a != b
+            if not between.any():
+                continue
+            pairs, weights = np.unique(np.stack([np.minimum(a, b)[between], np.maximum(a, b)[between]], 1),
+                                       axis=0, return_counts=True)
+            bundles = self.bundles[k]
+            for (p, q), weight in zip(pairs.tolist(), weights.tolist()):
+                bundles.setdefault(keys[p], {})[keys[q]] = weight
+                bundles.setdefault(keys[q], {})[keys[p]] = weight
+    
+    def shift(self, key, count, x, y):
+        cx, cy = key
+        for k, cells in enumerate(self.cells):
+            cell = (cx >> k, cy >> k)
+            entry = cells.get(cell)
+            if entry is None:
+                entry = cells[cell] = [0, 0.0, 0.0]
+            entry[0] += count
+            entry[1] += x
+            entry[2] += y
+            if not entry[0]:
+                del cells[cell]
+    
+    def add_node(self, node, x, y):
+        if not self.built:
+            return
+        key = self.cell(x, y)
+        self.keys[node] = key
+        self.positions[node] = (x, y)
+        self.shift(key, 1, x, y)
+    
+    def remove_node(self, node):
+        if node not in self.keys:
+            return
+        x, y = self.positions.pop(node)
+        self.shift(self.keys.pop(node), -1, -x, -y)
+    
+    def move_node(self, node, x, y):
+        key = self.keys.get(node)
+        if key is None:
+            return
+        ox, oy = self.positions[node]
+        self.positions[node] = (x, y)
+        new_key = self.cell(x, y)
+        if new_key == key:
+            self.shift(key, 0, x - ox, y - oy)
+            return
+        # Zellwechsel: Kanten unter dem alten Schlüssel aus- und unter dem neuen eintragen
+        lines = list(dict.fromkeys(node.lines))
+        for line in lines:
+            self.update_edge(line.source, line.target, -1)
+        self.shift(key, -1, -ox, -oy)
+        self.keys[node] = new_key
+        self.shift(new_key, 1, x, y)
+        for line in lines:
+            self.update_edge(line.source, line.target, 1)
+    
+    def update_edge(self, source, target, delta):
+        ks, kt = self.keys.get(source), self.keys.get(target)
+        if ks is None or kt is None:
+            return
+        for k, bundles in enumerate(self.bundles):
+            a = (ks[0] >> k, ks[1] >> k)
+            b = (kt[0] >> k, kt[1] >> k)
+            if a == b:
+                # Ab hier liegen beide Enden auch in allen gröberen Zellen zusammen
+                break
+            for one, other in ((a, b), (b, a)):
+                row = bundles.setdefault(one, {})
+                weight = row.get(other, 0) + delta
+                if weight:
+                    row[other] = weight
+                else:
+                    del row[other]
+                    if not row:
+                        del bundles[one]
+    
+    def add_edge(self, source, target):
+        self.update_edge(source, target, 1)
+    
+    def remove_edge(self, source, target):
+        self.update_edge(source, target, -1)
+    
+    def clusters_in(self, level, rect):
+        """(Zelle, [Anzahl, Summe x, Summe y]) aller belegten Zellen in rect."""
+        size = CLUSTER_BASE_SIZE << level
+        cells = self.cells[level]
+        for cx in range(math.floor(rect.left() / size), math.floor(rect.right() / size) + 1):
+            for cy in range(math.floor(rect.top() / size), math.floor(rect.bottom() / size) + 1):
+                entry = cells.get((cx, cy))
+                if entry is not None:
+                    yield (cx, cy), entry
+
+class AdjacencySnapshot:
+    """Unveränderliche CSR-Adjazenz (compressed sparse row) des Canvas.
+    
+    Knoten sind über ihre Position in nodes indiziert. Für Knoten i liegen
+    die Nachfolger in out_targets[out_offsets[i]:out_offsets[i + 1]], die
+    Kantenindizes dazu in out_edges; in_* analog für eingehende Kanten.
+    """
+    def __init__(self, nodes, edges, version=None):
+        nodes = list(nodes)
+        edges = list(edges)
+        index = {node: i for i, node in enumerate(nodes)}
+        m = len(edges)
+        sources = np.fromiter((index[e.source] for e in edges), np.int64, m)
+        targets = np.fromiter((index[e.target] for e in edges), np.int64, m)
+        self.build(nodes, edges, index, sources, targets, version)
+    
+    @classmethod
+    def from_arrays(cls, nodes, edges, sources, targets, version=None):
+        """Snapshot direkt aus Index-Arrays (z.B. aus dem GraphModel)."""
+        snapshot = cls.__new__(cls)
+        snapshot.build(list(nodes), list(edges), None, np.asarray(sources, np.int64),
+                       np.asarray(targets, np.int64), version)
+        return snapshot
+    
+    def build(self, nodes, edges, index, sources, targets, version):
+        self.version = version
+        self.nodes = nodes
+        self.edges = edges
+        self.index = index if index is not None else {node: i for i, node in enumerate(nodes)}
+        self.sources = sources
+        self.targets = targets
+        n = len(nodes)
+        self.out_offsets, self.out_targets, self.out_edges = self.compress(sources, targets, n)
+        self.in_offsets, self.in_sources, self.in_edges = self.compress(targets, sources, n)
+    
+    @staticmethod
+    def compress(keys, values, n):
+        order = np.argsort(keys, kind="stable")
+        offsets = np.zeros(n + 1, np.int64)
+        np.cumsum(np.bincount(keys, minlength=n), out=offsets[1:])
+        return offsets, values[order], order
+    
+    def __len__(self):
+        return len(self.nodes)
+    
+    def out_degree(self):
+        return np.diff(self.out_offsets)
+    
+    def in_degree(self):
+        return np.diff(self.in_offsets)
+    
+    def successors(self, i):
+        return self.out_targets[self.out_offsets[i]:self.out_offsets[i + 1]]
+    
+    def predecessors(self, i):
+        return self.in_sources[self.in_offsets[i]:self.in_offsets[i + 1]]
+    
+    def expand(self, frontier, reverse=False):
+        """Alle Nachbarn (und Kantenindizes) einer Knotenmenge, vektorisiert."""
+        if reverse:
+            offsets, values, edge_ids = self.in_offsets, self.in_sources, self.in_edges
+        else:
+            offsets, values, edge_ids = self.out_offsets, self.out_targets, self.out_edges
+        starts = offsets[frontier]
+        counts = offsets[frontier + 1] - starts
+        # Positionen aller Abschnitte offsets[i]:offsets[i + 1] hintereinander
+        shift = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        positions = shift + np.arange(len(shift))
+        return values[positions], edge_ids[positions]
+    
+    def reachable(self, seeds, direction="out", max_depth=None):
+        """Maske der von seeds erreichbaren Knoten (Richtung out, in oder both)."""
+        mask = np.zeros(len(self.nodes), bool)
+        frontier = np.unique(np.asarray(seeds, np.int64))
+        mask[frontier] = True
+        depth = 0
+        while len(frontier) and (max_depth is None or depth < max_depth):
+            if direction == "both":
+                found = np.concatenate((self.expand(frontier)[0], self.expand(frontier, True)[0]))
+            else:
+                found = self.expand(frontier, direction == "in")[0]
+            frontier = np.unique(found[~mask[found]])
+            mask[frontier] = True
+            depth += 1
+        return mask
+    
+    def shortest_path(self, source, target):
+        """Kürzester gerichteter Weg als Liste von Kantenindizes; None ohne Weg.
+        
+        Bidirektionale BFS: vorwärts ab source, rückwärts ab target, jeweils
+        die kleinere Front wird um eine ganze Ebene erweitert.
+        """
+        if source == target:
+            return []
+        n = len(self.nodes)
+        # parents[seite][i]: Kante, über die i erreicht wurde; -1 Start, -2 unbesucht
+        parents = (np.full(n, -2, np.int64), np.full(n, -2, np.int64))
+        dist = (np.full(n, -1, np.int64), np.full(n, -1, np.int64))
+        frontiers = [np.array([source]), np.array([target])]
+        for side, start in enumerate((source, target)):
+            parents[side][start] = -1
+            dist[side][start] = 0
+        levels = [0, 0]
+        while len(frontiers[0]) and len(frontiers[1]):
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            found, edge_ids = self.expand(frontiers[side], reverse=side == 1)
+            new = parents[side][found] == -2
+            found, first = np.unique(found[new], return_index=True)
+            parents[side][found] = edge_ids[new][first]
+            levels[side] += 1
+            dist[side][found] = levels[side]
+            meet = found[parents[1 - side][found] != -2]
+            if len(meet):
+                # Alle Treffer liegen auf dieser Seite gleich weit entfernt
+                middle = meet[np.argmin(dist[1 - side][meet])]
+                return self.trace_path(parents, middle)
+            frontiers[side] = found
+        return None
+    
+    def trace_path(self, parents, middle):
+        path = []
+        node = middle
+        while parents[0][node] >= 0:
+            path.append(int(parents[0][node]))
+            node = self.sources[parents[0][node]]
+        path.reverse()
+        node = middle
+        while parents[1][node] >= 0:
+            path.append(int(parents[1][node]))
+            node = self.targets[parents[1][node]]
+        return path
+    
+    def induced_edges(self, mask):
+        """Indizes der Kanten, deren beide Endknoten in mask liegen."""
+        return np.flatnonzero(mask[self.sources] & mask[self.targets])
+    
+    def is_connected(self):
+        """Schwacher Zusammenhang (Richtung der Kanten wird ignoriert)."""
+        return len(self.nodes) == 0 or bool(self.reachable([0], "both").all())
+    
+    def weak_components(self):
+        """Schwache Zusammenhangskomponenten; liefert (Anzahl, Label je Knoten).
+        
+        Vektorisiertes Hooking mit Pointer-Jumping: jede Wurzel wird an die
+        kleinste benachbarte Wurzel gehängt, dann werden die Bäume zu Sternen
+        verkürzt, bis keine Kante mehr zwei Komponenten verbindet.
+        """
+        labels = np.arange(len(self.nodes))
+        while True:
+            low = np.minimum(labels[self.sources], labels[self.targets])
+            hooked = labels.copy()
+            np.minimum.at(hooked, labels[self.sources], low)
+            np.minimum.at(hooked, labels[self.targets], low)
+            while True:
+                jumped = hooked[hooked]
+                if np.array_equal(jumped, hooked):
+                    break
+                hooked = jumped
+            if np.array_equal(hooked, labels):
+                break
+            labels = hooked
+        roots, labels = np.unique(labels, return_inverse=True)
+        return len(roots), labels
+    
+    def strong_components(self):
+        """Starke Zusammenhangskomponenten (iterativer Tarjan); (Anzahl, Label je Knoten)."""
+        n = len(self.nodes)
+        offsets = self.out_offsets.tolist()
+        targets = self.out_targets.tolist()
+        index = [-1] * n
+        low = [0] * n
+        on_stack = [False] * n
+        labels = [0] * n
+        stack = []
+        counter = count = 0
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [[root, offsets[root]]]
+            while work:
+                frame = work[-1]
+                v, pos = frame
+                if pos < offsets[v + 1]:
+                    frame[1] = pos + 1
+                    w = targets[pos]
+                    if index[w] == -1:
+                        index[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = True
+                        work.append([w, offsets[w]])
+                    elif on_stack[w] and index[w] < low[v]:
+                        low[v] = index[w]
+                    continue
+                work.pop()
+                if work and low[v] < low[work[-1][0]]:
+                    low[work[-1][0]] = low[v]
+                if low[v] == index[v]:
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        labels[w] = count
+                        if w == v:
+                            break
+                    count += 1
+        return count, np.array(labels, np.int64)
+
+class GraphStats:
+    """Kennzahlen des Netzwerks, bei jedem Einfügen/Löschen fortgeschrieben.
+    
+    Grade und Gradverteilungen werden pro Änderung in O(1) angepasst;
+    Komponenten berechnet StatisticsPanel getrennt auf der CSR-Adjazenz.
+    """
+    def __init__(self):
+        self.version = 0
+        self.clear()
+    
+    def clear(self):
+        self.in_degree = {}
+        self.out_degree = {}
+        self.in_histogram = Counter()
+        self.out_histogram = Counter()
+        self.edge_count = 0
+        self.self_loops = 0
+        self.sources = 0   # nur ausgehende Kanten
+        self.sinks = 0     # nur eingehende Kanten
+        self.isolated = 0
+        self.version += 1
+    
+    @property
+    def node_count(self):
+        return len(self.in_degree)
+    
+    def count_kind(self, node, sign):
+        i, o = self.in_degree[node], self.out_degree[node]
+        self.sources += sign * (i == 0 and o > 0)
+        self.sinks += sign * (o == 0 and i > 0)
+        self.isolated += sign * (i == 0 and o == 0)
+    
+    @staticmethod
+    def shift(degrees, histogram, node, delta):
+        old = degrees[node]
+        histogram[old] -= 1
+        if not histogram[old]:
+            del histogram[old]
+        degrees[node] = old + delta
+        histogram[old + delta] += 1
+    
+    def add_node(self, node):
+        self.in_degree[node] = self.out_degree[node] = 0
+        self.in_histogram[0] += 1
+        self.out_histogram[0] += 1
+        self.isolated += 1
+        self.version += 1
+    
+    def remove_node(self, node):
+        if node not in self.in_degree:
+            return
+        self.count_kind(node, -1)
+        for degrees, histogram in ((self.in_degree, self.in_histogram), (self.out_degree, self.out_histogram)):
+            degree = degrees.pop(node)
+            histogram[degree] -= 1
+            if not histogram[degree]:
+                del histogram[degree]
+        self.version += 1
+    
+    def update_edge(self, source, target, delta):
+        if source not in self.out_degree or target not in self.in_degree:
+            return
+        ends = {source, target}
+        for node in ends:
+            self.count_kind(node, -1)
+        self.shift(self.out_degree, self.out_histogram, source, delta)
+        self.shift(self.in_degree, self.in_histogram, target, delta)
+        for node in ends:
+            self.count_kind(node, 1)
+        self.edge_count += delta
+        # Modellindizes sind ints, is wäre nur für kleine Werte verlässlich
+        self.self_loops += delta * (source == target)
+        self.version += 1
+    
+    def add_edge(self, source, target):
+        self.update_edge(source, target, 1)
+    
+    def remove_edge(self, source, target):
+        self.update_edge(source, target, -1)
+
+    def remove_many(self, nodes, pairs):
+        """Löscht Kanten (Paare aus Quelle, Ziel) und danach Knoten als Stapel.
+
+        Statt je Kante zwei Knoten umzubuchen, werden die Gradänderungen erst
+        gesammelt: Jeder betroffene Knoten verlässt Histogramme und Arten
+        einmal mit seinem alten Grad, verbleibende kommen mit dem neuen zurück.
+        """
+        in_degree, out_degree = self.in_degree, self.out_degree
+        if not in_degree.keys() >= set(itertools.chain.from_iterable(pairs)):
+            pairs = [(s, t) for s, t in pairs if s in out_degree and t in in_degree]
+        dropped = in_degree.keys() & nodes
+        sources, targets = zip(*pairs) if pairs else ((), ())
+        out_delta = Counter(sources)
+        in_delta = Counter(targets)
+        affected = out_delta.keys() | in_delta.keys() | dropped
+        kept = affected - dropped
+        self.count_kinds(affected, -1)
+        for degrees, histogram, delta in ((in_degree, self.in_histogram, in_delta),
+                                          (out_degree, self.out_histogram, out_delta)):
+            histogram.subtract(Counter(map(degrees.__getitem__, affected)))
+            for node in dropped:
+                del degrees[node]
+            for node in delta.keys() - dropped:
+                degrees[node] -= delta[node]
+            histogram.update(map(degrees.__getitem__, kept))
+            for degree in [degree for degree, count in histogram.items() if not count]:
+                del histogram[degree]
+        self.count_kinds(kept, 1)
+        self.edge_count -= len(pairs)
+        self.self_loops -= sum(map(operator.eq, sources, targets))
+        self.version += 1
+
+    def count_kinds(self, nodes, sign):
+        """Wie count_kind für viele Knoten."""
+        in_degree, out_degree = self.in_degree, self.out_degree
+        sources = sinks = isolated = 0
+        for node in nodes:
+            i, o = in_degree[node], out_degree[node]
+            if not i:
+                if o:
+                    sources += 1
+                else:
+                    isolated += 1
+            elif not o:
+                sinks += 1
+        self.sources += sign * sources
+        self.sinks += sign * sinks
+        self.isolated += sign * isolated
+
+    def load(self, keys, sources, targets):
+        """Setzt alle Kennzahlen auf einmal; sources/targets indizieren keys."""
+        self.clear()
+        n = len(keys)
+        in_degree = np.bincount(targets, minlength=n)
+        out_degree = np.bincount(sources, minlength=n)
+        self.in_degree = dict(zip(keys, in_degree.tolist()))
+        self.out_degree = dict(zip(keys, out_degree.tolist()))
+        for histogram, degrees in ((self.in_histogram, in_degree), (self.out_histogram, out_degree)):
+            values, counts = np.unique(degrees, return_counts=True)
+            histogram.update(dict(zip(values.tolist(), counts.tolist())))
+        self.edge_count = len(sources)
+        self.self_loops = int(np.count_nonzero(sources == targets))
+        self.sources = int(np.count_nonzero((in_degree == 0) & (out_degree > 0)))
+        self.sinks = int(np.count_nonzero((out_degree == 0) & (in_degree > 0)))
+        self.isolated = int(np.count_nonzero((in_degree == 0) & (out_degree == 0)))
+
+# Virtualisierter Modus: sichtbarer Rand (Pixel), Obergrenze materialisierter
+# Knoten und Knotenzahl, ab der ein Import automatisch virtualisiert wird
+VIRTUAL_MARGIN_PX = 200
+VIRTUAL_ITEM_LIMIT = 5000
+VIRTUAL_IMPORT_THRESHOLD = 50000
+VIRTUAL_OVERVIEW_COLOR = 0xFF2C3E50
+
+# Gitterindex des Modells: die Zellgröße folgt der Ausdehnung, so dass im
+# Mittel GRID_CELL_NODES Knoten je Zelle liegen; ab GRID_OVERFLOW_MIN bzw.
+# einem Achtel der Knoten nachträglich geänderter Elemente wird neu aufgebaut
+GRID_CELL_NODES = 16
+GRID_OVERFLOW_MIN = 4096
+
+class ModelGrid:
+    """Gitterindex über Knoten und Kanten eines GraphModel für Rechteckabfragen.
+    
+    Knoten stehen in der Zelle ihrer Position. Kanten stehen auf der Ebene
+    L, deren Zellen (2**L Grundzellen breit) ihr Rechteck mit höchstens
+    2 x 2 Zellen überdecken; eine Abfrage sucht je Ebene nur die
+    überlappenden Zellen ab, lange Kanten kosten also nicht jede Abfrage.
+    Zellen sind als sortierte Schlüssel mit Offsets abgelegt (wie die
+    CSR-Adjazenz). Nach dem Aufbau verschobene oder hinzugekommene Elemente
+    werden als Überlauf direkt geprüft, gelöschte filtert die Abfrage über
+    die alive-Masken.
+    
+    Der Konstruktor kopiert nur die Arrays; build() darf danach in einem
+    Worker-Thread laufen und setzt zuletzt ready.
+    """
+    def __init__(self, model):
+        self.model = model
+        n, m = self.n, self.m = model.n, model.m
+        self.moved = set()
+        self.ready = False
+        self.xs, self.ys = model.xs[:n].copy(), model.ys[:n].copy()
+        self.sources, self.targets = model.sources[:m].copy(), model.targets[:m].copy()
+    
+    def build(self):
+        n, m = self.n, self.m
+        xs, ys, sources, targets = self.xs, self.ys, self.sources, self.targets
+        side = max(np.ptp(xs), np.ptp(ys)) if n else 0.0
+        self.cell = max(1.0, side / max(1.0, math.sqrt(n / GRID_CELL_NODES)))
+        self.node_cells = self.compress(self.key(*self.cells(xs, ys)), np.arange(n))
+        
+        x0, y0 = self.cells(np.minimum(xs[sources], xs[targets]), np.minimum(ys[sources], ys[targets]))
+        x1, y1 = self.cells(np.maximum(xs[sources], xs[targets]), np.maximum(ys[sources], ys[targets]))
+        # Ebene = Bitlänge der Spannweite in Grundzellen
+        levels = np.frexp(np.maximum(x1 - x0, y1 - y0).astype(float))[1]
+        self.edge_cells = {}
+        for level in np.unique(levels).tolist():
+            edges = np.flatnonzero(levels == level)
+            bx0, by0, bx1, by1 = x0[edges] >> level, y0[edges] >> level, x1[edges] >> level, y1[edges] >> level
+            wide, tall = bx1 != bx0, by1 != by0
+            keys = np.concatenate([self.key(bx0, by0), self.key(bx1, by0)[wide],
+                                   self.key(bx0, by1)[tall], self.key(bx1, by1)[wide & tall]])
+            items = np.concatenate([edges, edges[wide], edges[tall], edges[wide & tall]])
+            self.edge_cells[level] = self.compress(keys, items)
+        
+        # Kanten je Knoten, um die Kanten verschobener Knoten zu finden
+        ends = np.concatenate([sources, targets])
+        order = np.argsort(ends, kind="stable")
+        self.incident_offsets = np.zeros(n + 1, np.int64)
+        np.cumsum(np.bincount(ends, minlength=n), out=self.incident_offsets[1:])
+        self.incident = np.concatenate([np.arange(m), np.arange(m)])[order]
+        self.xs = self.ys = self.sources = self.targets = None
+        self.ready = True
+        return self
+    
+    def cells(self, xs, ys):
+        return np.floor(xs / self.cell).astype(np.int64), np.floor(ys / self.cell).astype(np.int64)
+    
+    @staticmethod
+    def key(cx, cy):
+        return (cx << 32) + (cy + (1 << 31))
+    
+    @staticmethod
+    def compress(keys, items):
+        """(sortierte Schlüssel, Offsets, Elemente) je Zelle."""
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        unique, starts = np.unique(keys, return_index=True)
+        return unique, np.append(starts, len(keys)), items[order]
+    
+    @staticmethod
+    def gather(offsets, items, slots):
+        """Alle Elemente der Abschnitte offsets[i]:offsets[i + 1] für i in slots."""
+        starts = offsets[slots]
+        counts = offsets[slots + 1] - starts
+        shift = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        return items[shift + np.arange(len(shift))]
+    
+    def lookup(self, table, rect, level=0):
+        keys, offsets, items = table
+        cx0, cx1 = math.floor(rect.left() / self.cell) >> level, math.floor(rect.right() / self.cell) >> level
+        cy0, cy1 = math.floor(rect.top() / self.cell) >> level, math.floor(rect.bottom() / self.cell) >> level
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(keys):
+            # Großes Rechteck: vorhandene Zellen filtern statt alle aufzählen
+            kx, ky = keys >> 32, (keys & 0xFFFFFFFF) - (1 << 31)
+            slots = np.flatnonzero((kx >= cx0) & (kx <= cx1) & (ky >= cy0) & (ky <= cy1))
+        else:
+            wanted = np.add.outer(np.arange(cx0, cx1 + 1) << 32, np.arange(cy0, cy1 + 1) + (1 << 31)).ravel()
+            slots = np.minimum(np.searchsorted(keys, wanted), len(keys) - 1)
+            slots = slots[keys[slots] == wanted]
+        return self.gather(offsets, items, slots)
+    
+    def overflow(self):
+        return len(self.moved) + (self.model.n - self.n) + (self.model.m - self.m)
+    
+    @staticmethod
+    def distinct(candidates, size):
+        """Sortierte Indizes ohne Doppelte; große Mengen über eine Maske statt np.unique."""
+        if len(candidates) * 32 < size:
+            candidates = np.sort(candidates)
+            return candidates[np.append(candidates[:1] >= 0, candidates[1:] != candidates[:-1])]
+        mask = np.zeros(size, bool)
+        mask[candidates] = True
+        return np.flatnonzero(mask)
+    
+    @staticmethod
+    def sample(candidates, limit):
+        """Höchstens etwa limit Kandidaten als gleichmäßige Stichprobe."""
+        if limit is None or len(candidates) <= limit:
+            return candidates
+        return candidates[::math.ceil(len(candidates) / limit)]
+    
+    def nodes_in(self, rect, limit=None):
+        """Knoten in rect; mit limit nur aus einer Stichprobe von höchstens
+        so vielen Kandidaten (für Übersichten mit festem Zeitbudget)."""
+        model = self.model
+        moved = np.fromiter(self.moved, np.int64, len(self.moved))
+        candidates = self.distinct(self.sample(np.concatenate([self.lookup(self.node_cells, rect), moved,
+                                                               np.arange(self.n, model.n)]), limit), model.n)
+        xs, ys = model.xs[candidates], model.ys[candidates]
+        return candidates[model.node_alive[candidates] & (xs >= rect.left()) & (xs <= rect.right())
+                          & (ys >= rect.top()) & (ys <= rect.bottom())]
+    
+    def edges_in(self, rect, max_span=None, limit=None, stop_after=None):
+        """Kanten, deren Rechteck rect schneidet (wie GraphModel.edges_in).
+        
+        Mit max_span entfallen die Ebenen, deren Zellen breiter als max_span
+        sind, also die langen Kanten (Überlauf wird immer geprüft); limit
+        wie bei nodes_in, je Ebene. Mit stop_after endet die Abfrage, sobald
+        mehr als so viele Kanten getroffen sind; das Ergebnis ist dann
+        unvollständig, reicht aber für "zu viele sichtbar".
+        """
+        found, count = [], 0
+        for candidates in self.edge_candidates(rect, max_span, limit, stop_after):
+            found.append(self.hits(candidates, rect))
+            count += len(found[-1])
+            if stop_after is not None and count > stop_after:
+                break
+        return self.distinct(np.concatenate(found), self.model.m)
+    
+    def edge_candidates(self, rect, max_span, limit, stop_after):
+        """Kandidaten ohne Doppelte je Ebene, grobe Ebenen zuerst (dort liegen
+        die Treffer langer Kanten); mit stop_after in Stücken."""
+        model = self.model
+        moved = np.fromiter(self.moved, np.int64, len(self.moved))
+        yield self.distinct(np.concatenate([np.arange(self.m, model.m),
+                                            self.gather(self.incident_offsets, self.incident, moved)]), model.m)
+        for level in sorted(self.edge_cells, reverse=True):
+            if max_span is None or (1 << level) * self.cell <= max_span:
+                candidates = self.distinct(self.sample(self.lookup(self.edge_cells[level], rect, level), limit),
+                                           model.m)
+                step = max(1, len(candidates) if stop_after is None else 4 * stop_after)
+                for start in range(0, len(candidates), step):
+                    yield candidates[start:start + step]
+    
+    def hits(self, candidates, rect):
+        model = self.model
+        s, t = model.sources[candidates], model.targets[candidates]
+        sx, sy, tx, ty = model.xs[s], model.ys[s], model.xs[t], model.ys[t]
+        return candidates[model.edge_alive[candidates]
+                          & (np.maximum(sx, tx) >= rect.left()) & (np.minimum(sx, tx) <= rect.right())
+                          & (np.maximum(sy, ty) >= rect.top()) & (np.minimum(sy, ty) <= rect.bottom())]
+
+class GraphModel:
+    """Datenmodell des virtualisierten Modus: Knoten und Kanten als NumPy-Arrays.
+    
+    Knoten und Kanten werden über ihren Index adressiert; gelöschte Einträge
+    bleiben als tot markiert stehen, damit Indizes stabil sind.
+    """
+    def __init__(self, capacity=1024):
+        self.n = 0
+        self.m = 0
+        self.xs = np.zeros(capacity)
+        self.ys = np.zeros(capacity)
+        self.node_alive = np.zeros(capacity, bool)
+        self.labels = []
+        self.node_ids = []
+        self.sources = np.zeros(capacity, np.int64)
+        self.targets = np.zeros(capacity, np.int64)
+        self.counts = np.ones(capacity, np.int64)  # Vielfachheit zusammengefasster Kanten
+        self.edge_alive = np.zeros(capacity, bool)
+        self.grid_index = None    # ModelGrid, erst bei Bedarf
+        self.grid_pending = None  # ModelGrid im Aufbau
+    
+    @classmethod
+    def from_graph(cls, graph, first_id=0):
+        """Übernimmt einen Import (GraphData) mit fortlaufenden IDs ab first_id."""
+        model = cls(max(len(graph), len(graph.sources), 1))
+        n, m = len(graph), len(graph.sources)
+        model.n, model.m = n, m
+        model.xs[:n] = graph.xs
+        model.ys[:n] = graph.ys
+        model.node_alive[:n] = True
+        model.labels = list(graph.labels)
+        model.node_ids = list(range(first_id, first_id + n))
+        model.sources[:m] = graph.sources
+        model.targets[:m] = graph.targets
+        if graph.counts is not None:
+            model.counts[:m] = graph.counts
+        model.edge_alive[:m] = True
+        return model
+    
+    @classmethod
+    def from_records(cls, nodes, edges, counts=None):
+        """Übernimmt (id, label, x, y)- und (quelle, ziel)-Datensätze."""
+        model = cls()
+        index = {}
+        for node_id, label, x, y in nodes:
+            index[node_id] = model.add_node(x, y, node_id, label)
+        for (source, target), count in zip(edges, counts or itertools.repeat(1)):
+            model.add_edge(index[source], index[target], count)
+        return model
+    
+    @staticmethod
+    def grown(array, size):
+        if size <= len(array):
+            return array
+        bigger = np.zeros(max(size, 2 * len(array)), array.dtype)
+        bigger[:len(array)] = array
+        return bigger
+    
+    def add_node(self, x, y, node_id, label=None):
+        i = self.n
+        self.xs = self.grown(self.xs, i + 1)
+        self.ys = self.grown(self.ys, i + 1)
+        self.node_alive = self.grown(self.node_alive, i + 1)
+        self.xs[i], self.ys[i] = x, y
+        self.node_alive[i] = True
+        self.labels.append(label if label is not None else str(node_id))
+        self.node_ids.append(node_id)
+        self.n += 1
+        return i
+    
+    def add_edge(self, source, target, count=1):
+        e = self.m
+        self.sources = self.grown(self.sources, e + 1)
+        self.targets = self.grown(self.targets, e + 1)
+        self.counts = self.grown(self.counts, e + 1)
+        self.edge_alive = self.grown(self.edge_alive, e + 1)
+        self.sources[e], self.targets[e] = source, target
+        self.counts[e] = count
+        self.edge_alive[e] = True
+        self.m += 1
+        return e
+    
+    def move_node(self, i, x, y):
+        self.xs[i], self.ys[i] = x, y
+        for grid in (self.grid_index, self.grid_pending):
+            if grid is not None and i < grid.n:
+                grid.moved.add(i)
+    
+    def move_nodes(self, indices, xs, ys):
+        """Setzt viele Positionen; der Gitterindex wird danach neu aufgebaut."""
+        self.xs[indices] = xs
+        self.ys[indices] = ys
+        self.grid_index = self.grid_pending = None
+    
+    def grid(self, executor=None):
+        """Gitterindex für Rechteckabfragen; neu aufgebaut, wenn er fehlt oder zu viel Überlauf hat.
+        
+        Ohne executor wird sofort gebaut. Mit executor läuft der Aufbau dort,
+        bis dahin liefert grid() den bisherigen Index oder None.
+        """
+        pending = self.grid_pending
+        if pending is not None and pending.ready:
+            self.grid_index, self.grid_pending = pending, None
+        grid = self.grid_index
+        if grid is None or grid.overflow() > max(GRID_OVERFLOW_MIN, self.n // 8):
+            if executor is None:
+                grid = self.grid_index = ModelGrid(self).build()
+                self.grid_pending = None
+            elif self.grid_pending is None:
+                self.grid_pending = ModelGrid(self)
+                executor.submit(self.grid_pending.build)
+        return grid
+    
+    def remove(self, nodes=(), edges=()):
+        """Markiert Knoten samt anliegender Kanten und Kanten als gelöscht;
+        liefert die Indizes aller dabei entfernten Kanten."""
+        nodes = np.asarray(list(nodes), np.int64)
+        self.node_alive[nodes] = False
+        dead = np.zeros(self.m, bool)
+        dead[np.asarray(list(edges), np.int64)] = True
+        if len(nodes):
+            dead |= np.isin(self.sources[:self.m], nodes) | np.isin(self.targets[:self.m], nodes)
+        removed = np.flatnonzero(dead & self.edge_alive[:self.m])
+        self.edge_alive[removed] = False
+        return removed
+    
+    @property
+    def node_count(self):
+        return int(np.count_nonzero(self.node_alive[:self.n]))
+    
+    @property
+    def edge_count(self):
+        return int(np.count_nonzero(self.edge_alive[:self.m]))
+    
+    def live_nodes(self):
+        return np.flatnonzero(self.node_alive[:self.n])
+    
+    def live_edges(self):
+        return np.flatnonzero(self.edge_alive[:self.m])
+    
+    def nodes_in(self, rect):
+        xs, ys = self.xs[:self.n], self.ys[:self.n]
+        return np.flatnonzero(self.node_alive[:self.n] & (xs >= rect.left()) & (xs <= rect.right())
+                              & (ys >= rect.top()) & (ys <= rect.bottom()))
+    
+    def edges_in(self, rect):
+        """Kanten, deren Rechteck rect schneidet."""
+        sx, sy = self.xs[self.sources[:self.m]], self.ys[self.sources[:self.m]]
+        tx, ty = self.xs[self.targets[:self.m]], self.ys[self.targets[:self.m]]
+        return np.flatnonzero(self.edge_alive[:self.m]
+                              & (np.maximum(sx, tx) >= rect.left()) & (np.minimum(sx, tx) <= rect.right())
+                              & (np.maximum(sy, ty) >= rect.top()) & (np.minimum(sy, ty) <= rect.bottom()))
+    
+    def extent(self):
+        """(min_x, min_y, max_x, max_y) der lebenden Knoten oder None."""
+        live = self.live_nodes()
+        if not len(live):
+            return None
+        xs, ys = self.xs[live], self.ys[live]
+        return float(xs.min()), float(ys.min()), float(xs.max()), float(ys.max())
+    
+    def bounds(self):
+        extent = self.extent()
+        if extent is None:
+            return QRectF()
+        return QRectF(QPointF(*extent[:2]), QPointF(*extent[2:]))
+    
+    def node_records(self):
+        for i in self.live_nodes().tolist():
+            yield self.node_ids[i], self.labels[i], float(self.xs[i]), float(self.ys[i])
+    
+    def edge_records(self):
+        """Zusammengefasste Kanten erscheinen so oft, wie sie eingefügt wurden."""
+        ids = self.node_ids
+        live = self.live_edges()
+        for e, count in zip(live.tolist(), self.counts[live].tolist()):
+            record = ids[self.sources[e]], ids[self.targets[e]]
+            for _ in range(count):
+                yield record
+    
+    def compact(self):
+        """Lebende Knoten, Kanten und deren Endpunkte in kompakter Nummerierung."""
+        live = self.live_nodes()
+        edges = self.live_edges()
+        position = np.full(self.n, -1, np.int64)
+        position[live] = np.arange(len(live))
+        return live, edges, position[self.sources[edges]], position[self.targets[edges]]
 
 class NetworkCanvas(QGraphicsView):
+    # Meldung für die Statusleiste (Text, Erfolg)
+    status_message = pyqtSignal(str, bool)
+    # Einmalig, sobald der erste Frame fertig gezeichnet ist
+    first_painted = pyqtSignal()
+    
     def __init__(self):
         super().__init__()
         self.scene = QGraphicsScene(-5000, -5000, 10000, 10000)
@@ -124,46 +1800,136 @@ class NetworkCanvas(QGraphicsView):
         self.setRenderHint(QPainter.RenderHint.Antialiasing)
         self.nodes = []
         self.edges = []
+        self.buckets = {}
+        self.label_index = LabelIndex()
+        self.edge_index = EdgeIndex()
+        self.edge_policy = "allow"
+        self.next_node_id = 0
         self.connection_source = None
         
+        # Jede Änderung der Topologie erhöht den Zähler und macht die
+        # zwischengespeicherte CSR-Adjazenz ungültig
+        self.mutation_count = 0
+        self.adjacency_cache = None
+        self.stats = GraphStats()
+        
+        # Virtualisierter Modus: nur Elemente im sichtbaren Bereich sind Items,
+        # der Rest lebt im GraphModel; freie Items warten im Pool
+        self.model = None
+        self.virtual_nodes = {}   # Modellindex -> Node
+        self.virtual_edges = {}   # Kantenindex -> DirectedEdge
+        self.node_pool = []
+        self.edge_pool = []
+        self.virtual_overview = False
+        self.grid_builder = None  # Worker-Thread für den Gitterindex, erst bei Bedarf
+        self.virtual_timer = QTimer(self)
+        self.virtual_timer.setSingleShot(True)
+        self.virtual_timer.setInterval(0)
+        self.virtual_timer.timeout.connect(self.update_virtual_items)
+        self.horizontalScrollBar().valueChanged.connect(self.schedule_virtual_update)
+        self.verticalScrollBar().valueChanged.connect(self.schedule_virtual_update)
+        
+        # Auswahl-Stile werden nach einer Auswahländerung gesammelt gesetzt
+        # statt pro Item in itemChange
+        self.styled_selection = set()
+        self.selection_order = {}  # ausgewählte Knoten in Auswahlreihenfolge
+        self.path_mode = False
+        self.selection_timer = QTimer(self)
+        self.selection_timer.setSingleShot(True)
+        self.selection_timer.setInterval(0)
+        self.selection_timer.timeout.connect(self.apply_selection_styles)
+        self.scene.selectionChanged.connect(self.selection_timer.start)
+        self.setRubberBandSelectionMode(Qt.ItemSelectionMode.ContainsItemBoundingRect)
+        
+        # Statischer Hintergrund: ruhende Items aus gecachten Kacheln
+        self.background = BackgroundLayer(self)
+        
+        # Semantischer Zoom: unterhalb der Schwelle Cluster statt Items
+        self.clusters = ClusterIndex()
+        self.semantic_zoom = False
+        self.cluster_level = None
+        
+        # Begrenzung aller bzw. der ausgewählten Knoten für "Alles anzeigen",
+        # "Auswahl anzeigen" und den SVG-Export (nur im Item-Modus)
+        self.selection_bounds = BoundsIndex()
+        self.bounds = BoundsIndex(self.selection_bounds)
+        
+        # Pixmap-Cache der Knoten (standardmäßig aus); Invalidierung nur bei
+        # echten Stilwechseln. Kanten werden nie gecacht: lange Diagonalen
+        # bekämen szenengroße Pixmaps und verdrängen sich im QPixmapCache
+        self.item_cache_mode = QGraphicsItem.CacheMode.NoCache
+        QPixmapCache.setCacheLimit(ITEM_CACHE_BUDGET_KB)
+        
         self.zoom_factor = 1.0
         self.zoom_step = 1.15
         self.min_zoom = 0.1
         self.max_zoom = 10.0
+        
+        # Statistik-Overlay (HUD)
+        self.show_hud = False
+        self.hud_rect = QRect(8, 8, 200, 84)
+        self.frame_times = deque(maxlen=120)
+        self.last_paint_ms = 0.0
+        self.items_painted = 0
+        self.hud_only_paint = False
+        self.painted = False
+        self.hud_timer = QTimer(self)
+        self.hud_timer.setInterval(500)
+        self.hud_timer.timeout.connect(lambda: self.viewport().update(self.hud_rect))
 
     def mousePressEvent(self, event):
+        if self.cluster_level is not None:
+            # In der Cluster-Ansicht sind die Items nicht sichtbar: Klick zoomt hinein
+            if event.button() == Qt.MouseButton.LeftButton:
+                self.zoom_into(self.mapToScene(event.pos()))
+            return
         item = self.itemAt(event.pos())
         if isinstance(item, QGraphicsTextItem) and isinstance(item.parentItem(), Node):
             item = item.parentItem()
+        elif isinstance(item, LiveBucket):
+            item = None
             
         if event.button() == Qt.MouseButton.LeftButton:
-            if not item:
+            if not item and event.modifiers() & Qt.KeyboardModifier.ShiftModifier:
+                # Shift+Ziehen auf freier Fläche: Rechteckauswahl (mit Strg ergänzend)
+                self.setDragMode(QGraphicsView.DragMode.RubberBandDrag)
+                super().mousePressEvent(event)
+            elif not item:
                 pos = self.mapToScene(event.pos())
-                self.add_new_node(pos.x(), pos.y(), len(self.nodes))
+                self.add_new_node(pos.x(), pos.y(), self.allocate_node_id())
             else:
                 super().mousePressEvent(event)
         elif event.button() == Qt.MouseButton.RightButton:
             if isinstance(item, Node):
                 if not self.connection_source:
                     self.connection_source = item
-                    item.setBrush(QBrush(QColor("#e74c3c")))
+                    item.setBrush(NODE_CONNECTING_BRUSH)
                 else:
                     if item != self.connection_source:
-                        self.add_new_edge(self.connection_source, item)
+                        if self.add_new_edge(self.connection_source, item) is None:
+                            self.status_message.emit("Kante existiert bereits", False)
                     self.connection_source.update_selection_style()
                     self.connection_source = None
+                self.update_live_items()
             else:
                 # BUGFIX: Rechtsklick außerhalb eines Knotens bricht Verbindung ab
                 if self.connection_source:
                     self.connection_source.update_selection_style()
                     self.connection_source = None
+                    self.update_live_items()
         elif event.button() == Qt.MouseButton.MiddleButton:
             if isinstance(item, Node):
                 self.edit_node_label(item)
 
+    def mouseReleaseEvent(self, event):
+        super().mouseReleaseEvent(event)
+        if self.dragMode() == QGraphicsView.DragMode.RubberBandDrag:
+            self.setDragMode(QGraphicsView.DragMode.NoDrag)
+
     def edit_node_label(self, node):
-        label = node.label
         node.set_editing_mode(True)
+        self.update_live_items()
+        label = node.label_editor or node.open_label_editor()
         
         label.setTextInteractionFlags(Qt.TextInteractionFlag.TextEditorInteraction)
         label.setFocus()
@@ -174,12 +1940,16 @@ class NetworkCanvas(QGraphicsView):
         label.focusOutEvent = lambda event: self.finish_label_edit(node, event)
     
     def finish_label_edit(self, node, event):
-        QGraphicsTextItem.focusOutEvent(node.label, event)
+        label = node.label_editor
+        if label is None:
+            return
+        QGraphicsTextItem.focusOutEvent(label, event)
         
-        node.label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
-        node.label_text = node.label.toPlainText()
-        node.update_label_position()
+        text = label.toPlainText()
+        node.close_label_editor()
+        node.set_label(text)
         node.set_editing_mode(False)
+        self.update_live_items()
     
     def keyPressEvent(self, event):
         if event.key() == Qt.Key.Key_F2:
@@ -198,6 +1968,7 @@ class NetworkCanvas(QGraphicsView):
             if self.connection_source:
                 self.connection_source.update_selection_style()
                 self.connection_source = None
+                self.update_live_items()
         else:
             super().keyPressEvent(event)
     
@@ -218,69 +1989,2334 @@ class NetworkCanvas(QGraphicsView):
         new_pos = self.mapToScene(event.position().toPoint())
         delta = new_pos - old_pos
         self.translate(delta.x(), delta.y())
+        self.update_cluster_level()
+        self.schedule_virtual_update()
     
-    def delete_selected_items(self):
-        selected_items = self.scene.selectedItems()
-        
-        for item in selected_items:
-            if isinstance(item, DirectedEdge):
-                self.remove_edge(item)
-        
-        for item in selected_items:
-            if isinstance(item, Node):
-                self.remove_node(item)
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.schedule_virtual_update()
+    
+    def drawBackground(self, painter, rect):
+        super().drawBackground(painter, rect)
+        if self.model is not None:
+            if self.virtual_overview:
+                self.draw_model_overview(painter)
+        elif self.cluster_level is not None:
+            self.draw_clusters(painter, rect)
+        elif self.background.enabled:
+            self.background.draw(painter, rect)
+    
+    @timed("scene_paint")
+    def paintEvent(self, event):
+        if not self.painted:
+            # Erst nach diesem Frame melden, damit Zuhörer ihn nicht aufhalten
+            self.painted = True
+            QTimer.singleShot(0, self.first_painted.emit)
+        if not self.show_hud:
+            super().paintEvent(event)
+            return
+        # Reine HUD-Aktualisierungen zählen nicht als Frame
+        hud_only = self.hud_rect.contains(event.rect())
+        self.hud_only_paint = hud_only
+        start = time.perf_counter()
+        super().paintEvent(event)
+        end = time.perf_counter()
+        if not hud_only:
+            self.last_paint_ms = (end - start) * 1000
+            self.frame_times.append(end)
+    
+    def drawForeground(self, painter, rect):
+        super().drawForeground(painter, rect)
+        if self.show_hud:
+            self.draw_hud(painter, rect)
+    
+    def set_hud_visible(self, visible):
+        self.show_hud = visible
+        self.frame_times.clear()
+        if visible:
+            self.hud_timer.start()
+        else:
+            self.hud_timer.stop()
+        self.viewport().update()
+    
+    def current_fps(self, now=None):
+        """Frames pro Sekunde, gemittelt über die letzte Sekunde."""
+        if now is None:
+            now = time.perf_counter()
+        return sum(1 for t in self.frame_times if now - t <= 1.0)
+    
+    def hud_lines(self):
+        if self.model is not None:
+            # Virtualisiert existieren nur die sichtbaren Items
+            total = self.model.node_count + self.model.edge_count
+        else:
+            total = len(self.nodes) + len(self.edges)
+        return [
+            f"FPS: {self.current_fps()}",
+            f"Paint: {self.last_paint_ms:.1f} ms",
+            f"Items: {self.items_painted} / {total}",
+            f"Zoom: {self.zoom_factor * 100:.0f}%",
+        ]
+    
+    def draw_hud(self, painter, rect):
+        if not self.hud_only_paint:
+            self.items_painted = sum(1 for item in self.scene.items(rect) if isinstance(item, (Node, DirectedEdge)))
+        
+        painter.save()
+        painter.resetTransform()
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QBrush(QColor(44, 62, 80, 200)))
+        painter.drawRoundedRect(QRectF(self.hud_rect), 6, 6)
+        painter.setPen(QColor("#ffffff"))
+        painter.setFont(QFont("Monospace", 9))
+        text_rect = self.hud_rect.adjusted(10, 6, -10, -6)
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop, "\n".join(self.hud_lines()))
+        painter.restore()
+
+    @timed("delete_selected_items")
+    def delete_selected_items(self):
+        selected_items = self.scene.selectedItems()
+        nodes = [item for item in selected_items if isinstance(item, Node)]
+        edges = [item for item in selected_items if isinstance(item, DirectedEdge)]
+        self.remove_items(nodes, edges)
+    
+    def remove_items(self, nodes=(), edges=()):
+        """Entfernt Knoten und Kanten als Stapel.
+        
+        Betroffene Kanten werden einmal über die Adjazenz der Knoten gesammelt,
+        zerstört und die Listen einmal neu aufgebaut - statt O(k·E) für k
+        einzelne remove_node-Aufrufe.
+        
+        Die Items werden direkt gelöscht statt per removeItem entfernt: im
+        Destruktor sammelt der BSP-Index sie und bereinigt den Baum einmal,
+        und Python-Overrides (itemChange, boundingRect) werden nicht mehr
+        aufgerufen. Die Wrapper sind danach ungültig.
+        
+        Das gilt nur für bereits indizierte Items. Frisch eingefügte stehen
+        noch in den Warteschlangen der Scene (Polish und BSP-Index, beide erst
+        in der nächsten Event-Schleife abgearbeitet); Qt sucht ein zerstörtes
+        Item dort linear, ein Stapel kostet so O(k·N). Ab REMOVE_FLUSH_MIN
+        Items werden beide Warteschlangen deshalb vorher geleert.
+        """
+        node_set = set(nodes)
+        edge_set = set(edges)
+        for node in node_set:
+            edge_set.update(node.lines)
+        if not node_set and not edge_set:
+            return
+        
+        if self.connection_source in node_set:
+            self.connection_source = None
+        
+        if self.model is not None:
+            self.remove_virtual_items(node_set, edge_set)
+            return
+        
+        edge_list = list(edge_set)
+        pairs = [(edge.source, edge.target) for edge in edge_list]
+        self.stats.remove_many(node_set, pairs)
+        if self.clusters.built:
+            for pair in pairs:
+                self.clusters.remove_edge(*pair)
+            for node in node_set:
+                self.clusters.remove_node(node)
+        self.edge_index.discard_many(pairs, edge_list)
+        for node in node_set:
+            self.bounds.discard(node)
+        
+        # Adjazenz der verbleibenden Endknoten einmal bereinigen
+        survivors = {n for pair in pairs for n in pair} - node_set
+        for node in survivors:
+            node.lines = [line for line in node.lines if line not in edge_set]
+        
+        self.background.invalidate_items(itertools.chain(edge_set, node_set))
+        self.background.live -= edge_set | node_set
+        
+        if len(edge_set) + len(node_set) >= REMOVE_FLUSH_MIN:
+            QMetaObject.invokeMethod(self.scene, "_q_polishItems")
+            # Jede Abfrage arbeitet zuerst die Warteschlange des Index ab
+            self.scene.items(QRectF())
+        for items in (edge_set, node_set):
+            deque(map(sip.delete, items), maxlen=0)
+        
+        self.edges = [e for e in self.edges if e not in edge_set]
+        self.nodes = [n for n in self.nodes if n not in node_set]
+        self.mutation_count += 1
+        for node in node_set:
+            self.label_index.discard(node)
+    
+    def apply_selection_styles(self):
+        """Aktualisiert den Stil nur der Items, deren Auswahl sich geändert hat."""
+        self.selection_timer.stop()
+        selected = set(self.scene.selectedItems())
+        added = selected - self.styled_selection
+        for item in selected.symmetric_difference(self.styled_selection):
+            if not sip.isdeleted(item):
+                item.update_selection_style()
+            point = self.bounds.points.get(item)
+            if point is not None and item in selected:
+                self.selection_bounds.set(item, *point)
+            else:
+                self.selection_bounds.discard(item)
+        self.styled_selection = selected
+        
+        order = {node: None for node in self.selection_order if node in selected}
+        order.update((item, None) for item in added if isinstance(item, Node))
+        self.selection_order = order
+        self.update_live_items()
+        if self.path_mode and len(selected) == 2 and len(order) == 2:
+            # Genau zwei Knoten gewählt: Weg vom zuerst zum zuletzt gewählten
+            self.highlight_shortest_path(*order)
+    
+    def update_live_items(self):
+        """Gleicht die live gezeichneten Items des statischen Hintergrunds ab.
+        
+        Lebend sind ausgewählte und bearbeitete Knoten, der Verbindungsstart,
+        ausgewählte Kanten sowie alle Kanten lebender Knoten (sie bewegen
+        sich beim Ziehen mit). Wechsel verwerfen die berührten Kacheln.
+        """
+        background = self.background
+        if not background.enabled:
+            return
+        live = set()
+        for item in self.styled_selection:
+            if not sip.isdeleted(item):
+                live.add(item)
+        if self.connection_source is not None:
+            live.add(self.connection_source)
+        live.update(node for node in self.nodes if node.is_editing)
+        for node in [item for item in live if isinstance(item, Node)]:
+            live.update(node.lines)
+        if live == background.live:
+            return
+        flag = QGraphicsItem.GraphicsItemFlag.ItemHasNoContents
+        for item in background.live - live:
+            if isinstance(item, DirectedEdge) and not sip.isdeleted(item):
+                background.attach(item)
+        if self.cluster_level is None:
+            for item in background.live - live:
+                if not sip.isdeleted(item):
+                    item.setFlag(flag, True)
+            for item in live - background.live:
+                item.setFlag(flag, False)
+        changed = background.live ^ live
+        background.live = live
+        for item in changed:
+            if not sip.isdeleted(item):
+                background.invalidate(item.sceneBoundingRect())
+    
+    def set_background_caching(self, enabled):
+        """Schaltet den statischen Hintergrund für ruhende Items um."""
+        if enabled == self.background.enabled:
+            return
+        flag = QGraphicsItem.GraphicsItemFlag.ItemHasNoContents
+        for item in itertools.chain(self.nodes, self.edges):
+            item.setFlag(flag, enabled or self.cluster_level is not None)
+        for item in self.background.live:
+            if isinstance(item, DirectedEdge) and not sip.isdeleted(item):
+                self.background.attach(item)
+        self.background.live = set()
+        self.background.enabled = enabled
+        self.background.clear()
+        self.update_live_items()
+        self.viewport().update()
+    
+    def set_semantic_zoom(self, enabled):
+        self.semantic_zoom = enabled
+        self.update_cluster_level()
+    
+    def update_cluster_level(self):
+        """Wählt die Cluster-Ebene passend zum Zoom; None heißt Items zeichnen.
+        
+        Die Ebene wird so gewählt, dass eine Zelle etwa CLUSTER_CELL_PX groß
+        erscheint. Damit hängt die Zahl der Glyphen von der Fenstergröße ab,
+        nicht von der Größe des Netzes.
+        """
+        level = None
+        zoom = self.transform().m11()
+        if (self.semantic_zoom and self.model is None and zoom < CLUSTER_ZOOM_THRESHOLD
+                and len(self.nodes) >= CLUSTER_MIN_NODES):
+            size = CLUSTER_CELL_PX / zoom
+            level = min(CLUSTER_LEVELS - 1, max(0, round(math.log2(size / CLUSTER_BASE_SIZE))))
+            if not self.clusters.built:
+                self.clusters.build(self.nodes, self.edges)
+        self.set_cluster_level(level)
+    
+    def set_cluster_level(self, level):
+        previous = self.cluster_level
+        self.cluster_level = level
+        if (previous is None) != (level is None):
+            # Items zeichnen nur außerhalb der Cluster-Ansicht selbst
+            flag = QGraphicsItem.GraphicsItemFlag.ItemHasNoContents
+            background = self.background
+            for item in itertools.chain(self.nodes, self.edges):
+                item.setFlag(flag, level is not None or (background.enabled and item not in background.live))
+        if level != previous:
+            self.viewport().update()
+    
+    def zoom_into(self, pos):
+        """Zoomt bis knapp über die Cluster-Schwelle und zentriert auf pos."""
+        factor = CLUSTER_ZOOM_THRESHOLD / self.transform().m11()
+        self.scale(factor, factor)
+        self.zoom_factor *= factor
+        self.centerOn(pos)
+        self.update_cluster_level()
+    
+    def set_zoom(self, zoom, center=None):
+        """Setzt den Zoom (begrenzt auf min_zoom..max_zoom) und zentriert auf center."""
+        zoom = min(max(zoom, self.min_zoom), self.max_zoom)
+        factor = zoom / self.transform().m11()
+        self.scale(factor, factor)
+        self.zoom_factor = zoom
+        if center is not None:
+            self.centerOn(center)
+        self.update_cluster_level()
+        self.schedule_virtual_update()
+    
+    def content_extent(self):
+        """(min_x, min_y, max_x, max_y) aller Knoten ohne Durchlauf oder None."""
+        if self.model is not None:
+            return self.model.extent()
+        return self.bounds.extent()
+    
+    def selection_extent(self):
+        """Begrenzung der ausgewählten Knoten, ohne solche der Enden ausgewählter Kanten."""
+        if self.selection_timer.isActive():
+            self.apply_selection_styles()
+        extent = self.selection_bounds.extent()
+        if extent is not None:
+            return extent
+        # Virtualisiert oder nur Kanten gewählt: die wenigen Items direkt
+        items = [item for item in self.styled_selection if not sip.isdeleted(item)]
+        points = [item.pos() for item in items if isinstance(item, Node)]
+        if not points:
+            points = [node.pos() for item in items if isinstance(item, DirectedEdge)
+                      for node in (item.source, item.target)]
+        if not points:
+            return None
+        xs = [point.x() for point in points]
+        ys = [point.y() for point in points]
+        return min(xs), min(ys), max(xs), max(ys)
+    
+    def fit_extent(self, extent, padding=FIT_PADDING):
+        """Zoomt so, dass extent samt Rand in den Viewport passt."""
+        min_x, min_y, max_x, max_y = extent
+        rect = QRectF(QPointF(min_x, min_y), QPointF(max_x, max_y)).adjusted(-padding, -padding, padding, padding)
+        viewport = self.viewport().rect()
+        zoom = min(viewport.width() / rect.width(), viewport.height() / rect.height())
+        self.set_zoom(zoom, rect.center())
+    
+    def fit_all(self):
+        extent = self.content_extent()
+        if extent is None:
+            self.status_message.emit("Kein Inhalt vorhanden", False)
+            return False
+        self.fit_extent(extent)
+        return True
+    
+    def fit_selection(self):
+        extent = self.selection_extent()
+        if extent is None:
+            self.status_message.emit("Keine Auswahl", False)
+            return False
+        self.fit_extent(extent)
+        return True
+    
+    def zoom_reset(self):
+        """Zoomt auf 100% um die Mitte des Viewports."""
+        self.set_zoom(1.0, self.mapToScene(self.viewport().rect().center()))
+    
+    def draw_clusters(self, painter, rect):
+        """Zeichnet die Cluster der aktuellen Ebene samt gewichteter Kantenbündel."""
+        level = self.cluster_level
+        size = CLUSTER_BASE_SIZE << level
+        cells = self.clusters.cells[level]
+        visible = dict(self.clusters.clusters_in(level, rect.adjusted(-size, -size, size, size)))
+        transform = painter.transform()
+        def center(entry):
+            return transform.map(QPointF(entry[1] / entry[0], entry[2] / entry[0]))
+        centers = {key: center(entry) for key, entry in visible.items()}
+        
+        # Jedes Bündel einmal, nur die schwersten; Strichstärke wächst
+        # logarithmisch mit der Kantenzahl
+        bundles = self.clusters.bundles[level]
+        candidates = ((weight, key, other)
+                      for key in centers
+                      for other, weight in bundles.get(key, {}).items()
+                      if other not in centers or key < other)
+        lines = {}
+        for weight, key, other in heapq.nlargest(CLUSTER_BUNDLE_LIMIT, candidates):
+            end = centers.get(other) or center(cells[other])
+            width = min(1 + int(math.log2(weight)), 8)
+            lines.setdefault(width, []).append(QLineF(centers[key], end))
+        
+        painter.save()
+        painter.resetTransform()
+        pen = QPen(CLUSTER_BUNDLE_PEN)
+        for width, group in lines.items():
+            pen.setWidth(width)
+            painter.setPen(pen)
+            painter.drawLines(group)
+        painter.setPen(NODE_PEN)
+        painter.setBrush(NODE_BRUSH)
+        for key, entry in visible.items():
+            count = entry[0]
+            radius = min(4 + 3 * math.log2(count), CLUSTER_CELL_PX / 2)
+            painter.drawEllipse(centers[key], radius, radius)
+        painter.setPen(LABEL_COLOR)
+        painter.setFont(label_font())
+        for key, entry in visible.items():
+            if entry[0] > 1:
+                static, text_size = label_static_text(str(entry[0]))
+                point = centers[key]
+                painter.drawStaticText(QPointF(point.x() - text_size.width() / 2,
+                                               point.y() - text_size.height() / 2), static)
+        painter.restore()
+    
+    def select_items(self, items, extend=False):
+        """Wählt viele Items in einem Schritt aus; Signale und Stile gesammelt."""
+        with QSignalBlocker(self.scene):
+            if not extend:
+                self.scene.clearSelection()
+            for item in items:
+                item.setSelected(True)
+        self.apply_selection_styles()
+    
+    def select_all(self):
+        self.select_items(self.nodes + self.edges)
+    
+    def invert_selection(self):
+        selected = set(self.scene.selectedItems())
+        self.select_items([item for item in self.nodes + self.edges if item not in selected])
+    
+    def neighbourhood(self, nodes, hops=None):
+        """Knoten und Kanten im Umkreis von hops Schritten, ohne Richtung.
+        
+        Mit hops=None die gesamte Zusammenhangskomponente (BFS auf der CSR-Adjazenz).
+        """
+        if self.virtual_unavailable():
+            return set(nodes), set()
+        adjacency = self.adjacency()
+        mask = adjacency.reachable([adjacency.index[n] for n in nodes], "both", hops)
+        reached = {adjacency.nodes[i] for i in np.flatnonzero(mask)}
+        edges = {adjacency.edges[i] for i in adjacency.induced_edges(mask)}
+        return reached, edges
+    
+    def selection_seeds(self):
+        """Ausgewählte Knoten sowie die Endknoten ausgewählter Kanten."""
+        seeds = set()
+        for item in self.scene.selectedItems():
+            if isinstance(item, Node):
+                seeds.add(item)
+            elif isinstance(item, DirectedEdge):
+                seeds.update((item.source, item.target))
+        return seeds
+    
+    def select_neighbourhood(self, hops=None):
+        """Erweitert die Auswahl um die k-Nachbarschaft bzw. die Komponente."""
+        nodes, edges = self.neighbourhood(self.selection_seeds(), hops)
+        self.select_items(list(nodes) + list(edges))
+    
+    def selected_subgraph(self):
+        """Ausgewählte Knoten samt aller Kanten zwischen ihnen als GraphData."""
+        nodes = [item for item in self.scene.selectedItems() if isinstance(item, Node)]
+        graph = GraphData()
+        for node in nodes:
+            pos = node.pos()
+            graph.node(node, node.label_text, pos.x(), pos.y())
+        if self.model is not None:
+            # Nicht jede Kante ist als Item angelegt: Kanten aus dem Modell
+            model = self.model
+            position = np.full(model.n, -1, np.int64)
+            position[[node.model_index for node in nodes]] = np.arange(len(nodes))
+            edges = model.live_edges()
+            sources, targets = position[model.sources[edges]], position[model.targets[edges]]
+            inner = (sources >= 0) & (targets >= 0)
+            # Zusammengefasste Kanten so oft, wie sie eingefügt wurden
+            counts = model.counts[edges][inner]
+            graph.sources.extend(np.repeat(sources[inner], counts).tolist())
+            graph.targets.extend(np.repeat(targets[inner], counts).tolist())
+            return graph
+        index = graph.index
+        for node in nodes:
+            # Jede Kante einmal über ihren Quellknoten (Schleifen stehen doppelt in lines)
+            for edge in dict.fromkeys(node.lines):
+                if edge.source is node and edge.target in index:
+                    for _ in range(edge.multiplicity):
+                        graph.sources.append(index[node])
+                        graph.targets.append(index[edge.target])
+        return graph
+    
+    def copy_selection(self):
+        """Legt den ausgewählten Teilgraphen in die Zwischenablage; liefert ihn."""
+        graph = self.selected_subgraph()
+        if not len(graph):
+            return None
+        mime = QMimeData()
+        mime.setData(SUBGRAPH_MIME, QByteArray(graph.to_bytes()))
+        QApplication.clipboard().setMimeData(mime)
+        self.status_message.emit(f"{len(graph)} Knoten kopiert", True)
+        return graph
+    
+    def cut_selection(self):
+        graph = self.copy_selection()
+        if graph is not None:
+            self.delete_selected_items()
+            self.status_message.emit(f"{len(graph)} Knoten ausgeschnitten", True)
+    
+    def paste(self):
+        """Fügt den Teilgraphen aus der Zwischenablage zentriert unter dem
+        Mauszeiger ein (außerhalb des Canvas in der Mitte der Ansicht)."""
+        mime = QApplication.clipboard().mimeData()
+        if mime is None or not mime.hasFormat(SUBGRAPH_MIME):
+            self.status_message.emit("Zwischenablage enthält kein Netzwerk", False)
+            return []
+        try:
+            graph = GraphData.from_bytes(bytes(mime.data(SUBGRAPH_MIME)))
+        except ValueError as e:
+            self.status_message.emit(f"Einfügen fehlgeschlagen: {e}", False)
+            return []
+        if not len(graph):
+            return []
+        pos = self.viewport().mapFromGlobal(QCursor.pos())
+        if not self.viewport().rect().contains(pos):
+            pos = self.viewport().rect().center()
+        target = self.mapToScene(pos)
+        graph.translate(target.x() - (min(graph.xs) + max(graph.xs)) / 2,
+                        target.y() - (min(graph.ys) + max(graph.ys)) / 2)
+        return self.insert_subgraph(graph)
+    
+    def duplicate_selection(self):
+        """Fügt eine versetzte Kopie der Auswahl ein, ohne die Zwischenablage zu ändern."""
+        graph = self.selected_subgraph()
+        if not len(graph):
+            return []
+        graph.translate(DUPLICATE_OFFSET, DUPLICATE_OFFSET)
+        return self.insert_subgraph(graph)
+    
+    @timed("paste")
+    def insert_subgraph(self, graph):
+        """Fügt den Teilgraphen über den Bulk-Pfad mit neuen IDs ein und wählt ihn aus."""
+        first_edge = len(self.edges)
+        nodes = self.add_graph(graph)
+        self.select_items(nodes + self.edges[first_edge:])
+        self.status_message.emit(f"{len(nodes)} Knoten eingefügt", True)
+        return nodes
+    
+    def set_path_mode(self, enabled):
+        self.path_mode = enabled
+        if enabled and len(self.selection_order) == 2:
+            self.highlight_shortest_path(*self.selection_order)
+    
+    def highlight_shortest_path(self, source, target):
+        """Hebt den kürzesten gerichteten Weg über die Auswahl hervor; liefert dessen Kanten."""
+        if self.virtual_unavailable():
+            return None
+        adjacency = self.adjacency()
+        path = adjacency.shortest_path(adjacency.index[source], adjacency.index[target])
+        if path is None:
+            self.status_message.emit(f"Kein Weg von {source.label_text} nach {target.label_text}", False)
+            return None
+        edges = [adjacency.edges[i] for i in path]
+        self.select_items([source, target] + edges + [e.target for e in edges])
+        self.status_message.emit(f"Kürzester Weg: {len(edges)} Kanten", True)
+        return edges
+    
+    def highlight_reachable(self, direction="out"):
+        """Wählt alles aus, was von der Auswahl stromabwärts (out) bzw. -aufwärts (in) liegt."""
+        if self.virtual_unavailable():
+            return
+        adjacency = self.adjacency()
+        seeds = [adjacency.index[n] for n in self.selection_seeds()]
+        if not seeds:
+            return
+        mask = adjacency.reachable(seeds, direction)
+        # Genau die Kanten, über die die Suche gelaufen ist
+        ends = adjacency.sources if direction == "out" else adjacency.targets
+        edges = np.flatnonzero(mask[ends])
+        self.select_items([adjacency.nodes[i] for i in np.flatnonzero(mask)] +
+                          [adjacency.edges[i] for i in edges])
+        self.status_message.emit(f"{int(mask.sum()) - len(seeds)} Knoten erreichbar", True)
+    
+    def virtual_unavailable(self):
+        """Auswahlbasierte Analysen setzen Items für alle Ergebnisse voraus."""
+        if self.model is None:
+            return False
+        self.status_message.emit("Im virtualisierten Modus nicht verfügbar", False)
+        return True
+    
+    def focus_node(self, node):
+        """Wählt den Knoten aus und zentriert ihn; herausgezoomt wird auf 100% gezoomt.
+        
+        Im virtualisierten Modus darf node auch ein Modellindex sein (so
+        liefert ihn der Label-Index); das Item wird dann erst nach dem
+        Zentrieren angelegt. Gibt das Knoten-Item zurück.
+        """
+        if self.zoom_factor < 1.0:
+            self.scale(1.0 / self.zoom_factor, 1.0 / self.zoom_factor)
+            self.zoom_factor = 1.0
+            self.update_cluster_level()
+        if isinstance(node, Node):
+            self.centerOn(node)
+        else:
+            self.centerOn(float(self.model.xs[node]), float(self.model.ys[node]))
+            self.update_virtual_items()
+            # In der Rasterübersicht entstehen keine Items, dann nur dieses
+            if node in self.virtual_nodes:
+                node = self.virtual_nodes[node]
+            else:
+                node = self.materialize_node(node)
+                self.nodes.append(node)
+        self.select_items([node])
+        return node
     
     def remove_node(self, node):
         """BUGFIX: Prüfe ob Knoten als connection_source verwendet wird"""
+        if self.model is not None:
+            self.remove_items([node])
+            return
         # Brich Verbindungsvorgang ab, falls dieser Knoten beteiligt ist
         if self.connection_source == node:
             self.connection_source = None
         
         # Entferne alle Kanten, die mit diesem Knoten verbunden sind
-        edges_to_remove = [edge for edge in self.edges if edge.source == node or edge.target == node]
+        # (Self-Loops stehen doppelt in node.lines)
+        edges_to_remove = list(dict.fromkeys(node.lines))
         for edge in edges_to_remove:
             self.remove_edge(edge)
         
         # Entferne den Knoten
+        self.label_index.discard(node)
+        self.background.invalidate_item(node)
         self.scene.removeItem(node)
         if node in self.nodes:
             self.nodes.remove(node)
+            self.stats.remove_node(node)
+            self.clusters.remove_node(node)
+            self.bounds.discard(node)
+        self.mutation_count += 1
     
     def remove_edge(self, edge):
+        if self.model is not None:
+            self.remove_items(edges=[edge])
+            return
         if edge in edge.source.lines:
             edge.source.lines.remove(edge)
         if edge in edge.target.lines:
             edge.target.lines.remove(edge)
         
+        self.background.invalidate_item(edge)
         self.scene.removeItem(edge)
         if edge in self.edges:
             self.edges.remove(edge)
+            self.stats.remove_edge(edge.source, edge.target)
+            self.clusters.remove_edge(edge.source, edge.target)
+            self.edge_index.discard((edge.source, edge.target), edge)
+        self.mutation_count += 1
+
+    def set_item_caching(self, enabled):
+        """Schaltet den Pixmap-Cache aller Knoten um (Kanten bleiben ungecacht)."""
+        mode = QGraphicsItem.CacheMode.DeviceCoordinateCache if enabled else QGraphicsItem.CacheMode.NoCache
+        self.item_cache_mode = mode
+        for node in itertools.chain(self.nodes, self.node_pool):
+            node.setCacheMode(mode)
+
+    def bucket_for(self, x, y, z):
+        """Liefert den Bucket der Zelle (x, y) für die Ebene z (Kanten 0, Knoten 1)."""
+        key = (z, int(x // BUCKET_SIZE), int(y // BUCKET_SIZE))
+        bucket = self.buckets.get(key)
+        # Nach scene.clear() sind alte Buckets bereits gelöscht
+        if bucket is None or sip.isdeleted(bucket):
+            bucket = ItemBucket(z, QPointF((key[1] + 0.5) * BUCKET_SIZE, (key[2] + 0.5) * BUCKET_SIZE))
+            self.scene.addItem(bucket)
+            self.buckets[key] = bucket
+        return bucket
+
+    def rebucket(self, node):
+        """Hängt einen verschobenen Knoten und seine ruhenden Kanten in die
+        Buckets ihrer neuen Zellen um.
+        
+        Abfragen durchlaufen alle Kinder eines getroffenen Buckets; bliebe der
+        Knoten im Bucket seiner alten Zelle, zöge jede Abfrage an der neuen
+        Stelle diesen ganzen Bucket mit. Kanten im LiveBucket bleiben dort.
+        """
+        if type(node.parentItem()) is not ItemBucket:
+            return
+        pos = node.pos()
+        self.move_to_bucket(node, self.bucket_for(pos.x(), pos.y(), 1))
+        for line in node.lines:
+            if type(line.parentItem()) is ItemBucket:
+                mid = (line.source.pos() + line.target.pos()) / 2
+                self.move_to_bucket(line, self.bucket_for(mid.x(), mid.y(), 0))
+    
+    @staticmethod
+    def move_to_bucket(item, bucket):
+        if item.parentItem() is not bucket:
+            item.setParentItem(bucket)
 
+    def ensure_scene_contains(self, x, y):
+        """Vergrößert die Scene sprunghaft, sobald ein Knoten außerhalb liegt.
+        
+        Items außerhalb des sceneRect landen alle in den Randblättern des
+        BSP-Index, und Scrollbars wie Minimap erreichen sie nicht.
+        """
+        rect = self.scene.sceneRect()
+        if rect.contains(x, y):
+            return
+        margin = max(rect.width(), rect.height()) / 2
+        self.scene.setSceneRect(rect.united(QRectF(x - margin, y - margin, 2 * margin, 2 * margin)))
+    
+    def allocate_node_id(self, count=1):
+        """Reserviert count fortlaufende, noch unbenutzte Knoten-IDs; liefert die erste."""
+        first = self.next_node_id
+        self.next_node_id += count
+        return first
+    
+    def clear_network(self):
+        """Entfernt alle Knoten und Kanten und setzt den Zustand zurück."""
+        self.scene.clear()
+        self.model = None
+        self.virtual_nodes = {}
+        self.virtual_edges = {}
+        self.node_pool = []
+        self.edge_pool = []
+        self.virtual_overview = False
+        self.nodes = []
+        self.edges = []
+        self.buckets = {}
+        self.styled_selection = set()
+        self.selection_order = {}
+        self.label_index.clear()
+        self.edge_index.clear()
+        self.next_node_id = 0
+        self.connection_source = None
+        self.stats.clear()
+        self.clusters.clear()
+        self.bounds.clear()
+        self.background.clear()
+        self.background.live = set()
+        self.mutation_count += 1
+    
+    def graph_version(self):
+        """Schlüssel für Caches über die Topologie.
+        
+        Die Längen sind Teil des Schlüssels, damit auch direkte Änderungen an
+        nodes/edges den Cache ungültig machen.
+        """
+        if self.model is not None:
+            return (self.mutation_count, self.model.n, self.model.m)
+        return (self.mutation_count, len(self.nodes), len(self.edges))
+    
+    def adjacency(self):
+        """CSR-Adjazenz des aktuellen Netzwerks, neu aufgebaut nur nach Änderungen."""
+        version = self.graph_version()
+        if self.adjacency_cache is None or self.adjacency_cache.version != version:
+            self.adjacency_cache = self.build_adjacency(version)
+        return self.adjacency_cache
+    
+    @timed("build_adjacency")
+    def build_adjacency(self, version):
+        if self.model is not None:
+            # Knoten und Kanten des Snapshots sind Modellindizes
+            nodes, edges, sources, targets = self.model.compact()
+            return AdjacencySnapshot.from_arrays(nodes.tolist(), edges.tolist(), sources, targets, version)
+        return AdjacencySnapshot(self.nodes, self.edges, version)
+    
+    @timed("layout_components")
+    def layout_components(self, executor=None, workers=1):
+        """Legt jede Komponente für sich und packt sie (siehe component_layout)."""
+        snapshot = self.adjacency()
+        self.apply_positions(snapshot.nodes, *component_layout(snapshot, executor, workers))
+    
+    def apply_positions(self, nodes, xs, ys):
+        """Setzt die Positionen vieler Knoten als ein Stapel.
+        
+        nodes sind Items bzw. im virtualisierten Modus Modellindizes (wie in
+        AdjacencySnapshot.nodes). Statt je Knoten Kacheln und Cluster
+        nachzuführen, werden beide einmal verworfen; Begrenzung und Kanten
+        folgen wie beim Ziehen.
+        """
+        if not len(nodes):
+            return
+        self.ensure_scene_contains(float(xs.min()), float(ys.min()))
+        self.ensure_scene_contains(float(xs.max()), float(ys.max()))
+        if self.model is not None:
+            indices = np.asarray(nodes, np.int64)
+            self.model.move_nodes(indices, xs, ys)
+            for i, node in self.virtual_nodes.items():
+                node.setPos(self.model.xs[i], self.model.ys[i])
+            self.schedule_virtual_update()
+        else:
+            for node in nodes:
+                node.background = node.cluster_index = None
+            for node, x, y in zip(nodes, xs.tolist(), ys.tolist()):
+                node.setPos(x, y)
+            for node in nodes:
+                node.background = self.background
+                node.cluster_index = self.clusters
+            self.clusters.clear()
+            self.update_cluster_level()
+        self.background.clear()
+        self.viewport().update()
+    
     def add_new_node(self, x, y, node_id, label=None):
+        if isinstance(node_id, int) and node_id >= self.next_node_id:
+            self.next_node_id = node_id + 1
+        if self.model is not None:
+            i = self.model.add_node(x, y, node_id, label)
+            self.stats.add_node(i)
+            self.label_index.set(i, self.model.labels[i])
+            self.mutation_count += 1
+            self.ensure_scene_contains(x, y)
+            node = self.materialize_node(i)
+            self.nodes.append(node)
+            return node
         node = Node(x, y, node_id, label)
-        self.scene.addItem(node)
+        node.setCacheMode(self.item_cache_mode)
+        self.ensure_scene_contains(x, y)
+        node.setParentItem(self.bucket_for(x, y, 1))
+        node.label_index = self.label_index
+        node.background = self.background
+        node.cluster_index = self.clusters
+        node.bounds_index = self.bounds
+        self.label_index.add(node)
         self.nodes.append(node)
+        self.stats.add_node(node)
+        self.clusters.add_node(node, x, y)
+        pos = node.pos()
+        self.bounds.set(node, pos.x(), pos.y())
+        self.mutation_count += 1
+        self.adopt_item(node)
         return node
 
     def add_new_edge(self, source, target):
         """BUGFIX: Validiere dass beide Knoten noch existieren"""
         if source not in self.nodes or target not in self.nodes:
             return None
-            
+        return self.insert_edge(source, target)
+    
+    def add_graph(self, graph):
+        """Bulk-Einfügen eines GraphData-Imports; liefert die neuen Knoten.
+        
+        Knoten erhalten fortlaufende neue IDs, Kanten werden ohne die
+        O(N)-Existenzprüfung von add_new_edge eingefügt.
+        """
+        first_id = self.allocate_node_id(len(graph))
+        nodes = [self.add_new_node(x, y, first_id + i, label)
+                 for i, (label, x, y) in enumerate(zip(graph.labels, graph.xs, graph.ys))]
+        counts = graph.counts or itertools.repeat(1)
+        for source, target, count in zip(graph.sources, graph.targets, counts):
+            self.insert_edge(nodes[source], nodes[target], count)
+        self.label_index.flush()
+        self.update_cluster_level()
+        return nodes
+    
+    def adopt_item(self, item):
+        """Neues Item: in der Cluster-Ansicht unsichtbar, sonst ggf. Teil des Hintergrunds."""
+        if self.cluster_level is not None:
+            item.setFlag(QGraphicsItem.GraphicsItemFlag.ItemHasNoContents)
+        self.background.adopt(item)
+    
+    def node_records(self):
+        """Liefert (id, label, x, y) je Knoten, ohne eine Liste aufzubauen."""
+        if self.model is not None:
+            yield from self.model.node_records()
+            return
+        for node in self.nodes:
+            pos = node.pos()
+            yield node.node_id, node.label_text, pos.x(), pos.y()
+    
+    def edge_records(self):
+        """Liefert (quell_id, ziel_id) je Kante."""
+        if self.model is not None:
+            yield from self.model.edge_records()
+            return
+        for edge in self.edges:
+            record = edge.source.node_id, edge.target.node_id
+            yield record
+            # Zusammengefasste Kanten so oft, wie sie eingefügt wurden
+            for _ in range(edge.multiplicity - 1):
+                yield record
+    
+    @timed("snapshot")
+    def snapshot(self, svg=False):
+        """GraphSnapshot des aktuellen Netzwerks, auf Wunsch mit SVG-Fragmenten."""
+        nodes = tuple(self.node_records())
+        edges = tuple(self.edge_records())
+        if not svg:
+            return GraphSnapshot(nodes, edges)
+        if self.model is not None:
+            # Virtualisiert existieren nur sichtbare Items: Fragmente erzeugt der Schreiber
+            return GraphSnapshot(nodes, edges, extent=self.content_extent())
+        # Nur Datensätze und vorhandene Fragmente; die fehlenden formatiert
+        # write_svg_file im Worker, Kanten brauchen dafür ihre Endpunkte
+        node_svg = [node.svg_slot() for node in self.nodes]
+        edge_svg = [edge.svg_slot() for edge in self.edges]
+        edge_lines = [None if slot[0] is not None else edge.line_ends()
+                      for edge, slot in zip(self.edges, edge_svg)]
+        return GraphSnapshot(nodes, edges, node_svg, edge_svg, self.content_extent(), edge_lines)
+    
+    def set_edge_policy(self, policy):
+        """Legt fest, wie weitere parallele Kanten eingefügt werden (siehe EDGE_POLICIES)."""
+        if policy not in EDGE_POLICIES:
+            raise ValueError(f"Unbekannte Richtlinie: {policy}")
+        self.edge_policy = policy
+    
+    def parallel_edge(self, key):
+        """Vorhandene Kante mit demselben (Quelle, Ziel) oder None."""
+        if not self.edge_index.built:
+            model = self.model
+            live = model.live_edges()
+            self.edge_index.build(zip(model.sources[live].tolist(), model.targets[live].tolist()), live.tolist())
+        return self.edge_index.find(key)
+    
+    def set_multiplicity(self, edge, count):
+        edge.multiplicity = count
+        edge.update()
+        self.background.invalidate_item(edge)
+    
+    def insert_edge(self, source, target, count=1):
+        """Fügt eine Kante ohne Existenzprüfung der Knoten ein.
+        
+        Parallele Kanten behandelt edge_policy; geliefert wird die neue bzw.
+        zusammengefasste Kante oder None, wenn sie abgelehnt wurde.
+        """
+        if self.model is not None:
+            key = (source.model_index, target.model_index)
+            e = self.parallel_edge(key) if self.edge_policy != "allow" else None
+            if e is None:
+                e = self.model.add_edge(*key, count)
+                self.edge_index.add(key, e)
+                self.stats.add_edge(*key)
+                self.mutation_count += 1
+            elif self.edge_policy == "reject":
+                return None
+            else:
+                self.model.counts[e] += count
+            edge = self.virtual_edges.get(e)
+            if edge is None:
+                edge = self.materialize_edge(e)
+                self.edges.append(edge)
+            else:
+                self.set_multiplicity(edge, int(self.model.counts[e]))
+            return edge
+        key = (source, target)
+        if self.edge_policy != "allow":
+            edge = self.edge_index.find(key)
+            if edge is not None:
+                if self.edge_policy == "reject":
+                    return None
+                self.set_multiplicity(edge, edge.multiplicity + count)
+                return edge
         edge = DirectedEdge(source, target)
-        self.scene.addItem(edge)
+        edge.multiplicity = count
+        self.edge_index.add(key, edge)
+        mid = (source.pos() + target.pos()) / 2
+        edge.setParentItem(self.bucket_for(mid.x(), mid.y(), 0))
         self.edges.append(edge)
         source.lines.append(edge)
         target.lines.append(edge)
+        self.stats.add_edge(edge.source, edge.target)
+        self.clusters.add_edge(source, target)
+        self.mutation_count += 1
+        self.adopt_item(edge)
+        if source in self.background.live or target in self.background.live:
+            self.update_live_items()
+        return edge
+    
+    # --- Virtualisierter Modus ---------------------------------------------
+    
+    def set_model(self, model):
+        """Wechselt in den virtualisierten Modus mit model als Datenbasis."""
+        self.clear_network()
+        self.model = model
+        self.edge_index.clear(built=False)
+        live = model.live_nodes().tolist()
+        ids = [model.node_ids[i] for i in live]
+        int_ids = [i for i in ids if isinstance(i, int)]
+        self.next_node_id = max(int_ids) + 1 if int_ids else 0
+        _, _, sources, targets = model.compact()
+        self.stats.load(live, sources, targets)
+        def labels():
+            live = model.live_nodes().tolist()
+            return live, [model.labels[i] for i in live]
+        # Der Suchindex über alle Labels entsteht erst bei der ersten Suche
+        self.label_index.defer(labels)
+        bounds = model.bounds()
+        self.ensure_scene_contains(bounds.left(), bounds.top())
+        self.ensure_scene_contains(bounds.right(), bounds.bottom())
+        self.mutation_count += 1
+        self.model_grid()
+        self.update_virtual_items()
+    
+    def set_virtual(self, enabled):
+        """Schaltet zwischen Items für alle Elemente und dem virtualisierten Modus um."""
+        if enabled == (self.model is not None):
+            return
+        if enabled:
+            edges = [(edge.source.node_id, edge.target.node_id) for edge in self.edges]
+            self.set_model(GraphModel.from_records(list(self.node_records()), edges,
+                                                   [edge.multiplicity for edge in self.edges]))
+            return
+        model = self.model
+        self.clear_network()
+        nodes = {}
+        for i in model.live_nodes().tolist():
+            nodes[i] = self.add_new_node(float(model.xs[i]), float(model.ys[i]), model.node_ids[i], model.labels[i])
+        for e in model.live_edges().tolist():
+            self.insert_edge(nodes[int(model.sources[e])], nodes[int(model.targets[e])], int(model.counts[e]))
+        self.label_index.flush()
+    
+    def model_grid(self):
+        """Gitterindex des Modells; der (Neu-)Aufbau läuft im Hintergrund,
+        bis dahin kommt der bisherige Index oder None."""
+        if self.grid_builder is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self.grid_builder = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ndraw-grid")
+        return self.model.grid(self.grid_builder)
+    
+    def schedule_virtual_update(self):
+        if self.model is not None:
+            self.virtual_timer.start()
+    
+    def visible_scene_rect(self, margin_px=0):
+        rect = self.viewport().rect().adjusted(-margin_px, -margin_px, margin_px, margin_px)
+        return self.mapToScene(rect).boundingRect()
+    
+    @timed("update_virtual_items")
+    def update_virtual_items(self):
+        """Gleicht die Items mit dem sichtbaren Bereich (plus Rand) ab.
+        
+        Nicht mehr benötigte Items wandern in den Pool, neue werden aus dem
+        Pool belegt. Ausgewählte, gezogene und bearbeitete Knoten bleiben.
+        Sind zu viele Knoten sichtbar, zeichnet drawBackground stattdessen
+        eine Rasterübersicht aus dem Modell.
+        """
+        self.virtual_timer.stop()
+        model = self.model
+        if model is None:
+            return
+        rect = self.visible_scene_rect(VIRTUAL_MARGIN_PX)
+        grid = self.model_grid()
+        if grid is None:
+            # Solange der Gitterindex im Hintergrund entsteht, per Durchlauf
+            visible, edges = model.nodes_in(rect), model.edges_in(rect)
+        else:
+            visible = grid.nodes_in(rect)
+            edges = grid.edges_in(rect, stop_after=2 * VIRTUAL_ITEM_LIMIT)
+        self.virtual_overview = len(visible) > VIRTUAL_ITEM_LIMIT or len(edges) > 2 * VIRTUAL_ITEM_LIMIT
+        if self.virtual_overview:
+            visible = edges = np.zeros(0, np.int64)
+        
+        pinned = {node.model_index for node in self.virtual_nodes.values()
+                  if node.isSelected() or node.is_editing or node is self.connection_source
+                  or node is self.scene.mouseGrabberItem()}
+        wanted_edges = set(edges.tolist())
+        wanted_nodes = set(visible.tolist()) | pinned
+        wanted_nodes.update(model.sources[edges].tolist())
+        wanted_nodes.update(model.targets[edges].tolist())
+        
+        for e in [e for e in self.virtual_edges if e not in wanted_edges]:
+            self.release_edge(e)
+        for i in [i for i in self.virtual_nodes if i not in wanted_nodes]:
+            self.release_node(i)
+        for i in wanted_nodes:
+            if i not in self.virtual_nodes:
+                self.materialize_node(i)
+        for e in wanted_edges:
+            if e not in self.virtual_edges:
+                self.materialize_edge(e)
+        self.nodes = list(self.virtual_nodes.values())
+        self.edges = list(self.virtual_edges.values())
+        self.viewport().update()
+    
+    def materialize_node(self, i):
+        model = self.model
+        x, y = model.xs[i], model.ys[i]
+        if self.node_pool:
+            node = self.node_pool.pop()
+            node.setPos(x, y)
+            node.node_id = model.node_ids[i]
+            node.label_text = model.labels[i]
+            node.update_label_position()
+            node.update_selection_style()
+            node.setVisible(True)
+        else:
+            node = Node(x, y, model.node_ids[i], model.labels[i])
+            node.setCacheMode(self.item_cache_mode)
+            node.setZValue(1)
+            self.scene.addItem(node)
+        # Erst nach setPos verbinden, sonst schreibt itemChange zurück
+        node.model = model
+        node.model_index = i
+        node.label_index = self.label_index
+        self.virtual_nodes[i] = node
+        return node
+    
+    def release_node(self, i):
+        node = self.virtual_nodes.pop(i)
+        node.model = None
+        node.model_index = None
+        node.label_index = None
+        node.lines = []
+        node.setVisible(False)
+        self.node_pool.append(node)
+    
+    def materialize_edge(self, e):
+        source = self.virtual_nodes[int(self.model.sources[e])]
+        target = self.virtual_nodes[int(self.model.targets[e])]
+        if self.edge_pool:
+            edge = self.edge_pool.pop()
+            edge.source, edge.target = source, target
+            edge.update_position()
+            edge.update_selection_style()
+            edge.setVisible(True)
+        else:
+            edge = DirectedEdge(source, target)
+            self.scene.addItem(edge)
+        edge.model_index = e
+        edge.multiplicity = int(self.model.counts[e])
+        source.lines.append(edge)
+        target.lines.append(edge)
+        self.virtual_edges[e] = edge
         return edge
+    
+    def release_edge(self, e):
+        edge = self.virtual_edges.pop(e)
+        for node in {edge.source, edge.target}:
+            if edge in node.lines:
+                node.lines = [line for line in node.lines if line is not edge]
+        edge.setVisible(False)
+        self.edge_pool.append(edge)
+    
+    def remove_virtual_items(self, nodes, edges):
+        """Löscht im Modell und gibt die betroffenen Items an den Pool zurück."""
+        removed = self.model.remove([n.model_index for n in nodes], [e.model_index for e in edges])
+        for e in removed.tolist():
+            key = (int(self.model.sources[e]), int(self.model.targets[e]))
+            self.stats.remove_edge(*key)
+            self.edge_index.discard(key, e)
+        for node in nodes:
+            self.stats.remove_node(node.model_index)
+            self.label_index.discard(node.model_index)
+        with QSignalBlocker(self.scene):
+            for node in nodes:
+                node.setSelected(False)
+            for e in removed.tolist():
+                if e in self.virtual_edges:
+                    self.virtual_edges[e].setSelected(False)
+                    self.release_edge(e)
+            for node in nodes:
+                self.release_node(node.model_index)
+        self.nodes = list(self.virtual_nodes.values())
+        self.edges = list(self.virtual_edges.values())
+        self.mutation_count += 1
+        self.apply_selection_styles()
+    
+    def draw_model_overview(self, painter):
+        """Rasterbild der Modellknoten im Viewport, ein Pixel je Knoten."""
+        size = self.viewport().size()
+        w, h = size.width(), size.height()
+        if w <= 0 or h <= 0:
+            return
+        indices = (self.model_grid() or self.model).nodes_in(self.visible_scene_rect())
+        t = self.viewportTransform()
+        px = (self.model.xs[indices] * t.m11() + t.dx()).astype(np.int64)
+        py = (self.model.ys[indices] * t.m22() + t.dy()).astype(np.int64)
+        inside = (px >= 0) & (px < w) & (py >= 0) & (py < h)
+        pixels = np.zeros((h, w), np.uint32)
+        pixels[py[inside], px[inside]] = VIRTUAL_OVERVIEW_COLOR
+        image = QImage(pixels.data, w, h, 4 * w, QImage.Format.Format_ARGB32_Premultiplied)
+        painter.save()
+        painter.resetTransform()
+        painter.drawImage(0, 0, image)
+        painter.restore()
+
+# Minimap: Bildgröße (lange Seite), Kachelgröße in Pixeln und Zeitbudget pro Takt
+MINIMAP_SIZE = 512
+MINIMAP_TILE = 16
+MINIMAP_BUDGET_MS = 2.0
+MINIMAP_INTERVAL_MS = 16
+# Virtualisiert: Kanten bis zu dieser Länge (in Kacheln), je Kachel höchstens
+# so viele geprüfte Kandidaten und gezeichnete Kanten, der Rest wird ausgedünnt
+MINIMAP_EDGE_TILES = 2
+MINIMAP_TILE_CANDIDATES = 4096
+MINIMAP_TILE_EDGES = 256
+MINIMAP_EDGE_PEN = QPen(QColor("#9e9e9e"), 0)
+MINIMAP_NODE_PEN = QPen(QColor("#2c3e50"), 2)
+MINIMAP_NODE_PEN.setCosmetic(True)  # 2 Pixel unabhängig vom Maßstab
+MINIMAP_VIEW_PEN = QPen(QColor("#2196f3"), 2)
+
+class Minimap(QWidget):
+    """Übersicht der gesamten Scene mit verschiebbarem Ansichtsrechteck.
+    
+    Die Scene wird vereinfacht (Kanten als Linien, Knoten als Punkte) in ein
+    gecachtes QImage gezeichnet. scene.changed markiert nur die betroffenen
+    Kacheln als schmutzig; ein Timer zeichnet sie nach, höchstens
+    MINIMAP_BUDGET_MS pro Takt, den Rest im nächsten Takt.
+    """
+    def __init__(self, canvas, parent=None):
+        super().__init__(parent)
+        self.canvas = canvas
+        self.setMinimumSize(160, 120)
+        self.setCursor(Qt.CursorShape.OpenHandCursor)
+        
+        self.dirty_tiles = set()
+        self.tiles_rendered = 0
+        self.tile_ms = 0.0   # gleitender Mittelwert der Kosten pro Kachel
+        self.drag_offset = QPointF()
+        
+        self.render_timer = QTimer(self)
+        self.render_timer.setSingleShot(True)
+        self.render_timer.setInterval(MINIMAP_INTERVAL_MS)
+        self.render_timer.timeout.connect(self.render_dirty_tiles)
+        
+        canvas.scene.changed.connect(self.mark_dirty)
+        canvas.scene.sceneRectChanged.connect(self.reset_image)
+        for bar in (canvas.horizontalScrollBar(), canvas.verticalScrollBar()):
+            bar.valueChanged.connect(self.update)
+            bar.rangeChanged.connect(self.update)
+        self.reset_image()
+    
+    def reset_image(self):
+        """Legt das Bild passend zum sceneRect neu an und markiert alles schmutzig."""
+        rect = self.canvas.scene.sceneRect()
+        self.image_scale = MINIMAP_SIZE / max(rect.width(), rect.height())
+        self.tile_size = MINIMAP_TILE / self.image_scale  # Kachel in Scene-Einheiten
+        self.image = QImage(math.ceil(rect.width() * self.image_scale), math.ceil(rect.height() * self.image_scale),
+                            QImage.Format.Format_ARGB32_Premultiplied)
+        self.image.fill(Qt.GlobalColor.white)
+        self.cols = math.ceil(self.image.width() / MINIMAP_TILE)
+        self.rows = math.ceil(self.image.height() / MINIMAP_TILE)
+        self.dirty_tiles.clear()
+        self.mark_dirty([rect])
+    
+    def scene_to_image(self):
+        rect = self.canvas.scene.sceneRect()
+        return QTransform.fromScale(self.image_scale, self.image_scale).translate(-rect.left(), -rect.top())
+    
+    def image_to_widget(self):
+        """Skaliert das Bild seitenrichtig und zentriert in das Widget."""
+        factor = min(self.width() / self.image.width(), self.height() / self.image.height())
+        dx = (self.width() - self.image.width() * factor) / 2
+        dy = (self.height() - self.image.height() * factor) / 2
+        return QTransform.fromTranslate(dx, dy).scale(factor, factor)
+    
+    def mark_dirty(self, rects):
+        to_image = self.scene_to_image()
+        for rect in rects:
+            r = to_image.mapRect(rect)
+            c0 = max(0, int(r.left() // MINIMAP_TILE))
+            c1 = min(self.cols - 1, int(r.right() // MINIMAP_TILE))
+            r0 = max(0, int(r.top() // MINIMAP_TILE))
+            r1 = min(self.rows - 1, int(r.bottom() // MINIMAP_TILE))
+            for row in range(r0, r1 + 1):
+                for col in range(c0, c1 + 1):
+                    self.dirty_tiles.add((row, col))
+        if self.dirty_tiles and not self.render_timer.isActive():
+            self.render_timer.start()
+    
+    def render_dirty_tiles(self, budget_ms=MINIMAP_BUDGET_MS):
+        """Zeichnet schmutzige Kacheln nach, solange die nächste voraussichtlich
+        noch ins Zeitbudget passt (mindestens eine pro Takt)."""
+        if not self.isVisible():
+            return
+        if self.canvas.model is not None and self.canvas.model_grid() is None:
+            # Der Gitterindex entsteht noch im Hintergrund
+            self.render_timer.start()
+            return
+        start = time.perf_counter()
+        to_scene = self.scene_to_image().inverted()[0]
+        painter = QPainter(self.image)
+        rendered = 0
+        while self.dirty_tiles:
+            tile_start = time.perf_counter()
+            if rendered and (tile_start - start) * 1000 + self.tile_ms > budget_ms:
+                break
+            rendered += 1
+            row, col = self.dirty_tiles.pop()
+            tile = QRectF(col * MINIMAP_TILE, row * MINIMAP_TILE, MINIMAP_TILE, MINIMAP_TILE)
+            self.render_tile(painter, tile, to_scene.mapRect(tile))
+            self.tiles_rendered += 1
+            self.tile_ms = 0.8 * self.tile_ms + 0.2 * (time.perf_counter() - tile_start) * 1000
+        painter.end()
+        self.update()
+        if self.dirty_tiles:
+            self.render_timer.start()
+    
+    def render_tile(self, painter, tile, scene_rect):
+        painter.save()
+        painter.setClipRect(tile)
+        painter.fillRect(tile, Qt.GlobalColor.white)
+        painter.setTransform(self.scene_to_image())
+        lines, points = [], []
+        model = self.canvas.model
+        if model is not None:
+            # Virtualisiert: aus dem Gitterindex des Modells, ein Knoten je
+            # Bildpunkt und ausgedünnte, nicht zu lange Kanten, damit jede
+            # Kachel ins Zeitbudget passt
+            grid = self.canvas.model_grid()
+            xs, ys = model.xs, model.ys
+            inside = grid.nodes_in(scene_rect, limit=MINIMAP_TILE_CANDIDATES)
+            scale = MINIMAP_TILE / scene_rect.width()
+            px = ((xs[inside] - scene_rect.left()) * scale).astype(np.int64)
+            py = ((ys[inside] - scene_rect.top()) * scale).astype(np.int64)
+            inside = inside[np.unique(px * (MINIMAP_TILE + 1) + py, return_index=True)[1]]
+            points = [QPointF(x, y) for x, y in zip(xs[inside].tolist(), ys[inside].tolist())]
+            edges = grid.edges_in(scene_rect, max_span=MINIMAP_EDGE_TILES * self.tile_size,
+                                  limit=MINIMAP_TILE_CANDIDATES)
+            edges = edges[::math.ceil(len(edges) / MINIMAP_TILE_EDGES) or 1]
+            s, t = model.sources[edges], model.targets[edges]
+            lines = [QLineF(*line) for line in zip(xs[s].tolist(), ys[s].tolist(),
+                                                    xs[t].tolist(), ys[t].tolist())]
+        else:
+            items = self.canvas.scene.items(scene_rect, Qt.ItemSelectionMode.IntersectsItemBoundingRect)
+            for item in items:
+                if isinstance(item, DirectedEdge):
+                    lines.append(QLineF(item.source.pos(), item.target.pos()))
+                elif isinstance(item, Node):
+                    points.append(item.pos())
+        painter.setPen(MINIMAP_EDGE_PEN)
+        painter.drawLines(lines)
+        painter.setPen(MINIMAP_NODE_PEN)
+        painter.drawPoints(points)
+        painter.restore()
+    
+    def viewport_rect(self):
+        """Sichtbarer Scene-Ausschnitt in Widget-Koordinaten."""
+        view = self.canvas.mapToScene(self.canvas.viewport().rect()).boundingRect()
+        return (self.scene_to_image() * self.image_to_widget()).mapRect(view)
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.palette().window())
+        painter.setTransform(self.image_to_widget())
+        painter.drawImage(0, 0, self.image)
+        painter.resetTransform()
+        painter.setPen(MINIMAP_VIEW_PEN)
+        painter.drawRect(self.viewport_rect())
+        painter.end()
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.dirty_tiles:
+            self.render_timer.start()
+    
+    def center_canvas_at(self, pos):
+        to_scene = (self.scene_to_image() * self.image_to_widget()).inverted()[0]
+        self.canvas.centerOn(to_scene.map(pos))
+        self.update()
+    
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.setCursor(Qt.CursorShape.ClosedHandCursor)
+            # Im Rechteck gepackt: relativ verschieben, sonst dorthin springen
+            rect = self.viewport_rect()
+            if rect.contains(event.position()):
+                self.drag_offset = event.position() - rect.center()
+            else:
+                self.drag_offset = QPointF()
+            self.center_canvas_at(event.position() - self.drag_offset)
+    
+    def mouseMoveEvent(self, event):
+        if event.buttons() & Qt.MouseButton.LeftButton:
+            self.center_canvas_at(event.position() - self.drag_offset)
+    
+    def mouseReleaseEvent(self, event):
+        self.setCursor(Qt.CursorShape.OpenHandCursor)
+
+# Statistik-Panel: Aktualisierungsintervall und angezeigte Grade der Verteilung
+STATS_REFRESH_MS = 250
+STATS_HISTOGRAM_BINS = 6
+
+def format_histogram(histogram):
+    """Gradverteilung kompakt als "Grad×Anzahl", kleinste Grade zuerst."""
+    degrees = sorted(histogram)
+    text = "  ".join(f"{d}×{histogram[d]}" for d in degrees[:STATS_HISTOGRAM_BINS])
+    if len(degrees) > STATS_HISTOGRAM_BINS:
+        text += f"  … max {degrees[-1]}"
+    return text or "–"
+
+class StatisticsPanel(QWidget):
+    """Kennzahlen des Netzwerks; Komponenten im Hintergrund-Thread.
+    
+    Zähler und Gradverteilungen liest das Panel aus NetworkCanvas.stats,
+    solange es sichtbar ist. Schwache und starke Komponenten werden auf
+    einem CSR-Snapshot im Worker-Thread berechnet und bis zur nächsten
+    Änderung der Topologie zwischengespeichert.
+    """
+    components_ready = pyqtSignal(object, int, int)
+    components_failed = pyqtSignal(object, str)
+    
+    ROWS = [
+        ("nodes", "Knoten"),
+        ("edges", "Kanten"),
+        ("self_loops", "Schleifen"),
+        ("sources", "Quellen"),
+        ("sinks", "Senken"),
+        ("isolated", "Isoliert"),
+        ("in_degree", "Eingangsgrad"),
+        ("out_degree", "Ausgangsgrad"),
+        ("weak", "Schwache Komponenten"),
+        ("strong", "Starke Komponenten"),
+    ]
+    
+    def __init__(self, canvas, parent=None):
+        super().__init__(parent)
+        self.canvas = canvas
+        layout = QFormLayout(self)
+        self.labels = {}
+        for key, title in self.ROWS:
+            label = QLabel("–")
+            label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+            layout.addRow(title + ":", label)
+            self.labels[key] = label
+        
+        self.shown_version = None
+        self.components = None     # (Graph-Version, schwach, stark)
+        self.pending_version = None
+        self.future = None
+        self.executor = None       # Worker-Thread erst bei der ersten Berechnung
+        self.components_ready.connect(self.set_components)
+        self.components_failed.connect(self.set_components_failed)
+        
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(STATS_REFRESH_MS)
+        self.refresh_timer.timeout.connect(self.refresh)
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh_timer.start()
+        self.refresh()
+    
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.refresh_timer.stop()
+    
+    def refresh(self):
+        stats = self.canvas.stats
+        if stats.version != self.shown_version:
+            self.shown_version = stats.version
+            values = {
+                "nodes": stats.node_count,
+                "edges": stats.edge_count,
+                "self_loops": stats.self_loops,
+                "sources": stats.sources,
+                "sinks": stats.sinks,
+                "isolated": stats.isolated,
+                "in_degree": format_histogram(stats.in_histogram),
+                "out_degree": format_histogram(stats.out_histogram),
+            }
+            for key, value in values.items():
+                self.labels[key].setText(str(value))
+        self.request_components()
+    
+    def request_components(self):
+        """Startet die Komponentenberechnung, falls das Ergebnis veraltet ist."""
+        version = self.canvas.graph_version()
+        if self.pending_version is not None or (self.components and self.components[0] == version):
+            return
+        snapshot = self.canvas.adjacency()
+        self.pending_version = version
+        for key in ("weak", "strong"):
+            self.labels[key].setText("wird berechnet …")
+        if self.executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ndraw-stats")
+        self.future = self.executor.submit(self.compute_components, snapshot, version)
+    
+    def compute_components(self, snapshot, version):
+        # Läuft im Worker-Thread und nutzt nur die Arrays des Snapshots;
+        # das Signal wird in den GUI-Thread zugestellt. Ein Fehler muss
+        # ebenfalls gemeldet werden, sonst bleibt pending_version gesetzt
+        try:
+            weak, _ = snapshot.weak_components()
+            strong, _ = snapshot.strong_components()
+        except Exception as e:
+            self.components_failed.emit(version, str(e) or type(e).__name__)
+            return
+        self.components_ready.emit(version, weak, strong)
+    
+    def set_components(self, version, weak, strong):
+        self.pending_version = None
+        self.components = (version, weak, strong)
+        self.labels["weak"].setText(str(weak))
+        self.labels["strong"].setText(str(strong))
+        for key in ("weak", "strong"):
+            self.labels[key].setToolTip("")
+        if version != self.canvas.graph_version() and self.isVisible():
+            self.request_components()
+    
+    def set_components_failed(self, version, message):
+        # Die fehlgeschlagene Version wird gemerkt, damit der Timer nicht
+        # dieselbe Berechnung endlos wiederholt; erst eine Änderung startet neu
+        self.pending_version = None
+        self.components = (version, None, None)
+        for key in ("weak", "strong"):
+            self.labels[key].setText("Fehler")
+            self.labels[key].setToolTip(message)
+        if version != self.canvas.graph_version() and self.isVisible():
+            self.request_components()
+
+# --- Import: GraphML, DOT, CSV ----------------------------------------------
+# Die Leser arbeiten streamend und füllen ein kompaktes GraphData, das
+# anschließend in einem Stapel über NetworkCanvas.add_graph eingefügt wird.
+
+IMPORT_CHUNK_SIZE = 1 << 16
+LAYOUT_SPACING = 80
+
+# Zwischenablage: MIME-Typ und Kennung kopierter Teilgraphen; Versatz beim Duplizieren
+SUBGRAPH_MIME = "application/x-ndraw-subgraph"
+SUBGRAPH_MAGIC = b"NDRAW-SUBGRAPH-1\n"
+DUPLICATE_OFFSET = 40
+
+class GraphData:
+    """Zwischenstand eines Imports: Knoten über ihren Quell-Schlüssel indiziert.
+    
+    Koordinaten und Kanten liegen in array-Objekten statt in Python-Objekten
+    pro Eintrag; Knoten ohne Position platziert layout_unplaced.
+    """
+    def __init__(self):
+        self.index = {}            # Quell-Schlüssel -> Knotenindex
+        self.labels = []
+        self.xs = array("d")
+        self.ys = array("d")
+        self.placed = bytearray()  # 1, wenn die Quelle eine Position lieferte
+        self.sources = array("q")
+        self.targets = array("q")
+        self.counts = None         # Vielfachheit je Kante nach collapse_parallel_edges
+    
+    def __len__(self):
+        return len(self.labels)
+    
+    def node(self, key, label=None, x=None, y=None):
+        """Legt einen Knoten an oder ergänzt Label/Position eines bekannten."""
+        i = self.index.get(key)
+        if i is None:
+            i = len(self.labels)
+            self.index[key] = i
+            self.labels.append(key)
+            self.xs.append(0.0)
+            self.ys.append(0.0)
+            self.placed.append(0)
+        if label is not None:
+            self.labels[i] = label
+        if x is not None and y is not None:
+            self.xs[i] = x
+            self.ys[i] = y
+            self.placed[i] = 1
+        return i
+    
+    def edge(self, source_key, target_key):
+        self.sources.append(self.node(source_key))
+        self.targets.append(self.node(target_key))
+    
+    def to_bytes(self):
+        """Kompakte Binärform für die Zwischenablage: Kopf, Koordinaten und
+        Kantenenden als Little-Endian-Arrays, danach die Labels als JSON."""
+        arrays = [self.xs, self.ys, self.sources, self.targets]
+        if sys.byteorder == "big":
+            arrays = [array(values.typecode, values) for values in arrays]
+            for values in arrays:
+                values.byteswap()
+        header = SUBGRAPH_MAGIC + struct.pack("<II", len(self), len(self.sources))
+        return b"".join([header, *(values.tobytes() for values in arrays),
+                         json.dumps(self.labels).encode("utf-8")])
+    
+    @classmethod
+    def from_bytes(cls, data):
+        """Gegenstück zu to_bytes; ValueError bei fremden oder beschädigten Daten."""
+        offset = len(SUBGRAPH_MAGIC)
+        if not data.startswith(SUBGRAPH_MAGIC) or len(data) < offset + 8:
+            raise ValueError("Kein ndraw-Teilgraph")
+        n, m = struct.unpack_from("<II", data, offset)
+        offset += 8
+        graph = cls()
+        for name, count in (("xs", n), ("ys", n), ("sources", m), ("targets", m)):
+            values = getattr(graph, name)
+            size = values.itemsize * count
+            values.frombytes(data[offset:offset + size])
+            if sys.byteorder == "big":
+                values.byteswap()
+            offset += size
+        graph.labels = json.loads(data[offset:].decode("utf-8"))
+        if (len(graph.labels) != n or len(graph.ys) != n or len(graph.targets) != m
+                or any(not 0 <= i < n for i in itertools.chain(graph.sources, graph.targets))):
+            raise ValueError("Beschädigter ndraw-Teilgraph")
+        graph.placed = bytearray(b"\x01") * n
+        return graph
+    
+    def collapse_parallel_edges(self, merge=True):
+        """Behält je (Quelle, Ziel) nur die erste Kante, O(1) je Kante.
+        
+        Mit merge zählt counts, wie viele Kanten zusammengefasst wurden.
+        """
+        first = {}
+        sources, targets, counts = array("q"), array("q"), array("q")
+        for s, t, c in zip(self.sources, self.targets, self.counts or itertools.repeat(1)):
+            e = first.get((s, t))
+            if e is None:
+                first[s, t] = len(sources)
+                sources.append(s)
+                targets.append(t)
+                counts.append(c)
+            elif merge:
+                counts[e] += c
+        self.sources, self.targets = sources, targets
+        self.counts = counts if merge else None
+    
+    def translate(self, dx, dy):
+        self.xs = array("d", (x + dx for x in self.xs))
+        self.ys = array("d", (y + dy for y in self.ys))
+    
+    def layout_unplaced(self, spacing=LAYOUT_SPACING):
+        """Schnelles Standard-Layout: Knoten ohne Position in BFS-Reihenfolge
+        auf ein Raster, damit Nachbarn nahe beieinander liegen. O(N + E)."""
+        unplaced = [i for i, p in enumerate(self.placed) if not p]
+        if not unplaced:
+            return
+        adjacency = [[] for _ in range(len(self))]
+        for s, t in zip(self.sources, self.targets):
+            adjacency[s].append(t)
+            adjacency[t].append(s)
+        
+        # Raster rechts neben bereits platzierten Knoten beginnen
+        left = top = 0.0
+        if len(unplaced) < len(self):
+            placed = [i for i, p in enumerate(self.placed) if p]
+            left = max(self.xs[i] for i in placed) + 2 * spacing
+            top = min(self.ys[i] for i in placed)
+        cols = max(1, math.ceil(math.sqrt(len(unplaced))))
+        
+        slot = 0
+        for start in unplaced:
+            if self.placed[start]:
+                continue
+            self.placed[start] = 1
+            queue = deque([start])
+            while queue:
+                i = queue.popleft()
+                self.xs[i] = left + (slot % cols) * spacing
+                self.ys[i] = top + (slot // cols) * spacing
+                slot += 1
+                for j in adjacency[i]:
+                    if not self.placed[j]:
+                        self.placed[j] = 1
+                        queue.append(j)
+
+# --- Komponenten-Layout -----------------------------------------------------
+# Jede schwache Komponente wird für sich gelegt, sodass keine Abstoßung
+# zwischen unverbundenen Teilen berechnet wird; die Komponenten laufen in
+# Prozessen eines Pools (die Arbeit ist reines NumPy und hält den GIL) und
+# werden danach als Rechtecke dicht gepackt.
+
+LAYOUT_ITERATIONS = 60
+LAYOUT_FORCE_LIMIT = 1000     # größere Komponenten: BFS-Raster statt O(n²)-Kräften
+LAYOUT_PARALLEL_MIN = 5000    # darunter lohnt der Prozesspool nicht
+LAYOUT_CHUNKS_PER_WORKER = 4  # Aufträge je Prozess, gleicht ungleiche Größen aus
+
+def grid_layout(n, sources, targets, spacing=LAYOUT_SPACING):
+    """Knoten in BFS-Reihenfolge auf ein quadratisches Raster; O(N + E)."""
+    adjacency = [[] for _ in range(n)]
+    for s, t in zip(sources.tolist(), targets.tolist()):
+        adjacency[s].append(t)
+        adjacency[t].append(s)
+    cols = max(1, math.ceil(math.sqrt(n)))
+    xs, ys = np.zeros(n), np.zeros(n)
+    seen = bytearray(n)
+    slot = 0
+    for start in range(n):
+        if seen[start]:
+            continue
+        seen[start] = 1
+        queue = deque([start])
+        while queue:
+            i = queue.popleft()
+            xs[i], ys[i] = (slot % cols) * spacing, (slot // cols) * spacing
+            slot += 1
+            for j in adjacency[i]:
+                if not seen[j]:
+                    seen[j] = 1
+                    queue.append(j)
+    return xs, ys
+
+def force_layout(n, sources, targets, spacing=LAYOUT_SPACING, iterations=LAYOUT_ITERATIONS):
+    """Fruchterman-Reingold einer Komponente, ausgehend vom BFS-Raster.
+    
+    Abstoßung aller Paare vektorisiert (O(n²) je Schritt), Anziehung entlang
+    der Kanten; die Schrittweite kühlt linear ab. Deterministisch.
+    """
+    xs, ys = grid_layout(n, sources, targets, spacing)
+    if n < 2 or n > LAYOUT_FORCE_LIMIT:
+        return xs, ys
+    jitter = np.random.default_rng(n).uniform(-1, 1, (2, n))
+    xs += jitter[0]
+    ys += jitter[1]
+    k2 = float(spacing) ** 2
+    temperature = spacing * math.sqrt(n) / 4
+    cooling = temperature / (iterations + 1)
+    for _ in range(iterations):
+        dx = xs[:, None] - xs
+        dy = ys[:, None] - ys
+        force = dx * dx
+        force += dy * dy
+        np.maximum(force, 1e-2, out=force)
+        np.divide(k2, force, out=force)
+        disp_x = (dx * force).sum(1)
+        disp_y = (dy * force).sum(1)
+        ex = xs[sources] - xs[targets]
+        ey = ys[sources] - ys[targets]
+        pull = np.sqrt(ex * ex + ey * ey) / spacing
+        disp_x -= np.bincount(sources, ex * pull, n) - np.bincount(targets, ex * pull, n)
+        disp_y -= np.bincount(sources, ey * pull, n) - np.bincount(targets, ey * pull, n)
+        length = np.maximum(np.sqrt(disp_x * disp_x + disp_y * disp_y), 1e-9)
+        step = np.minimum(length, temperature) / length
+        xs += disp_x * step
+        ys += disp_y * step
+        temperature -= cooling
+    return xs, ys
+
+def layout_chunk(chunk):
+    """Legt mehrere Komponenten (n, sources, targets); läuft im Worker-Prozess."""
+    return [force_layout(n, sources, targets) for n, sources, targets in chunk]
+
+def pack_rectangles(sizes, gap=LAYOUT_SPACING):
+    """Linke obere Ecken für Rechtecke (w, h), dicht und etwa quadratisch gepackt.
+    
+    Regal-Packen nach absteigender Höhe (next-fit decreasing height): die
+    Regalbreite ist die Wurzel der Gesamtfläche, mindestens das breiteste
+    Rechteck. O(k log k) für k Rechtecke.
+    """
+    if not sizes:
+        return []
+    area = sum((w + gap) * (h + gap) for w, h in sizes)
+    width = max(math.sqrt(area), max(w for w, _ in sizes))
+    corners = [None] * len(sizes)
+    x = y = shelf = 0.0
+    for i in sorted(range(len(sizes)), key=lambda i: -sizes[i][1]):
+        w, h = sizes[i]
+        if x > 0 and x + w > width:
+            x, y, shelf = 0.0, y + shelf + gap, 0.0
+        corners[i] = (x, y)
+        x += w + gap
+        shelf = max(shelf, h)
+    return corners
+
+def component_layout(snapshot, executor=None, workers=1, parallel_min=LAYOUT_PARALLEL_MIN):
+    """Positionen (xs, ys) je Knoten des AdjacencySnapshot.
+    
+    Die Komponenten werden nach geschätzten Kosten gierig auf
+    workers * LAYOUT_CHUNKS_PER_WORKER Aufträge verteilt und mit
+    executor.map gerechnet; ohne Executor oder bei kleinen Netzen im
+    aufrufenden Prozess.
+    """
+    n = len(snapshot)
+    count, labels = snapshot.weak_components()
+    # Knoten und Kanten nach Komponente sortieren, Indizes komponentenlokal
+    order = np.argsort(labels, kind="stable")
+    starts = np.zeros(count + 1, np.int64)
+    np.cumsum(np.bincount(labels, minlength=count), out=starts[1:])
+    local = np.empty(n, np.int64)
+    local[order] = np.arange(n) - starts[labels[order]]
+    edge_labels = labels[snapshot.sources]
+    edge_order = np.argsort(edge_labels, kind="stable")
+    edge_starts = np.zeros(count + 1, np.int64)
+    np.cumsum(np.bincount(edge_labels, minlength=count), out=edge_starts[1:])
+    sources, targets = local[snapshot.sources[edge_order]], local[snapshot.targets[edge_order]]
+    
+    tasks = [(int(starts[c + 1] - starts[c]), sources[edge_starts[c]:edge_starts[c + 1]],
+              targets[edge_starts[c]:edge_starts[c + 1]]) for c in range(count)]
+    parallel = executor is not None and workers > 1 and n >= parallel_min
+    bins = [[0, b, []] for b in range(workers * LAYOUT_CHUNKS_PER_WORKER if parallel else 1)]
+    def cost(c):
+        size = tasks[c][0]
+        return size * size if size <= LAYOUT_FORCE_LIMIT else size + len(tasks[c][1])
+    for c in sorted(range(count), key=cost, reverse=True):
+        lightest = heapq.heappop(bins)
+        lightest[0] += cost(c)
+        lightest[2].append(c)
+        heapq.heappush(bins, lightest)
+    chunks = [components for _, _, components in bins if components]
+    work = [[tasks[c] for c in components] for components in chunks]
+    results = executor.map(layout_chunk, work) if parallel else map(layout_chunk, work)
+    placed = [None] * count
+    for components, positions in zip(chunks, results):
+        for c, position in zip(components, positions):
+            placed[c] = position
+    
+    sizes = [(float(x.max() - x.min()), float(y.max() - y.min())) for x, y in placed]
+    corners = pack_rectangles(sizes)
+    xs, ys = np.empty(n), np.empty(n)
+    for c, ((x, y), (left, top)) in enumerate(zip(placed, corners)):
+        nodes = order[starts[c]:starts[c + 1]]
+        xs[nodes] = x - x.min() + left
+        ys[nodes] = y - y.min() + top
+    return xs, ys
+
+def local_name(tag):
+    return tag.rpartition("}")[2]
+
+def read_graphml(path, graph):
+    """Liest GraphML per iterparse; verarbeitete Elemente werden sofort verworfen.
+    
+    Erkennt Label und Position aus <data>-Schlüsseln (label/name, x/y) sowie
+    aus yEd-Geometrie und -Labels.
+    """
+    import xml.etree.ElementTree as ET
+    keys = {}
+    graphs = []  # offene <graph>-Elemente, verschachtelt bei Gruppenknoten
+    for event, elem in ET.iterparse(path, events=("start", "end")):
+        tag = local_name(elem.tag)
+        if event == "start":
+            if tag == "graph":
+                graphs.append(elem)
+            continue
+        if tag == "graph":
+            graphs.pop()
+        elif tag == "key":
+            keys[elem.get("id")] = (elem.get("attr.name") or "").lower()
+        elif tag == "node":
+            label = x = y = None
+            for child in elem.iter():
+                child_tag = local_name(child.tag)
+                if child_tag == "data":
+                    name = keys.get(child.get("key"), "")
+                    text = (child.text or "").strip()
+                    if name in ("label", "name") and text:
+                        label = text
+                    elif name == "x" and text:
+                        x = float(text)
+                    elif name == "y" and text:
+                        y = float(text)
+                elif child_tag == "Geometry":
+                    x = float(child.get("x", 0)) + float(child.get("width", 0)) / 2
+                    y = float(child.get("y", 0)) + float(child.get("height", 0)) / 2
+                elif child_tag == "NodeLabel" and (child.text or "").strip():
+                    label = child.text.strip()
+            graph.node(elem.get("id"), label, x, y)
+        elif tag == "edge":
+            graph.edge(elem.get("source"), elem.get("target"))
+        else:
+            continue
+        # Bereits verarbeitete Kinder verwerfen, damit der Baum nicht wächst
+        elem.clear()
+        if graphs:
+            graphs[-1].clear()
+
+_DOT_SKIP = r"(?:\s+|//[^\n]*|\#[^\n]*|/\*.*?\*/)*"
+_DOT_TOKEN = re.compile(_DOT_SKIP + r"""(?:
+    (?P<string>"(?:[^"\\]|\\.)*")
+  | (?P<edgeop>->|--)
+  | (?P<punct>[{}\[\];,=:])
+  | (?P<id>[A-Za-z_\x80-\U0010ffff][\w\x80-\U0010ffff]*|-?(?:\.\d+|\d+(?:\.\d*)?))
+  | (?P<html><)
+)""", re.VERBOSE | re.DOTALL)
+_DOT_SKIP = re.compile(_DOT_SKIP, re.DOTALL)
+# Fortsetzungszeilen entfallen; \\, \" und \n wie von dot_quote geschrieben,
+# andere Graphviz-Escapes (\l, \N, ...) bleiben unverändert
+_DOT_ESCAPE = re.compile(r"\\(.)", re.DOTALL)
+_DOT_UNESCAPED = {"\n": "", '"': '"', "\\": "\\", "n": "\n"}
+
+def dot_unescape(match):
+    return _DOT_UNESCAPED.get(match.group(1), match.group(0))
+
+def dot_tokens(stream, chunk_size=IMPORT_CHUNK_SIZE):
+    """Inkrementeller DOT-Tokenizer über einen Textstream.
+    
+    Liefert (art, wert) mit art in id, string, edgeop, punct; HTML-Labels
+    kommen als string. Gelesen wird blockweise, ein Token darf
+    über Blockgrenzen reichen.
+    """
+    match = _DOT_TOKEN.match
+    low = chunk_size // 4
+    buf, pos, eof = "", 0, False
+    
+    def refill():
+        nonlocal buf, pos, eof
+        data = stream.read(chunk_size)
+        buf, pos, eof = buf[pos:] + data, 0, not data
+    
+    while True:
+        if not eof and len(buf) - pos < low:
+            refill()
+        m = match(buf, pos)
+        if m is None or (m.end() == len(buf) and not eof):
+            # Token unvollständig oder reicht über das Pufferende hinaus
+            if not eof:
+                refill()
+                continue
+            pos = _DOT_SKIP.match(buf, pos).end()
+            if pos == len(buf):
+                return
+            raise ValueError(f"DOT: unerwartetes Zeichen {buf[pos]!r}")
+        kind = m.lastgroup
+        if kind == "html":
+            # HTML-Label: spitze Klammern zählen
+            start = end = m.start(kind)
+            depth = 0
+            while end < len(buf):
+                depth += {"<": 1, ">": -1}.get(buf[end], 0)
+                end += 1
+                if depth == 0:
+                    break
+            if depth:
+                if eof:
+                    raise ValueError("DOT: HTML-Label nicht abgeschlossen")
+                refill()
+                continue
+            pos = end
+            yield "string", buf[start + 1:end - 1]
+            continue
+        pos = m.end()
+        if kind == "string":
+            yield kind, _DOT_ESCAPE.sub(dot_unescape, m.group(kind)[1:-1])
+        else:
+            yield kind, m.group(kind)
+
+def parse_dot_pos(value):
+    """Graphviz-Position "x,y" bzw. "x,y!" (Punkte, y nach oben)."""
+    if not value:
+        return None, None
+    try:
+        x, y = value.rstrip("!").split(",")[:2]
+        return float(x), -float(y)
+    except ValueError:
+        return None, None
+
+def read_dot(path, graph):
+    """Liest einen Graphviz-Graphen über dot_tokens (Knoten, Kanten, Subgraphen).
+    
+    Von den Attributen werden nur label und pos von Knoten übernommen.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        tokens = dot_tokens(f)
+        token = next(tokens, (None, None))
+        
+        def take():
+            nonlocal token
+            current, token = token, next(tokens, (None, None))
+            return current
+        
+        def expect(value):
+            got = take()[1]
+            if got != value:
+                raise ValueError(f"DOT: {value!r} erwartet, {got!r} gefunden")
+        
+        def attr_lists():
+            attrs = {}
+            while token == ("punct", "["):
+                take()
+                while token != ("punct", "]"):
+                    kind, name = take()
+                    if kind is None:
+                        raise ValueError("DOT: Attributliste nicht abgeschlossen")
+                    if token == ("punct", "="):
+                        take()
+                        attrs[name] = take()[1]
+                take()
+            return attrs
+        
+        def operand():
+            """Knoten-ID oder Subgraph; liefert die Schlüssel der Knoten."""
+            if token in (("punct", "{"), ("id", "subgraph")):
+                if take()[1] == "subgraph":
+                    if token[0] in ("id", "string"):
+                        take()
+                    expect("{")
+                return statements()
+            kind, key = take()
+            if kind not in ("id", "string"):
+                raise ValueError(f"DOT: Knoten-ID erwartet, {key!r} gefunden")
+            # Ports (a:p:n) gehören zum selben Knoten
+            while token == ("punct", ":"):
+                take()
+                take()
+            return [key]
+        
+        def statements():
+            """Anweisungen bis zur schließenden Klammer; liefert alle Knoten darin."""
+            members = []
+            while True:
+                kind, value = token
+                if kind is None:
+                    raise ValueError("DOT: '}' fehlt")
+                if kind == "punct" and value in "};,":
+                    take()
+                    if value == "}":
+                        return members
+                    continue
+                if kind == "id" and value in ("graph", "node", "edge"):
+                    # Standardattribute werden nicht übernommen
+                    take()
+                    attr_lists()
+                    continue
+                is_node = token not in (("punct", "{"), ("id", "subgraph"))
+                first = operand()
+                if token == ("punct", "="):
+                    # Graph-Attribut a = b
+                    take()
+                    take()
+                    continue
+                chain = [first]
+                while token[0] == "edgeop":
+                    take()
+                    chain.append(operand())
+                attrs = attr_lists()
+                for group in chain:
+                    members.extend(group)
+                if len(chain) == 1 and is_node:
+                    x, y = parse_dot_pos(attrs.get("pos"))
+                    label = attrs.get("label")
+                    graph.node(first[0], None if label in (None, "\\N") else label, x, y)
+                for left, right in zip(chain, chain[1:]):
+                    for source in left:
+                        for target in right:
+                            graph.edge(source, target)
+        
+        if token == ("id", "strict"):
+            take()
+        if take()[1] not in ("graph", "digraph"):
+            raise ValueError("DOT: 'graph' oder 'digraph' erwartet")
+        if token[0] in ("id", "string"):
+            take()
+        expect("{")
+        statements()
+
+CSV_HEADER_NAMES = {"source", "target", "from", "to", "src", "dst", "quelle", "ziel"}
+
+def read_csv_edges(path, graph, chunk_rows=10000):
+    """Liest eine Kantenliste (Quelle, Ziel pro Zeile) in Blöcken von chunk_rows Zeilen.
+    
+    Trennzeichen (Komma, Semikolon, Tab, sonst Leerzeichen) wird an der ersten
+    Zeile erkannt, weitere Spalten werden ignoriert, eine Kopfzeile mit Spaltennamen wie source/target übersprungen.
+    """
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        first = f.readline()
+        delimiter = max(",;\t", key=first.count)
+        if delimiter not in first:
+            delimiter = " "
+        reader = csv.reader(itertools.chain([first], f), delimiter=delimiter,
+                            skipinitialspace=True)
+        header = True
+        while True:
+            chunk = list(itertools.islice(reader, chunk_rows))
+            if not chunk:
+                break
+            for row in chunk:
+                if not row or row[0].lstrip().startswith("#"):
+                    continue
+                if len(row) == 1:
+                    # Einzelner Eintrag: isolierter Knoten
+                    if row[0].strip():
+                        graph.node(row[0].strip())
+                    header = False
+                    continue
+                source, target = row[0].strip(), row[1].strip()
+                if header and {source.lower(), target.lower()} <= CSV_HEADER_NAMES:
+                    header = False
+                    continue
+                header = False
+                graph.edge(source, target)
+
+IMPORTERS = {
+    ".graphml": read_graphml,
+    ".xml": read_graphml,
+    ".dot": read_dot,
+    ".gv": read_dot,
+    ".csv": read_csv_edges,
+    ".tsv": read_csv_edges,
+    ".txt": read_csv_edges,
+}
+
+def read_graph_file(path):
+    """Liest eine Datei passend zur Endung und platziert Knoten ohne Position."""
+    reader = IMPORTERS.get(Path(path).suffix.lower())
+    if reader is None:
+        raise ValueError(f"Unbekanntes Format: {Path(path).suffix}")
+    graph = GraphData()
+    reader(path, graph)
+    graph.layout_unplaced()
+    return graph
+
+# --- Export: GraphML, DOT, CSV ----------------------------------------------
+# Die Schreiber sind Generatoren über (id, label, x, y)- und (quelle, ziel)-
+# Datensätzen und liefern das Dokument zeilenweise.
+
+def graphml_lines(nodes, edges):
+    """GraphML mit label/x/y-Schlüsseln, lesbar von read_graphml."""
+    from xml.sax.saxutils import escape as xml_escape, quoteattr
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+    yield '  <key id="label" for="node" attr.name="label" attr.type="string"/>\n'
+    yield '  <key id="x" for="node" attr.name="x" attr.type="double"/>\n'
+    yield '  <key id="y" for="node" attr.name="y" attr.type="double"/>\n'
+    yield '  <graph edgedefault="directed">\n'
+    ids = {}  # maskierte IDs für die Kanten wiederverwenden
+    for node_id, label, x, y in nodes:
+        ids[node_id] = quoted = quoteattr(str(node_id))
+        yield (f'    <node id={quoted}><data key="label">{xml_escape(label)}</data>'
+               f'<data key="x">{x}</data><data key="y">{y}</data></node>\n')
+    for source, target in edges:
+        yield f'    <edge source={ids[source]} target={ids[target]}/>\n'
+    yield '  </graph>\n</graphml>\n'
+
+def dot_quote(text):
+    """DOT-String; Backslash zuerst maskieren, Zeilenumbrüche als \\n."""
+    text = str(text).replace("\\", "\\\\").replace('"', '\\"')
+    return '"' + text.replace("\r\n", "\n").replace("\n", "\\n") + '"'
+
+def dot_lines(nodes, edges):
+    """Graphviz-Digraph; pos in Punkten mit nach oben zeigender y-Achse."""
+    yield "digraph ndraw {\n"
+    ids = {}
+    for node_id, label, x, y in nodes:
+        ids[node_id] = quoted = dot_quote(node_id)
+        yield f'  {quoted} [label={dot_quote(label)}, pos="{x},{-y}!"];\n'
+    for source, target in edges:
+        yield f"  {ids[source]} -> {ids[target]};\n"
+    yield "}\n"
+
+def csv_field(value, delimiter):
+    text = str(value)
+    if delimiter in text or '"' in text or "\n" in text:
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+def csv_lines(nodes, edges, delimiter=","):
+    """Kantenliste mit Kopfzeile; Knoten ohne Kanten als einspaltige Zeilen."""
+    yield f"source{delimiter}target\n"
+    connected = set()
+    for source, target in edges:
+        connected.add(source)
+        connected.add(target)
+        yield f"{csv_field(source, delimiter)}{delimiter}{csv_field(target, delimiter)}\n"
+    for node_id, _, _, _ in nodes:
+        if node_id not in connected:
+            yield csv_field(node_id, delimiter) + "\n"
+
+EXPORTERS = {
+    ".graphml": graphml_lines,
+    ".xml": graphml_lines,
+    ".dot": dot_lines,
+    ".gv": dot_lines,
+    ".csv": csv_lines,
+    ".tsv": functools.partial(csv_lines, delimiter="\t"),
+    ".txt": functools.partial(csv_lines, delimiter=" "),
+}
+
+@contextlib.contextmanager
+def atomic_write(path, **kwargs):
+    """Schreibt in eine temporäre Datei daneben und ersetzt das Ziel erst am Ende.
+    
+    Bei einem Fehler bleibt eine vorhandene Datei unverändert.
+    """
+    path = Path(path)
+    temp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp, "w", **kwargs) as f:
+            yield f
+        os.replace(temp, path)
+    except BaseException:
+        temp.unlink(missing_ok=True)
+        raise
+
+def write_graph_file(path, nodes, edges):
+    """Schreibt die Datensätze im Format passend zur Endung."""
+    writer = EXPORTERS.get(Path(path).suffix.lower())
+    if writer is None:
+        raise ValueError(f"Unbekanntes Format: {Path(path).suffix}")
+    with atomic_write(path, encoding="utf-8", buffering=IMPORT_CHUNK_SIZE) as f:
+        f.writelines(writer(nodes, edges))
+
+class GraphSnapshot:
+    """Unveränderlicher Stand des Netzwerks für Schreiber im Hintergrund.
+    
+    Enthält nur Tupel und Strings; die Plätze der SVG-Fragmente werden mit
+    den Items geteilt und höchstens vom Schreiber gefüllt. Das Netzwerk darf
+    danach weiter bearbeitet werden.
+    """
+    def __init__(self, nodes, edges, node_svg=None, edge_svg=None, extent=None, edge_lines=None):
+        self.nodes = nodes        # (id, label, x, y) je Knoten
+        self.edges = edges        # (quell_id, ziel_id) je Kante
+        self.node_svg = node_svg  # [Fragment oder None] je Knoten-Item, falls vorhanden
+        self.edge_svg = edge_svg  # [Fragment oder None] je Kanten-Item
+        self.extent = extent      # (min_x, min_y, max_x, max_y), falls bekannt
+        self.edge_lines = edge_lines  # (x1, y1, x2, y2) je Kante ohne Fragment, sonst None
+
+def write_json_file(path, snapshot):
+    data = {
+        "nodes": [{"id": node_id, "x": x, "y": y, "label": label}
+                 for node_id, label, x, y in snapshot.nodes],
+        "edges": [{"from": source, "to": target}
+                 for source, target in snapshot.edges]
+    }
+    with atomic_write(path) as f:
+        json.dump(data, f, indent=4)
+
+def write_svg_file(path, snapshot):
+    """SVG gecropped auf den Inhalt.
+    
+    Leere Fragment-Plätze werden hier (im Worker-Thread) gefüllt und bleiben
+    den Items für den nächsten Export erhalten; im virtualisierten Modus gibt
+    es keine Plätze und alles wird aus den Datensätzen formatiert.
+    """
+    edge_parts, node_parts = snapshot.edge_svg, snapshot.node_svg
+    if node_parts is None:
+        positions = {node_id: QPointF(x, y) for node_id, _, x, y in snapshot.nodes}
+        edge_parts = [svg_edge_fragment(positions[source], positions[target])
+                      for source, target in snapshot.edges]
+        node_parts = [svg_node_fragment(label, x, y) for _, label, x, y in snapshot.nodes]
+    else:
+        for slot, (_, label, x, y) in zip(node_parts, snapshot.nodes):
+            if slot[0] is None:
+                slot[0] = svg_node_fragment(label, x, y)
+        for slot, line in zip(edge_parts, snapshot.edge_lines):
+            if slot[0] is None:
+                slot[0] = svg_edge_fragment(QPointF(line[0], line[1]), QPointF(line[2], line[3]))
+        node_parts = [slot[0] for slot in node_parts]
+        edge_parts = [slot[0] for slot in edge_parts]
+    extent = snapshot.extent
+    if extent is None:
+        xs = [x for _, _, x, _ in snapshot.nodes]
+        ys = [y for _, _, _, y in snapshot.nodes]
+        extent = min(xs), min(ys), max(xs), max(ys)
+    padding = 30
+    min_x, max_x = extent[0] - padding, extent[2] + padding
+    min_y, max_y = extent[1] - padding, extent[3] + padding
+    width = max_x - min_x
+    height = max_y - min_y
+
+    with atomic_write(path) as f:
+        f.write('<?xml version="1.0" encoding="UTF-8" ?>\n')
+        f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="{min_x} {min_y} {width} {height}">\n')
+        f.write('<defs><marker id="arrow" viewBox="0 0 10 10" refX="9" refY="5" markerWidth="6" markerHeight="6" orient="auto-start-reverse"><path d="M 0 0 L 10 5 L 0 10 z" fill="black" /></marker></defs>\n')
+        f.writelines(edge_parts)
+        f.writelines(node_parts)
+        f.write('</svg>')
+
+# --- Programm-Icon ----------------------------------------------------------
+# Alle Größen werden einmal gezeichnet und im XDG-Cache abgelegt; der Schlüssel
+# ist eine Prüfsumme der Zeichenparameter, sodass Änderungen am Stil neue
+# Dateien erzeugen. Folgestarts laden nur noch die PNGs (auch gen_icon.py nutzt
+# diese Funktionen).
+
+ICON_SIZES = (16, 32, 48, 64, 128, 256, 512)
+ICON_STYLE = {
+    # Koordinaten im 64er-Raster, beim Zeichnen auf die Zielgröße skaliert
+    "background": "#2c3e50",
+    "accent": "#3498db",
+    "node": "#ffffff",
+    "nodes": [(20, 20), (44, 20), (32, 40)],
+    "edges": [(0, 1), (0, 2), (1, 2)],
+    "node_radius": 6,
+    "node_pen": 2,
+    "edge_pen": 2.5,
+    "arrow": 4,
+}
+
+def draw_app_icon(size=64, style=ICON_STYLE):
+    """Zeichnet das Icon in ein QImage (anders als QPixmap auch im Worker-Thread erlaubt)."""
+    image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.scale(size / 64, size / 64)
+    
+    painter.setBrush(QBrush(QColor(style["background"])))
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.drawRoundedRect(QRectF(2, 2, 60, 60), 8, 8)
+    
+    accent = QColor(style["accent"])
+    points = [QPointF(x, y) for x, y in style["nodes"]]
+    for a, b in style["edges"]:
+        painter.setPen(QPen(accent, style["edge_pen"]))
+        painter.drawLine(points[a], points[b])
+        # Pfeilspitze am Zielknoten
+        angle = math.atan2(points[b].y() - points[a].y(), points[b].x() - points[a].x())
+        wings = [points[b] - QPointF(math.cos(angle + d), math.sin(angle + d)) * style["arrow"]
+                 for d in (-math.pi / 6, math.pi / 6)]
+        painter.setBrush(QBrush(accent))
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawPolygon(QPolygonF([points[b]] + wings))
+    
+    radius = style["node_radius"]
+    painter.setBrush(QBrush(QColor(style["node"])))
+    painter.setPen(QPen(accent, style["node_pen"]))
+    for point in points:
+        painter.drawEllipse(point, radius, radius)
+    
+    painter.end()
+    return image
+
+def icon_cache_key(style=ICON_STYLE, sizes=ICON_SIZES):
+    # CRC32 reicht zur Unterscheidung und kommt ohne den Import von hashlib aus
+    import zlib
+    text = json.dumps([style, sizes], sort_keys=True)
+    return f"{zlib.crc32(text.encode()):08x}"
+
+def icon_cache_dir(environ=os.environ):
+    base = environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "ndraw" / "icons" / icon_cache_key()
+
+def icon_file(directory, size):
+    return Path(directory) / f"ndraw_icon_{size}.png"
+
+def render_icons(directory, sizes=ICON_SIZES):
+    """Zeichnet alle Größen parallel und legt sie atomar in directory ab."""
+    from concurrent.futures import ThreadPoolExecutor
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    
+    def render(size):
+        image = draw_app_icon(size)
+        # Erst vollständig schreiben, dann umbenennen: parallele Starts sehen nie halbe Dateien
+        temp = directory / f".ndraw_icon_{size}.{os.getpid()}.png"
+        if not image.save(str(temp)):
+            raise OSError(f"Icon nicht schreibbar: {temp}")
+        os.replace(temp, icon_file(directory, size))
+        return image
+    
+    with ThreadPoolExecutor(thread_name_prefix="ndraw-icons") as pool:
+        return dict(zip(sizes, pool.map(render, sizes)))
+
+@functools.lru_cache(maxsize=None)
+def app_icon():
+    """Icon mit allen Größen aus dem Cache; nur beim ersten Start wird gezeichnet."""
+    directory = icon_cache_dir()
+    icon = QIcon()
+    files = [icon_file(directory, size) for size in ICON_SIZES]
+    if all(path.exists() for path in files):
+        for size, path in zip(ICON_SIZES, files):
+            icon.addFile(str(path), QSize(size, size))
+        return icon
+    try:
+        images = render_icons(directory)
+    except OSError:
+        # Cache nicht beschreibbar: nur für diesen Start im Speicher zeichnen
+        images = {size: draw_app_icon(size) for size in ICON_SIZES}
+    for image in images.values():
+        icon.addPixmap(QPixmap.fromImage(image))
+    return icon
 
 class MainWindow(QMainWindow):
+    # Ergebnis eines Schreibauftrags im Hintergrund (Text, Erfolg)
+    write_finished = pyqtSignal(str, bool)
+    # Ergebnis des Komponenten-Layouts (Snapshot, (xs, ys) oder None bei Fehler)
+    layout_finished = pyqtSignal(object, object)
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Vector Network Designer Pro")
         self.resize(1000, 800)
         
         self.canvas = NetworkCanvas()
+        self.canvas.status_message.connect(lambda text, ok: self.show_status(text, success=ok))
+        self.writer = None  # Worker-Thread für Speichern und Export, erst bei Bedarf
+        self.write_finished.connect(lambda text, ok: self.show_status(text, success=ok))
+        self.layouter = None    # Thread, der das Layout an den Prozesspool verteilt
+        self.layout_pool = None # Worker-Prozesse, erst beim ersten großen Layout
+        self.layout_finished.connect(self.apply_layout)
         
         # Statusleiste erstellen
         self.status_bar = QStatusBar()
@@ -307,10 +4343,31 @@ class MainWindow(QMainWindow):
         btn_save.clicked.connect(self.save_json)
         btn_svg = QPushButton("SVG Export")
         btn_svg.clicked.connect(self.export_svg)
+        btn_import = QPushButton("Importieren")
+        btn_import.clicked.connect(self.import_graph)
+        btn_export = QPushButton("Exportieren")
+        btn_export.clicked.connect(self.export_graph)
+        
+        # Knotensuche: Treffer aus dem Label-Index während der Eingabe
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("Knoten suchen...")
+        self.search_box.setClearButtonEnabled(True)
+        self.search_results = {}
+        self.search_model = QStringListModel(self)
+        completer = QCompleter(self.search_model, self)
+        completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        completer.setMaxVisibleItems(15)
+        completer.activated.connect(self.jump_to_search_result)
+        self.search_box.setCompleter(completer)
+        self.search_box.textEdited.connect(self.update_search)
+        self.search_box.returnPressed.connect(lambda: self.jump_to_search_result(self.search_box.text()))
         
         toolbar.addWidget(btn_load)
         toolbar.addWidget(btn_save)
         toolbar.addWidget(btn_svg)
+        toolbar.addWidget(btn_import)
+        toolbar.addWidget(btn_export)
+        toolbar.addWidget(self.search_box)
         
         layout.addLayout(toolbar)
         layout.addWidget(self.canvas)
@@ -318,38 +4375,208 @@ class MainWindow(QMainWindow):
         container = QWidget()
         container.setLayout(layout)
         self.setCentralWidget(container)
+        
+        self.minimap = Minimap(self.canvas)
+        self.minimap_dock = QDockWidget("Übersicht", self)
+        self.minimap_dock.setObjectName("minimap")
+        self.minimap_dock.setWidget(self.minimap)
+        self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.minimap_dock)
+        
+        self.statistics = StatisticsPanel(self.canvas)
+        self.statistics_dock = QDockWidget("Statistik", self)
+        self.statistics_dock.setObjectName("statistics")
+        self.statistics_dock.setWidget(self.statistics)
+        self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.statistics_dock)
+        self.statistics_dock.hide()
+        
+        self.create_menus()
     
-    def set_app_icon(self):
-        pixmap = QPixmap(64, 64)
-        pixmap.fill(Qt.GlobalColor.transparent)
+    def create_menus(self):
+        edit_menu = self.menuBar().addMenu("Bearbeiten")
         
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        for text, shortcut, slot in (
+                ("Ausschneiden", QKeySequence.StandardKey.Cut, self.canvas.cut_selection),
+                ("Kopieren", QKeySequence.StandardKey.Copy, self.canvas.copy_selection),
+                ("Einfügen", QKeySequence.StandardKey.Paste, self.canvas.paste),
+                ("Duplizieren", "Ctrl+D", self.canvas.duplicate_selection)):
+            action = QAction(text, self)
+            action.setShortcut(shortcut)
+            action.triggered.connect(slot)
+            edit_menu.addAction(action)
+        edit_menu.addSeparator()
         
-        painter.setBrush(QBrush(QColor("#2c3e50")))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawRoundedRect(2, 2, 60, 60, 8, 8)
+        action_select_all = QAction("Alles auswählen", self)
+        action_select_all.setShortcut("Ctrl+A")
+        action_select_all.triggered.connect(self.canvas.select_all)
+        edit_menu.addAction(action_select_all)
         
-        node_positions = [(20, 20), (44, 20), (32, 40)]
-        painter.setBrush(QBrush(QColor("#ffffff")))
-        painter.setPen(QPen(QColor("#3498db"), 2))
-        for x, y in node_positions:
-            painter.drawEllipse(x-6, y-6, 12, 12)
+        action_invert = QAction("Auswahl umkehren", self)
+        action_invert.setShortcut("Ctrl+I")
+        action_invert.triggered.connect(self.canvas.invert_selection)
+        edit_menu.addAction(action_invert)
         
-        painter.setPen(QPen(QColor("#3498db"), 2))
-        painter.drawLine(20, 20, 44, 20)
-        painter.drawLine(20, 20, 32, 40)
-        painter.drawLine(44, 20, 32, 40)
+        action_component = QAction("Zusammenhangskomponente auswählen", self)
+        action_component.triggered.connect(lambda: self.canvas.select_neighbourhood())
+        edit_menu.addAction(action_component)
         
-        painter.end()
+        action_k_hop = QAction("k-Nachbarschaft auswählen...", self)
+        action_k_hop.triggered.connect(self.select_k_hop)
+        edit_menu.addAction(action_k_hop)
         
-        icon = QIcon(pixmap)
-        self.setWindowIcon(icon)
+        policy_menu = edit_menu.addMenu("Parallele Kanten")
+        policy_group = QActionGroup(self)
+        self.edge_policy_actions = {}
+        for policy, text in EDGE_POLICIES.items():
+            action = QAction(text, self)
+            action.setCheckable(True)
+            action.setChecked(policy == self.canvas.edge_policy)
+            action.triggered.connect(functools.partial(self.canvas.set_edge_policy, policy))
+            policy_group.addAction(action)
+            policy_menu.addAction(action)
+            self.edge_policy_actions[policy] = action
         
-        try:
-            pixmap.save("ndraw_icon.png")
-        except:
-            pass
+        action_layout = QAction("Komponenten anordnen", self)
+        action_layout.setShortcut("Ctrl+L")
+        action_layout.setStatusTip("Jede Zusammenhangskomponente einzeln anordnen und dicht packen")
+        action_layout.triggered.connect(self.layout_components)
+        edit_menu.addAction(action_layout)
+        
+        edit_menu.addSeparator()
+        action_search = QAction("Knoten suchen", self)
+        action_search.setShortcut("Ctrl+F")
+        action_search.triggered.connect(self.focus_search)
+        edit_menu.addAction(action_search)
+        
+        view_menu = self.menuBar().addMenu("Ansicht")
+        
+        for text, shortcut, slot in (("Alles anzeigen", "Ctrl+0", self.canvas.fit_all),
+                                     ("Originalgröße", "Ctrl+1", self.canvas.zoom_reset),
+                                     ("Auswahl anzeigen", "Ctrl+2", self.canvas.fit_selection)):
+            action = QAction(text, self)
+            action.setShortcut(shortcut)
+            action.triggered.connect(slot)
+            view_menu.addAction(action)
+        view_menu.addSeparator()
+        
+        self.action_minimap = self.minimap_dock.toggleViewAction()
+        self.action_minimap.setShortcut("F4")
+        view_menu.addAction(self.action_minimap)
+        
+        self.action_statistics = self.statistics_dock.toggleViewAction()
+        self.action_statistics.setShortcut("F5")
+        view_menu.addAction(self.action_statistics)
+        
+        self.action_hud = QAction("Statistik-Overlay", self)
+        self.action_hud.setCheckable(True)
+        self.action_hud.setShortcut("F3")
+        self.action_hud.toggled.connect(self.canvas.set_hud_visible)
+        view_menu.addAction(self.action_hud)
+        
+        self.action_item_cache = QAction("Item-Cache", self)
+        self.action_item_cache.setCheckable(True)
+        self.action_item_cache.setStatusTip("Knoten als Pixmap cachen; hilft nur bei kurzen Kanten (z.B. Gitter)")
+        self.action_item_cache.toggled.connect(self.canvas.set_item_caching)
+        view_menu.addAction(self.action_item_cache)
+        
+        self.action_background = QAction("Statischer Hintergrund", self)
+        self.action_background.setCheckable(True)
+        self.action_background.setStatusTip("Ruhende Elemente aus gecachten Kacheln zeichnen")
+        self.action_background.toggled.connect(self.canvas.set_background_caching)
+        view_menu.addAction(self.action_background)
+        
+        self.action_semantic_zoom = QAction("Semantischer Zoom", self)
+        self.action_semantic_zoom.setCheckable(True)
+        self.action_semantic_zoom.setStatusTip("Herausgezoomt benachbarte Knoten zu Clustern zusammenfassen")
+        self.action_semantic_zoom.toggled.connect(self.canvas.set_semantic_zoom)
+        view_menu.addAction(self.action_semantic_zoom)
+        
+        self.action_virtual = QAction("Virtualisierte Darstellung", self)
+        self.action_virtual.setCheckable(True)
+        self.action_virtual.setStatusTip("Nur Elemente im sichtbaren Bereich als Items anlegen")
+        self.action_virtual.toggled.connect(self.canvas.set_virtual)
+        view_menu.addAction(self.action_virtual)
+        
+        analysis_menu = self.menuBar().addMenu("Analyse")
+        
+        self.action_path_mode = QAction("Kürzesten Weg zeigen", self)
+        self.action_path_mode.setCheckable(True)
+        self.action_path_mode.setShortcut("Ctrl+P")
+        self.action_path_mode.setStatusTip("Zwei Knoten nacheinander auswählen (Strg+Klick)")
+        self.action_path_mode.toggled.connect(self.canvas.set_path_mode)
+        analysis_menu.addAction(self.action_path_mode)
+        
+        action_downstream = QAction("Nachfolger hervorheben", self)
+        action_downstream.setShortcut("Ctrl+Down")
+        action_downstream.triggered.connect(lambda: self.canvas.highlight_reachable("out"))
+        analysis_menu.addAction(action_downstream)
+        
+        action_upstream = QAction("Vorgänger hervorheben", self)
+        action_upstream.setShortcut("Ctrl+Up")
+        action_upstream.triggered.connect(lambda: self.canvas.highlight_reachable("in"))
+        analysis_menu.addAction(action_upstream)
+        
+        extras_menu = self.menuBar().addMenu("Extras")
+        
+        self.action_profiling = QAction("Profiling (cProfile)", self)
+        self.action_profiling.setCheckable(True)
+        self.action_profiling.setChecked(PERF.profiling)
+        self.action_profiling.toggled.connect(self.toggle_profiling)
+        extras_menu.addAction(self.action_profiling)
+        
+        action_export = QAction("Laufzeitstatistik exportieren...", self)
+        action_export.triggered.connect(self.export_perf_stats)
+        extras_menu.addAction(action_export)
+        
+        action_reset = QAction("Laufzeitstatistik zurücksetzen", self)
+        action_reset.triggered.connect(PERF.reset)
+        extras_menu.addAction(action_reset)
+    
+    def focus_search(self):
+        self.search_box.setFocus()
+        self.search_box.selectAll()
+    
+    def update_search(self, text):
+        """Füllt die Vorschlagsliste mit den Treffern des Label-Index."""
+        self.search_results = {}
+        model = self.canvas.model
+        for node in self.canvas.label_index.search(text):
+            if model is None:
+                label, node_id = node.label_text, node.node_id
+            else:
+                label, node_id = model.labels[node], model.node_ids[node]
+            self.search_results[f"{label} (#{node_id})"] = node
+        self.search_model.setStringList(list(self.search_results))
+    
+    def jump_to_search_result(self, text):
+        node = self.search_results.get(text)
+        if node is None and self.search_results:
+            # Enter ohne Auswahl springt zum ersten Treffer
+            node = next(iter(self.search_results.values()))
+        if (node is None or node not in self.canvas.label_index.entries
+                or isinstance(node, Node) and sip.isdeleted(node)):
+            self.show_status(f"Kein Knoten gefunden: {text}", success=False)
+            return
+        node = self.canvas.focus_node(node)
+        self.show_status(f"Knoten {node.label_text} (#{node.node_id})", success=True)
+    
+    def select_k_hop(self):
+        hops, ok = QInputDialog.getInt(self, "k-Nachbarschaft", "Anzahl Schritte k:", 1, 1, 1000)
+        if ok:
+            self.canvas.select_neighbourhood(hops)
+    
+    def toggle_profiling(self, enabled):
+        if enabled:
+            PERF.start_profiling()
+            self.show_status("Profiling aktiv", success=True)
+        else:
+            PERF.stop_profiling()
+            self.show_status("Profiling beendet", success=True)
+    
+    def export_perf_stats(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Laufzeitstatistik exportieren", "", "JSON Files (*.json)")
+        if path:
+            PERF.export(path)
+            self.show_status(f"✓ Statistik exportiert: {Path(path).name}", success=True)
     
     def show_status(self, message, success=True, duration=5000):
         """Zeigt eine Statusmeldung an."""
@@ -375,117 +4602,217 @@ class MainWindow(QMainWindow):
             """)
         self.status_bar.showMessage(message, duration)
 
+    @timed("is_connected")
     def is_connected(self):
-        if not self.canvas.nodes: return True
-        adj = {n: [] for n in self.canvas.nodes}
-        for e in self.canvas.edges:
-            adj[e.source].append(e.target)
-            adj[e.target].append(e.source)
-        visited = set()
-        stack = [self.canvas.nodes[0]]
-        while stack:
-            n = stack.pop()
-            if n not in visited:
-                visited.add(n)
-                stack.extend(adj[n])
-        return len(visited) == len(self.canvas.nodes)
+        return self.canvas.adjacency().is_connected()
 
     def load_json(self):
         path, _ = QFileDialog.getOpenFileName(self, "JSON Laden", "", "JSON Files (*.json)")
         if not path: return
         try:
-            with open(path, "r") as f:
-                data = json.load(f)
-            self.canvas.scene.clear()
-            self.canvas.nodes = []
-            self.canvas.edges = []
-            # BUGFIX: Reset connection_source beim Laden
-            self.canvas.connection_source = None
-            
-            node_map = {}
-            for n_data in data["nodes"]:
-                label = n_data.get("label", str(n_data["id"]))
-                node = self.canvas.add_new_node(n_data["x"], n_data["y"], n_data["id"], label)
-                node_map[n_data["id"]] = node
-            for e_data in data["edges"]:
-                self.canvas.add_new_edge(node_map[e_data["from"]], node_map[e_data["to"]])
+            self.load_json_file(path)
             self.show_status(f"✓ Geladen: {Path(path).name}", success=True)
         except Exception as e:
             self.show_status(f"❌ Fehler beim Laden: {str(e)[:50]}", success=False, duration=8000)
 
+    @timed("load_json")
+    def load_json_file(self, path):
+        """Lädt ein Netzwerk ohne Dialog (auch headless nutzbar)."""
+        with open(path, "r") as f:
+            data = json.load(f)
+        # BUGFIX: clear_network setzt auch connection_source zurück
+        self.canvas.clear_network()
+        
+        node_map = {}
+        for n_data in data["nodes"]:
+            label = n_data.get("label", str(n_data["id"]))
+            node = self.canvas.add_new_node(n_data["x"], n_data["y"], n_data["id"], label)
+            node_map[n_data["id"]] = node
+        # Alle Knoten sind eben angelegt, die Existenzprüfung von add_new_edge entfällt
+        for e_data in data["edges"]:
+            self.canvas.insert_edge(node_map[e_data["from"]], node_map[e_data["to"]])
+        self.canvas.label_index.flush()
+
+    def import_graph(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Importieren", "",
+            "Graphen (*.graphml *.xml *.dot *.gv *.csv *.tsv *.txt);;"
+            "GraphML (*.graphml *.xml);;DOT (*.dot *.gv);;Kantenliste (*.csv *.tsv *.txt)")
+        if not path: return
+        try:
+            self.import_graph_file(path)
+            stats = self.canvas.stats
+            self.show_status(f"✓ Importiert: {Path(path).name} ({stats.node_count} Knoten, "
+                             f"{stats.edge_count} Kanten)", success=True)
+        except Exception as e:
+            self.show_status(f"❌ Fehler beim Import: {str(e)[:50]}", success=False, duration=8000)
+
+    @timed("import_graph")
+    def import_graph_file(self, path):
+        """Importiert GraphML, DOT oder eine CSV-Kantenliste ohne Dialog.
+        
+        Große Graphen werden virtualisiert geladen; geliefert werden die
+        angelegten Knoten-Items.
+        """
+        graph = read_graph_file(path)
+        if self.canvas.edge_policy != "allow":
+            # Vor dem Einfügen, damit auch das Modell des virtualisierten Modus schlank bleibt
+            graph.collapse_parallel_edges(merge=self.canvas.edge_policy == "merge")
+        self.canvas.clear_network()
+        virtual = len(graph) > VIRTUAL_IMPORT_THRESHOLD
+        with QSignalBlocker(self.action_virtual):
+            self.action_virtual.setChecked(virtual)
+        if virtual:
+            self.canvas.set_model(GraphModel.from_graph(graph))
+            return self.canvas.nodes
+        return self.canvas.add_graph(graph)
+
+    def open_file(self, path):
+        """Öffnet JSON oder ein importierbares Format, z. B. von der Kommandozeile."""
+        try:
+            if Path(path).suffix.lower() == ".json":
+                self.load_json_file(path)
+            else:
+                self.import_graph_file(path)
+        except Exception as e:
+            self.show_status(f"❌ Fehler beim Laden: {str(e)[:50]}", success=False, duration=8000)
+            return False
+        stats = self.canvas.stats
+        self.show_status(f"✓ Geladen: {Path(path).name} ({stats.node_count} Knoten, "
+                         f"{stats.edge_count} Kanten)", success=True)
+        return True
+
+    def export_graph(self):
+        if not self.canvas.stats.node_count:
+            self.show_status("❌ Kein Netzwerk vorhanden", success=False)
+            return
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Exportieren", "",
+            "GraphML (*.graphml);;DOT (*.dot *.gv);;Kantenliste CSV (*.csv);;Kantenliste TSV (*.tsv)")
+        if not path: return
+        snapshot = self.canvas.snapshot()
+        self.write_in_background(lambda path, snapshot: write_graph_file(path, snapshot.nodes, snapshot.edges),
+                                 path, snapshot, f"✓ Exportiert: {Path(path).name}")
+
+    @timed("export_graph")
+    def export_graph_file(self, path):
+        """Exportiert als GraphML, DOT oder Kantenliste ohne Dialog."""
+        write_graph_file(path, self.canvas.node_records(), self.canvas.edge_records())
+
     def save_json(self):
         if not self.is_connected():
             self.show_status("❌ Netzwerk nicht zusammenhängend", success=False, duration=6000)
             return
         path, _ = QFileDialog.getSaveFileName(self, "JSON Speichern", "", "JSON Files (*.json)")
         if path:
-            data = {
-                "nodes": [{"id": n.node_id, "x": n.pos().x(), "y": n.pos().y(), "label": n.label_text} 
-                         for n in self.canvas.nodes],
-                "edges": [{"from": e.source.node_id, "to": e.target.node_id} 
-                         for e in self.canvas.edges]
-            }
-            with open(path, "w") as f:
-                json.dump(data, f, indent=4)
-            self.show_status(f"✓ Gespeichert: {Path(path).name}", success=True)
+            self.write_in_background(write_json_file, path, self.canvas.snapshot(),
+                                     f"✓ Gespeichert: {Path(path).name}")
+
+    @timed("save_json")
+    def save_json_file(self, path):
+        """Schreibt das Netzwerk ohne Dialog als JSON."""
+        write_json_file(path, self.canvas.snapshot())
 
     def export_svg(self):
-        if not self.canvas.nodes: 
+        if not self.canvas.stats.node_count:
             self.show_status("❌ Kein Netzwerk vorhanden", success=False)
             return
         if not self.is_connected():
             self.show_status("❌ Netzwerk nicht zusammenhängend", success=False, duration=6000)
             return
 
-        xs = [n.pos().x() for n in self.canvas.nodes]
-        ys = [n.pos().y() for n in self.canvas.nodes]
-        padding = 30
-        min_x, max_x = min(xs) - padding, max(xs) + padding
-        min_y, max_y = min(ys) - padding, max(ys) + padding
-        width = max_x - min_x
-        height = max_y - min_y
-
         path, _ = QFileDialog.getSaveFileName(self, "SVG Export", "", "SVG Files (*.svg)")
         if path:
-            with open(path, "w") as f:
-                f.write('<?xml version="1.0" encoding="UTF-8" ?>\n')
-                f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="{min_x} {min_y} {width} {height}">\n')
-                f.write('<defs><marker id="arrow" viewBox="0 0 10 10" refX="9" refY="5" markerWidth="6" markerHeight="6" orient="auto-start-reverse"><path d="M 0 0 L 10 5 L 0 10 z" fill="black" /></marker></defs>\n')
-                
-                for e in self.canvas.edges:
-                    line = QLineF(e.source.pos(), e.target.pos())
-                    l = line.length()
-                    if l > 40:
-                        p1, p2 = line.pointAt(20/l), line.pointAt(1-20/l)
-                        f.write(f'  <line x1="{p1.x()}" y1="{p1.y()}" x2="{p2.x()}" y2="{p2.y()}" stroke="black" stroke-width="2" marker-end="url(#arrow)" />\n')
-                
-                for n in self.canvas.nodes:
-                    f.write(f'  <circle cx="{n.pos().x()}" cy="{n.pos().y()}" r="20" fill="#ffffff" stroke="#2c3e50" stroke-width="2" />\n')
-                    f.write(f'  <text x="{n.pos().x()}" y="{n.pos().y()}" font-family="Arial" font-size="10" font-weight="bold" text-anchor="middle" fill="#2c3e50" dy=".35em">{n.label_text}</text>\n')
-                
-                f.write('</svg>')
-            self.show_status(f"✓ SVG exportiert: {Path(path).name}", success=True)
+            self.write_in_background(write_svg_file, path, self.canvas.snapshot(svg=True),
+                                     f"✓ SVG exportiert: {Path(path).name}")
 
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    
-    icon_paths = [
-        Path.home() / ".local/share/icons/ndraw_icon.png",
-        Path(__file__).parent / "ndraw_icon.png",
-        Path(__file__).parent.parent / "ndraw_icon.png",
-        Path("ndraw_icon.png"),
-    ]
-    
-    icon_loaded = False
-    for icon_path in icon_paths:
-        if icon_path.exists():
-            app.setWindowIcon(QIcon(str(icon_path)))
-            icon_loaded = True
-            break
-    
-    if not icon_loaded:
-        print("Hinweis: Icon nicht gefunden. Bitte führe 'python3 generate_icon.py' aus.")
+    @timed("export_svg")
+    def export_svg_file(self, path):
+        """Schreibt das Netzwerk ohne Dialog als SVG (gecropped auf den Inhalt).
+        
+        Knoten und Kanten cachen ihr SVG-Fragment; nach kleinen Änderungen
+        werden nur die betroffenen Elemente neu serialisiert.
+        """
+        write_svg_file(path, self.canvas.snapshot(svg=True))
+
+    def write_in_background(self, writer, path, snapshot, done):
+        """Übergibt den Snapshot writer(path, snapshot) im Worker-Thread.
+        
+        Weiterbearbeiten ist sofort möglich; Aufträge laufen nacheinander,
+        das Ergebnis meldet die Statusleiste.
+        """
+        if self.writer is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self.writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ndraw-writer")
+        self.show_status(f"Schreibe {Path(path).name} …", success=True, duration=0)
+        return self.writer.submit(self.run_writer, writer, path, snapshot, done)
+
+    def run_writer(self, writer, path, snapshot, done):
+        # Läuft im Worker-Thread; das Signal wird in den GUI-Thread zugestellt
+        try:
+            writer(path, snapshot)
+        except Exception as e:
+            self.write_finished.emit(f"❌ Fehler beim Schreiben: {str(e)[:50]}", False)
+            raise
+        self.write_finished.emit(done, True)
+
+    def layout_components(self):
+        """Startet das Komponenten-Layout im Hintergrund; Weiterarbeiten bleibt möglich.
+        
+        Ein Thread verteilt die Komponenten auf den Prozesspool (ein Prozess
+        je Kern, gestartet per spawn, da der Qt-Prozess Threads hält) und
+        meldet die Positionen über layout_finished zurück.
+        """
+        snapshot = self.canvas.adjacency()
+        if not len(snapshot):
+            self.show_status("Kein Inhalt vorhanden", success=False)
+            return None
+        workers = os.cpu_count() or 1
+        if self.layouter is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self.layouter = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ndraw-layout")
+        if self.layout_pool is None and workers > 1 and len(snapshot) >= LAYOUT_PARALLEL_MIN:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            self.layout_pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+        self.show_status("Ordne Komponenten an …", success=True, duration=0)
+        return self.layouter.submit(self.run_layout, snapshot, workers)
+
+    def run_layout(self, snapshot, workers):
+        # Läuft im Worker-Thread; das Signal wird in den GUI-Thread zugestellt
+        try:
+            positions = component_layout(snapshot, self.layout_pool, workers)
+        except Exception:
+            self.layout_finished.emit(snapshot, None)
+            raise
+        self.layout_finished.emit(snapshot, positions)
+
+    def apply_layout(self, snapshot, positions):
+        if positions is None:
+            self.show_status("❌ Layout fehlgeschlagen", success=False)
+        elif snapshot.version != self.canvas.graph_version():
+            # Knoten oder Kanten wurden inzwischen geändert
+            self.show_status("Netzwerk geändert, Layout verworfen", success=False)
+        else:
+            self.canvas.apply_positions(snapshot.nodes, *positions)
+            self.canvas.fit_all()
+            self.show_status(f"✓ {len(snapshot)} Knoten angeordnet", success=True)
+
+def main(argv=None):
+    """Startet ndraw; eine übergebene Datei wird erst nach dem ersten Frame geladen."""
+    if argv is None:
+        argv = sys.argv
+    PERF.configure_from_env()
+    app = QApplication.instance() or QApplication(argv)
+    app.setWindowIcon(app_icon())
     
     window = MainWindow()
+    paths = argv[1:]
+    if paths:
+        window.canvas.first_painted.connect(lambda: window.open_file(paths[0]))
     window.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    return app.exec()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
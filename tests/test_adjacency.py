@@ -0,0 +1,87 @@
+import pytest
+import sys
+from pathlib import Path
+from PyQt6.QtWidgets import QApplication
+
+# Importiere die Klassen aus ndraw.py
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from ndraw import NetworkCanvas
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Erstelle eine QApplication Instanz für alle Tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+@pytest.fixture
+def canvas(qapp):
+    """Erstelle eine neue NetworkCanvas Instanz für jeden Test."""
+    return NetworkCanvas()
+
+@pytest.fixture
+def graph(canvas):
+    """0 -> 1, 0 -> 2, 2 -> 1, 3 -> 0 sowie ein isolierter Knoten 4."""
+    nodes = [canvas.add_new_node(i * 100, 0, i) for i in range(5)]
+    edges = [canvas.add_new_edge(nodes[a], nodes[b]) for a, b in [(0, 1), (0, 2), (2, 1), (3, 0)]]
+    return nodes, edges
+
+
+class TestAdjacencySnapshot:
+    """Tests für die CSR-Adjazenz."""
+
+    def test_out_and_in_neighbours(self, canvas, graph):
+        """Test ob Nachfolger und Vorgänger aus den CSR-Arrays stimmen."""
+        adjacency = canvas.adjacency()
+        assert sorted(adjacency.successors(0)) == [1, 2]
+        assert sorted(adjacency.predecessors(1)) == [0, 2]
+        assert list(adjacency.successors(4)) == []
+
+    def test_edge_indices(self, canvas, graph):
+        """Test ob die Kantenindizes zu den Kanten des Canvas gehören."""
+        _, edges = graph
+        adjacency = canvas.adjacency()
+        start, end = adjacency.out_offsets[2], adjacency.out_offsets[3]
+        assert [adjacency.edges[i] for i in adjacency.out_edges[start:end]] == [edges[2]]
+
+    def test_degrees(self, canvas, graph):
+        """Test ob Aus- und Eingangsgrade berechnet werden."""
+        adjacency = canvas.adjacency()
+        assert list(adjacency.out_degree()) == [2, 0, 1, 1, 0]
+        assert list(adjacency.in_degree()) == [1, 2, 1, 0, 0]
+
+    def test_reachable_directions(self, canvas, graph):
+        """Test ob Erreichbarkeit die Kantenrichtung berücksichtigt."""
+        adjacency = canvas.adjacency()
+        assert list(adjacency.reachable([0]).nonzero()[0]) == [0, 1, 2]
+        assert list(adjacency.reachable([1], "in").nonzero()[0]) == [0, 1, 2, 3]
+        assert list(adjacency.reachable([3], max_depth=1).nonzero()[0]) == [0, 3]
+        assert not adjacency.is_connected()
+
+
+class TestAdjacencyCache:
+    """Tests für die Invalidierung über den Änderungszähler."""
+
+    def test_snapshot_is_cached(self, canvas, graph):
+        """Test ob ohne Änderung derselbe Snapshot geliefert wird."""
+        assert canvas.adjacency() is canvas.adjacency()
+
+    def test_mutations_invalidate(self, canvas, graph):
+        """Test ob Einfügen und Löschen einen neuen Snapshot erzwingen."""
+        nodes, edges = graph
+        first = canvas.adjacency()
+        canvas.add_new_edge(nodes[1], nodes[4])
+        second = canvas.adjacency()
+        assert second is not first
+        assert second.is_connected()
+        canvas.remove_items(edges=[canvas.edges[-1]])
+        assert not canvas.adjacency().is_connected()
+
+    def test_direct_list_changes_invalidate(self, canvas, graph):
+        """Test ob direkte Änderungen an canvas.nodes erkannt werden."""
+        canvas.adjacency()
+        canvas.scene.clear()
+        canvas.nodes = []
+        canvas.edges = []
+        assert len(canvas.adjacency()) == 0
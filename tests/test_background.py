@@ -0,0 +1,143 @@
+import pytest
+import sys
+from pathlib import Path
+from PyQt6.QtWidgets import QApplication, QGraphicsItem
+from PyQt6.QtCore import Qt, QPointF
+
+# Importiere die Klassen aus ndraw.py
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from ndraw import NetworkCanvas, MainWindow
+
+NO_CONTENTS = QGraphicsItem.GraphicsItemFlag.ItemHasNoContents
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Erstelle eine QApplication Instanz für alle Tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+@pytest.fixture
+def canvas(qapp):
+    """Canvas mit Kette 0 -> 1 -> 2 und isoliertem Knoten 3, Hintergrund aktiv."""
+    canvas = NetworkCanvas()
+    canvas.resize(600, 400)
+    nodes = [canvas.add_new_node(i * 120 - 180, 0, i) for i in range(4)]
+    canvas.add_new_edge(nodes[0], nodes[1])
+    canvas.add_new_edge(nodes[1], nodes[2])
+    canvas.centerOn(0, 0)
+    canvas.set_background_caching(True)
+    return canvas
+
+
+def rendered(qapp, canvas):
+    qapp.processEvents()
+    return canvas.viewport().grab().toImage()
+
+
+def live_rendering(qapp, canvas):
+    """Referenzbild ohne statischen Hintergrund; der Hintergrund bleibt danach aktiv."""
+    canvas.set_background_caching(False)
+    image = rendered(qapp, canvas)
+    canvas.set_background_caching(True)
+    return image
+
+
+class TestLiveItems:
+    """Tests für die Aufteilung in ruhende und lebende Items."""
+
+    def test_idle_items_paint_nothing(self, canvas):
+        """Test ob ruhende Items nicht selbst zeichnen, aber anklickbar bleiben."""
+        assert all(item.flags() & NO_CONTENTS for item in canvas.nodes + canvas.edges)
+        center = canvas.mapFromScene(canvas.nodes[1].pos())
+        assert canvas.itemAt(center) is canvas.nodes[1]
+
+    def test_selected_node_and_its_edges_are_live(self, canvas):
+        """Test ob ausgewählte Knoten samt Kanten live gezeichnet werden."""
+        canvas.select_items([canvas.nodes[1]])
+        assert canvas.background.live == {canvas.nodes[1], *canvas.edges}
+        assert not canvas.nodes[1].flags() & NO_CONTENTS
+        canvas.select_items([])
+        assert not canvas.background.live
+        assert canvas.nodes[1].flags() & NO_CONTENTS
+
+    def test_new_edge_of_live_node(self, canvas):
+        """Test ob eine neue Kante an einem gezogenen Knoten ebenfalls live ist."""
+        canvas.select_items([canvas.nodes[3]])
+        edge = canvas.add_new_edge(canvas.nodes[2], canvas.nodes[3])
+        assert edge in canvas.background.live
+
+    def test_dragged_edges_leave_index(self, qapp, canvas):
+        """Test ob Kanten eines gezogenen Knotens im LiveBucket liegen und danach zurückkehren."""
+        node = canvas.nodes[1]
+        canvas.select_items([node])
+        node.moveBy(10, 530)
+        bucket = canvas.background.live_bucket
+        assert all(edge.parentItem() is bucket for edge in node.lines)
+        edge = canvas.edges[0]
+        assert edge in canvas.scene.items(edge.line().center())
+        assert canvas.itemAt(0, 0) is bucket and bucket.acceptedMouseButtons() == Qt.MouseButton.NoButton
+        canvas.select_items([])
+        mid = (edge.source.pos() + edge.target.pos()) / 2
+        assert edge.parentItem() is canvas.bucket_for(mid.x(), mid.y(), 0)
+        assert edge in canvas.scene.items(edge.line().center())
+        assert rendered(qapp, canvas) == live_rendering(qapp, canvas)
+
+    def test_disable_restores_items(self, canvas):
+        """Test ob das Abschalten alle Items wieder selbst zeichnen lässt."""
+        canvas.select_items([canvas.nodes[0]])
+        canvas.set_background_caching(False)
+        assert not any(item.flags() & NO_CONTENTS for item in canvas.nodes + canvas.edges)
+        assert not canvas.background.tiles
+
+
+class TestTiles:
+    """Tests für das Zeichnen und Verwerfen der Kacheln."""
+
+    def test_matches_live_rendering(self, qapp, canvas):
+        """Test ob die Kacheln dasselbe Bild wie das Live-Zeichnen ergeben."""
+        image = rendered(qapp, canvas)
+        assert canvas.background.tiles
+        assert image == live_rendering(qapp, canvas)
+
+    def test_edits_invalidate_tiles(self, qapp, canvas):
+        """Test ob Verschieben, Umbenennen, Einfügen und Löschen neu gezeichnet werden."""
+        rendered(qapp, canvas)
+        canvas.nodes[3].setPos(QPointF(150, 60))
+        canvas.nodes[0].set_label("A")
+        canvas.add_new_node(-100, 100, 9)
+        canvas.remove_items(edges=[canvas.edges[1]])
+        assert rendered(qapp, canvas) == live_rendering(qapp, canvas)
+
+    def test_drag_keeps_tiles(self, qapp, canvas):
+        """Test ob das Ziehen eines lebenden Knotens keine Kacheln verwirft."""
+        canvas.select_items([canvas.nodes[1]])
+        rendered(qapp, canvas)
+        tiles = dict(canvas.background.tiles)
+        canvas.nodes[1].moveBy(10, 30)
+        assert canvas.background.tiles == tiles
+        canvas.select_items([])
+        assert rendered(qapp, canvas) == live_rendering(qapp, canvas)
+
+    def test_zoom_rescales_after_pause(self, qapp, canvas):
+        """Test ob nach einem Zoom erst nach der Pause neu gerendert wird."""
+        rendered(qapp, canvas)
+        canvas.scale(1.5, 1.5)
+        rendered(qapp, canvas)
+        assert canvas.background.scale == 1.0
+        assert canvas.background.rescale_timer.isActive()
+        canvas.background.rescale()
+        rendered(qapp, canvas)
+        assert canvas.background.scale == 1.5
+
+    def test_menu_action(self, qapp):
+        """Test ob der Hintergrund standardmäßig aus ist und sich über das Menü einschalten lässt."""
+        window = MainWindow()
+        assert not window.action_background.isChecked()
+        assert not window.canvas.background.enabled
+        window.action_background.setChecked(True)
+        assert window.canvas.background.enabled
+        window.action_background.setChecked(False)
+        assert not window.canvas.background.enabled
+        window.close()
@@ -0,0 +1,149 @@
+import pytest
+import sys
+import time
+from pathlib import Path
+from PyQt6 import sip
+from PyQt6.QtWidgets import QApplication
+
+# Importiere die Klassen aus ndraw.py
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from PyQt6.QtCore import QRectF
+from ndraw import NetworkCanvas, GraphStats, BUCKET_SIZE, REMOVE_FLUSH_MIN
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Erstelle eine QApplication Instanz für alle Tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+@pytest.fixture
+def canvas(qapp):
+    """Erstelle eine neue NetworkCanvas Instanz für jeden Test."""
+    return NetworkCanvas()
+
+
+def build_grid(canvas, cols, rows, spacing=80):
+    """Baut ein Gitter mit Kanten nach rechts und unten."""
+    nodes = [canvas.add_new_node((i % cols) * spacing, (i // cols) * spacing, i)
+             for i in range(cols * rows)]
+    for i in range(len(nodes)):
+        if (i + 1) % cols:
+            canvas.add_new_edge(nodes[i], nodes[i + 1])
+        if i + cols < len(nodes):
+            canvas.add_new_edge(nodes[i], nodes[i + cols])
+    return nodes
+
+
+class TestBatchDelete:
+    """Tests für das Löschen als Stapel."""
+
+    def test_remove_items_detaches_adjacency(self, canvas):
+        """Test ob Kanten gelöschter Knoten aus den Nachbarn entfernt werden."""
+        node1 = canvas.add_new_node(0, 0, 0)
+        node2 = canvas.add_new_node(100, 0, 1)
+        node3 = canvas.add_new_node(200, 0, 2)
+        canvas.add_new_edge(node1, node2)
+        edge = canvas.add_new_edge(node3, node1)
+        canvas.add_new_edge(node2, node2)
+
+        canvas.remove_items([node2])
+
+        assert canvas.nodes == [node1, node3]
+        assert canvas.edges == [edge]
+        assert node1.lines == [edge]
+        assert node3.lines == [edge]
+
+    def test_removed_items_are_deleted(self, canvas):
+        """Test ob entfernte Items nicht mehr in der Scene liegen."""
+        node1 = canvas.add_new_node(0, 0, 0)
+        node2 = canvas.add_new_node(100, 0, 1)
+        edge = canvas.add_new_edge(node1, node2)
+        canvas.remove_items([node1])
+        assert sip.isdeleted(node1) and sip.isdeleted(edge)
+        assert node2 in canvas.scene.items()
+
+    def test_remove_items_clears_connection_source(self, canvas):
+        """Test ob ein gelöschter Startknoten die Verbindung abbricht."""
+        node = canvas.add_new_node(0, 0, 0)
+        canvas.connection_source = node
+        canvas.remove_items([node])
+        assert canvas.connection_source is None
+
+    def test_remove_nothing(self, canvas):
+        """Test ob ein leerer Stapel nichts verändert."""
+        node = canvas.add_new_node(0, 0, 0)
+        canvas.remove_items()
+        assert canvas.nodes == [node]
+
+    def test_items_are_bucketed(self, canvas):
+        """Test ob Knoten in räumlichen Buckets liegen und Kanten darunter."""
+        node1 = canvas.add_new_node(0, 0, 0)
+        node2 = canvas.add_new_node(BUCKET_SIZE * 3, 0, 1)
+        edge = canvas.add_new_edge(node1, node2)
+        assert node1.parentItem() is not node2.parentItem()
+        assert edge.parentItem().zValue() < node1.parentItem().zValue()
+
+    def test_buckets_recreated_after_clear(self, canvas):
+        """Test ob nach scene.clear() neue Buckets angelegt werden."""
+        canvas.add_new_node(0, 0, 0)
+        canvas.scene.clear()
+        canvas.nodes = []
+        node = canvas.add_new_node(0, 0, 0)
+        assert node.scene() is canvas.scene
+
+    def test_stats_match_rebuild(self, canvas):
+        """Test ob die gestapelt fortgeschriebenen Kennzahlen einem Neuaufbau entsprechen."""
+        nodes = build_grid(canvas, 6, 6)
+        canvas.add_new_edge(nodes[7], nodes[7])
+        canvas.add_new_edge(nodes[9], nodes[4])
+        canvas.remove_items(nodes[::3], canvas.edges[:4])
+
+        expected = GraphStats()
+        for node in canvas.nodes:
+            expected.add_node(node)
+        for edge in canvas.edges:
+            expected.add_edge(edge.source, edge.target)
+        stats = canvas.stats
+        for name in ("node_count", "edge_count", "self_loops", "sources", "sinks", "isolated",
+                     "in_degree", "out_degree", "in_histogram", "out_histogram"):
+            assert getattr(stats, name) == getattr(expected, name), name
+
+    def test_fresh_items_removed_as_batch(self, canvas):
+        """Test ob ein großer Stapel gerade eingefügter, noch nicht indizierter Items sauber gelöscht wird."""
+        nodes = build_grid(canvas, 30, 30)
+        doomed = nodes[::2]
+        assert len(doomed) * 3 >= REMOVE_FLUSH_MIN
+        canvas.remove_items(doomed)
+        assert all(sip.isdeleted(node) for node in doomed)
+        found = {item for item in canvas.scene.items(QRectF(-50, -50, 2500, 2500))
+                 if item in set(canvas.nodes) | set(canvas.edges)}
+        assert found == set(canvas.nodes) | set(canvas.edges)
+
+    def test_moved_node_changes_bucket(self, canvas):
+        """Test ob ein verschobener Knoten samt Kanten in die Buckets der neuen Zelle wandert."""
+        node1 = canvas.add_new_node(0, 0, 0)
+        node2 = canvas.add_new_node(100, 0, 1)
+        edge = canvas.add_new_edge(node1, node2)
+        node2.setPos(BUCKET_SIZE * 5, BUCKET_SIZE * 3)
+        assert node2.parentItem() is canvas.bucket_for(BUCKET_SIZE * 5, BUCKET_SIZE * 3, 1)
+        assert edge.parentItem() is canvas.bucket_for(BUCKET_SIZE * 2.5, BUCKET_SIZE * 1.5, 0)
+        assert node1.parentItem() is canvas.bucket_for(0, 0, 1)
+        assert canvas.scene.items(QRectF(BUCKET_SIZE * 5 - 1, BUCKET_SIZE * 3 - 1, 2, 2)) == [node2]
+
+    @pytest.mark.slow
+    def test_delete_half_of_large_grid(self, canvas):
+        """Test ob das Löschen jedes zweiten Knotens in einem großen Gitter schnell ist."""
+        nodes = build_grid(canvas, 40, 40)
+        canvas.scene.items()
+        for node in nodes[::2]:
+            node.setSelected(True)
+
+        start = time.perf_counter()
+        canvas.delete_selected_items()
+        elapsed = time.perf_counter() - start
+
+        assert len(canvas.nodes) == 800
+        assert all(not sip.isdeleted(e) for e in canvas.edges)
+        assert elapsed < 1.0
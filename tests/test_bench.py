@@ -0,0 +1,91 @@
+import pytest
+import sys
+from pathlib import Path
+from PyQt6.QtWidgets import QApplication
+
+# Importiere die Benchmark-Suite aus dem Projektverzeichnis
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import bench_ndraw
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Erstelle eine QApplication Instanz für alle Tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+
+class TestGenerators:
+    """Tests für die synthetischen Netzwerke."""
+
+    @pytest.mark.parametrize("name", sorted(bench_ndraw.GENERATORS))
+    def test_generator_node_count(self, name):
+        """Test ob jeder Generator genau n Knoten erzeugt."""
+        nodes, edges = bench_ndraw.GENERATORS[name](100)
+        assert len(nodes) == 100
+        assert len(edges) > 0
+
+    @pytest.mark.parametrize("name", sorted(bench_ndraw.GENERATORS))
+    def test_generator_edges_reference_nodes(self, name):
+        """Test ob alle Kanten auf existierende Knoten zeigen."""
+        nodes, edges = bench_ndraw.GENERATORS[name](50)
+        ids = {n[0] for n in nodes}
+        assert all(a in ids and b in ids for a, b in edges)
+
+    def test_generator_deterministic(self):
+        """Test ob gleiche Seeds gleiche Graphen liefern."""
+        assert bench_ndraw.generate_random(30) == bench_ndraw.generate_random(30)
+
+
+class TestBaselineComparison:
+    """Tests für den Vergleich mit einer gespeicherten Baseline."""
+
+    def test_regression_detected(self):
+        """Test ob eine deutlich langsamere Messung als Regression gilt."""
+        baseline = {"grid/1000/save_json": {"seconds": 1.0, "peak_kib": 1}}
+        results = {"grid/1000/save_json": {"seconds": 2.0, "peak_kib": 1}}
+        regressions = bench_ndraw.compare(results, baseline, threshold=1.25)
+        assert len(regressions) == 1
+        assert regressions[0][0] == "grid/1000/save_json"
+
+    def test_within_threshold(self):
+        """Test ob kleine Schwankungen toleriert werden."""
+        baseline = {"grid/1000/save_json": {"seconds": 1.0, "peak_kib": 1}}
+        results = {"grid/1000/save_json": {"seconds": 1.1, "peak_kib": 1}}
+        assert bench_ndraw.compare(results, baseline, threshold=1.25) == []
+
+    def test_memory_regression_detected(self):
+        """Test ob eine deutlich höhere Speicherspitze als Regression gilt."""
+        baseline = {"grid/1000/save_json": {"seconds": 1.0, "peak_kib": 1000}}
+        results = {"grid/1000/save_json": {"seconds": 1.0, "peak_kib": 2000}}
+        regressions = bench_ndraw.compare(results, baseline, threshold=1.25)
+        assert [(key, metric) for key, metric, *_ in regressions] == [("grid/1000/save_json", "peak_kib")]
+
+    def test_small_memory_growth_tolerated(self):
+        """Test ob kleine absolute Zuwächse bei winzigen Spitzen keine Regression sind."""
+        baseline = {"grid/1000/save_json": {"seconds": 1.0, "peak_kib": 10}}
+        results = {"grid/1000/save_json": {"seconds": 1.0, "peak_kib": 100}}
+        assert bench_ndraw.compare(results, baseline) == []
+
+    def test_unknown_keys_ignored(self):
+        """Test ob Messungen ohne Baseline-Eintrag ignoriert werden."""
+        results = {"grid/1000/save_json": {"seconds": 1.0, "peak_kib": 1}}
+        assert bench_ndraw.compare(results, {}) == []
+
+
+@pytest.mark.slow
+def test_run_suite_smoke(qapp):
+    """Test ob die Suite auf einem kleinen Netzwerk durchläuft."""
+    results = bench_ndraw.run_suite([20], ["grid"], list(bench_ndraw.OPERATIONS), verbose=False)
+    assert set(results) == {f"grid/20/{op}" for op in bench_ndraw.OPERATIONS}
+    assert all(r["seconds"] >= 0 for r in results.values())
+
+
+@pytest.mark.slow
+def test_startup_smoke():
+    """Test ob die Startzeitmessung leer und mit übergebener Datei durchläuft."""
+    results = bench_ndraw.measure_startup([20], ["grid"], runs=1, verbose=False)
+    assert set(results) == {"startup/empty/first_paint", "startup/grid/20/first_paint",
+                            "startup/grid/20/loaded"}
+    assert results["startup/grid/20/first_paint"]["seconds"] <= results["startup/grid/20/loaded"]["seconds"]
@@ -0,0 +1,150 @@
+import pytest
+import sys
+from pathlib import Path
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QMimeData, QByteArray
+
+# Importiere die Klassen aus ndraw.py
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from ndraw import NetworkCanvas, MainWindow, GraphData, GraphModel, Node, DirectedEdge
+import ndraw
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Erstelle eine QApplication Instanz für alle Tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+@pytest.fixture
+def canvas(qapp):
+    """0 -> 1 -> 2, Schleife an 1 und 2 -> 3; ausgewählt sind 0, 1 und 2."""
+    canvas = NetworkCanvas()
+    canvas.resize(600, 400)
+    nodes = [canvas.add_new_node(i * 100, i * 10, i, f"n{i}") for i in range(4)]
+    for a, b in [(0, 1), (1, 2), (1, 1), (2, 3)]:
+        canvas.add_new_edge(nodes[a], nodes[b])
+    canvas.select_items(nodes[:3])
+    return canvas
+
+
+def label_edges(canvas, nodes):
+    return sorted((e.source.label_text, e.target.label_text) for e in canvas.edges
+                  if e.source in nodes and e.target in nodes)
+
+
+class TestPayload:
+    """Tests für das Binärformat der Zwischenablage."""
+
+    def test_roundtrip(self):
+        """Test ob Labels, Positionen und Kanten erhalten bleiben."""
+        graph = GraphData()
+        graph.node("a", 'Ä "x" <y>', 1.5, -2.0)
+        graph.node("b", "b", 3.0, 4.0)
+        graph.edge("a", "b")
+        graph.edge("b", "b")
+        copy = GraphData.from_bytes(graph.to_bytes())
+        assert copy.labels == graph.labels
+        assert (copy.xs, copy.ys) == (graph.xs, graph.ys)
+        assert list(zip(copy.sources, copy.targets)) == [(0, 1), (1, 1)]
+
+    def test_rejects_foreign_data(self):
+        """Test ob fremde und abgeschnittene Daten abgelehnt werden."""
+        graph = GraphData()
+        graph.edge("a", "b")
+        data = graph.to_bytes()
+        for bad in (b"", b"<svg/>", data[:len(ndraw.SUBGRAPH_MAGIC) + 4], data[:-3]):
+            with pytest.raises(ValueError):
+                GraphData.from_bytes(bad)
+
+
+class TestClipboard:
+    """Tests für Kopieren, Ausschneiden, Einfügen und Duplizieren."""
+
+    def test_copy_takes_inner_edges(self, canvas):
+        """Test ob nur Kanten zwischen ausgewählten Knoten kopiert werden."""
+        graph = canvas.copy_selection()
+        assert sorted(graph.labels) == ["n0", "n1", "n2"]
+        edges = sorted((graph.labels[s], graph.labels[t]) for s, t in zip(graph.sources, graph.targets))
+        assert edges == [("n0", "n1"), ("n1", "n1"), ("n1", "n2")]
+        assert QApplication.clipboard().mimeData().hasFormat(ndraw.SUBGRAPH_MIME)
+
+    def test_paste_with_new_ids(self, canvas):
+        """Test ob eingefügte Knoten neue IDs erhalten und ausgewählt sind."""
+        canvas.copy_selection()
+        pasted = canvas.paste()
+        assert len(pasted) == 3 and len(canvas.nodes) == 7
+        assert sorted(node.node_id for node in pasted) == [4, 5, 6]
+        assert label_edges(canvas, pasted) == [("n0", "n1"), ("n1", "n1"), ("n1", "n2")]
+        selected = canvas.scene.selectedItems()
+        assert set(pasted) == {item for item in selected if isinstance(item, Node)}
+        assert sum(isinstance(item, DirectedEdge) for item in selected) == 3
+        # Relative Lage bleibt erhalten
+        by_label = {node.label_text: node for node in pasted}
+        offset = by_label["n1"].pos() - by_label["n0"].pos()
+        assert (offset.x(), offset.y()) == (100, 10)
+
+    def test_cut(self, canvas):
+        """Test ob Ausschneiden die Auswahl entfernt und einfügbar bleibt."""
+        canvas.cut_selection()
+        assert [node.label_text for node in canvas.nodes] == ["n3"]
+        assert not canvas.edges
+        assert len(canvas.paste()) == 3
+
+    def test_duplicate_keeps_clipboard(self, canvas):
+        """Test ob Duplizieren versetzt einfügt und die Zwischenablage nicht ändert."""
+        QApplication.clipboard().setText("fremd")
+        copies = {node.label_text: node for node in canvas.duplicate_selection()}
+        offset = ndraw.DUPLICATE_OFFSET
+        assert copies["n2"].pos() == canvas.nodes[2].pos() + ndraw.QPointF(offset, offset)
+        assert QApplication.clipboard().text() == "fremd"
+        assert canvas.stats.node_count == 7 and canvas.stats.edge_count == 7
+
+    def test_paste_from_other_instance(self, canvas):
+        """Test ob Daten einer anderen Instanz (nur MIME-Daten) eingefügt werden."""
+        graph = GraphData()
+        for i in range(1000):
+            graph.node(str(i), None, i * 50.0, 0.0)
+        for i in range(999):
+            graph.edge(str(i), str(i + 1))
+        mime = QMimeData()
+        mime.setData(ndraw.SUBGRAPH_MIME, QByteArray(graph.to_bytes()))
+        QApplication.clipboard().setMimeData(mime)
+        assert len(canvas.paste()) == 1000
+        assert canvas.stats.edge_count == 4 + 999
+
+    def test_paste_without_subgraph(self, canvas):
+        """Test ob fremder Inhalt der Zwischenablage gemeldet wird."""
+        messages = []
+        canvas.status_message.connect(lambda text, ok: messages.append(ok))
+        QApplication.clipboard().setText("kein Netz")
+        assert canvas.paste() == []
+        assert messages == [False]
+
+    def test_virtual_copy_uses_model_edges(self, qapp):
+        """Test ob im virtualisierten Modus Kanten aus dem Modell kopiert werden."""
+        canvas = NetworkCanvas()
+        canvas.resize(600, 400)
+        graph = GraphData()
+        for i in range(20):
+            graph.node(str(i), None, i * 100.0, 0.0)
+            graph.edge(str(i), str((i + 1) % 20))
+        canvas.set_model(GraphModel.from_graph(graph))
+        canvas.centerOn(0, 0)
+        canvas.update_virtual_items()
+        canvas.select_items([canvas.virtual_nodes[0], canvas.virtual_nodes[1], canvas.virtual_nodes[19]])
+        copied = canvas.selected_subgraph()
+        edges = sorted((copied.labels[s], copied.labels[t]) for s, t in zip(copied.sources, copied.targets))
+        assert edges == [("0", "1"), ("19", "0")]
+
+    def test_menu_actions(self, qapp):
+        """Test ob die Bearbeiten-Aktionen Kopieren und Einfügen auslösen."""
+        window = MainWindow()
+        canvas = window.canvas
+        canvas.select_items([canvas.add_new_node(0, 0, 0)])
+        actions = {action.text(): action for action in window.menuBar().actions()[0].menu().actions()}
+        actions["Kopieren"].trigger()
+        actions["Einfügen"].trigger()
+        assert len(canvas.nodes) == 2
+        window.close()
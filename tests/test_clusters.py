@@ -0,0 +1,127 @@
+import pytest
+import sys
+from pathlib import Path
+from PyQt6.QtWidgets import QApplication, QGraphicsItem
+from PyQt6.QtCore import QPointF
+
+# Importiere die Klassen aus ndraw.py
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from ndraw import NetworkCanvas, MainWindow, ClusterIndex
+import ndraw
+
+NO_CONTENTS = QGraphicsItem.GraphicsItemFlag.ItemHasNoContents
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Erstelle eine QApplication Instanz für alle Tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+@pytest.fixture
+def canvas(qapp):
+    """Canvas mit einem 30 x 20 Gitter im Abstand 40, Kanten nach rechts und unten."""
+    canvas = NetworkCanvas()
+    canvas.resize(800, 600)
+    grid = {}
+    for x in range(30):
+        for y in range(20):
+            grid[x, y] = canvas.add_new_node(x * 40, y * 40, len(grid))
+    for (x, y), node in grid.items():
+        for other in (grid.get((x + 1, y)), grid.get((x, y + 1))):
+            if other is not None:
+                canvas.add_new_edge(node, other)
+    canvas.set_semantic_zoom(True)
+    return canvas
+
+
+def assert_same_clusters(index, reference):
+    for level in range(ndraw.CLUSTER_LEVELS):
+        cells = index.cells[level]
+        assert cells.keys() == reference.cells[level].keys()
+        for key, (count, sx, sy) in reference.cells[level].items():
+            assert cells[key][0] == count
+            assert cells[key][1:] == pytest.approx([sx, sy])
+        assert index.bundles[level] == reference.bundles[level]
+
+
+def zoom_to(canvas, zoom):
+    factor = zoom / canvas.transform().m11()
+    canvas.scale(factor, factor)
+    canvas.update_cluster_level()
+
+
+class TestClusterIndex:
+    """Tests für den Cluster-Quadtree."""
+
+    def test_bundle_weights(self, canvas):
+        """Test ob die Bündel genau die Kanten zwischen verschiedenen Zellen zählen."""
+        index = ClusterIndex()
+        index.build(canvas.nodes, canvas.edges)
+        level = 2
+        total = sum(sum(row.values()) for row in index.bundles[level].values()) // 2
+        between = sum(1 for edge in canvas.edges
+                      if index.keys[edge.source][0] >> level != index.keys[edge.target][0] >> level
+                      or index.keys[edge.source][1] >> level != index.keys[edge.target][1] >> level)
+        assert total == between > 0
+        assert sum(entry[0] for entry in index.cells[level].values()) == 600
+
+    def test_incremental_matches_rebuild(self, canvas):
+        """Test ob Verschieben, Einfügen und Löschen denselben Stand wie ein Neuaufbau ergeben."""
+        zoom_to(canvas, 0.1)
+        index = canvas.clusters
+        assert index.built
+        canvas.nodes[0].setPos(QPointF(1000, 700))
+        canvas.nodes[5].moveBy(3, -2)
+        canvas.nodes[40].setPos(QPointF(-500, -500))
+        node = canvas.add_new_node(333, 222, 600)
+        canvas.add_new_edge(node, canvas.nodes[7])
+        canvas.remove_items([canvas.nodes[100]], [canvas.edges[3]])
+        canvas.remove_edge(canvas.edges[10])
+        reference = ClusterIndex()
+        reference.build(canvas.nodes, canvas.edges)
+        assert_same_clusters(index, reference)
+
+
+class TestSemanticZoom:
+    """Tests für den Wechsel zwischen Items und Clustern."""
+
+    def test_level_follows_zoom(self, qapp, canvas):
+        """Test ob beim Herauszoomen Cluster gröberer Ebenen gezeichnet werden."""
+        zoom_to(canvas, 0.2)
+        level = canvas.cluster_level
+        assert level is not None
+        assert all(item.flags() & NO_CONTENTS for item in canvas.nodes + canvas.edges)
+        canvas.grab()
+        zoom_to(canvas, 0.05)
+        assert canvas.cluster_level > level
+        zoom_to(canvas, 1.0)
+        assert canvas.cluster_level is None
+        assert not any(item.flags() & NO_CONTENTS for item in canvas.nodes + canvas.edges)
+
+    def test_small_network_stays_items(self, qapp):
+        """Test ob kleine Netze auch weit herausgezoomt als Items gezeichnet werden."""
+        canvas = NetworkCanvas()
+        canvas.add_new_node(0, 0, 0)
+        canvas.set_semantic_zoom(True)
+        zoom_to(canvas, 0.05)
+        assert canvas.cluster_level is None and not canvas.clusters.built
+
+    def test_click_zooms_into_cluster(self, canvas):
+        """Test ob ein Klick auf die Cluster-Ansicht bis zu den Items hineinzoomt."""
+        zoom_to(canvas, 0.1)
+        canvas.zoom_into(QPointF(600, 400))
+        assert canvas.transform().m11() == pytest.approx(ndraw.CLUSTER_ZOOM_THRESHOLD)
+        assert canvas.cluster_level is None
+
+    def test_menu_action(self, qapp):
+        """Test ob der semantische Zoom standardmäßig aus ist und sich über das Menü einschalten lässt."""
+        window = MainWindow()
+        assert not window.action_semantic_zoom.isChecked()
+        assert not window.canvas.semantic_zoom
+        window.action_semantic_zoom.setChecked(True)
+        assert window.canvas.semantic_zoom
+        window.action_semantic_zoom.setChecked(False)
+        assert not window.canvas.semantic_zoom
+        window.close()
@@ -0,0 +1,140 @@
+import json
+import pytest
+import sys
+from pathlib import Path
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QImage, QPainter
+
+# Importiere die Klassen aus ndraw.py
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from ndraw import NetworkCanvas, MainWindow, GraphData, GraphModel
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Erstelle eine QApplication Instanz für alle Tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+@pytest.fixture
+def canvas(qapp):
+    """Canvas mit zwei Knoten a und b, noch ohne Kanten."""
+    canvas = NetworkCanvas()
+    canvas.add_new_node(0, 0, 0, "a")
+    canvas.add_new_node(200, 0, 1, "b")
+    return canvas
+
+
+def parallel_graph():
+    """a -> b dreimal, b -> a einmal."""
+    graph = GraphData()
+    for source, target in [("a", "b"), ("a", "b"), ("b", "a"), ("a", "b")]:
+        graph.edge(source, target)
+    return graph
+
+
+class TestPolicies:
+    """Tests für Ablehnen, Zusammenfassen und Erlauben paralleler Kanten."""
+
+    def test_reject(self, canvas):
+        """Test ob eine parallele Kante abgelehnt, die Gegenrichtung aber eingefügt wird."""
+        a, b = canvas.nodes
+        canvas.set_edge_policy("reject")
+        first = canvas.add_new_edge(a, b)
+        assert canvas.add_new_edge(a, b) is None
+        assert canvas.add_new_edge(b, a) is not None
+        assert len(canvas.edges) == 2 and first.multiplicity == 1
+
+    def test_merge_counts_and_exports(self, canvas):
+        """Test ob zusammengefasste Kanten ein Item bleiben und mehrfach exportiert werden."""
+        a, b = canvas.nodes
+        canvas.set_edge_policy("merge")
+        edge = canvas.add_new_edge(a, b)
+        assert canvas.add_new_edge(a, b) is edge
+        canvas.add_new_edge(a, b)
+        assert canvas.edges == [edge] and edge.multiplicity == 3
+        assert canvas.stats.edge_count == 1
+        assert list(canvas.edge_records()) == [(0, 1)] * 3
+
+    def test_removed_edge_leaves_index(self, canvas):
+        """Test ob nach dem Löschen wieder eine neue Kante angelegt wird."""
+        a, b = canvas.nodes
+        canvas.set_edge_policy("reject")
+        canvas.remove_edge(canvas.add_new_edge(a, b))
+        assert canvas.add_new_edge(a, b) is not None
+        canvas.remove_items(edges=list(canvas.edges))
+        assert canvas.add_new_edge(a, b) is not None
+
+    def test_unknown_policy(self, canvas):
+        """Test ob unbekannte Richtlinien abgelehnt werden."""
+        with pytest.raises(ValueError):
+            canvas.set_edge_policy("ignore")
+
+    def test_badge_painted(self, canvas):
+        """Test ob die Plakette nur bei Vielfachheit > 1 gezeichnet wird."""
+        a, b = canvas.nodes
+        canvas.set_edge_policy("merge")
+        edge = canvas.add_new_edge(a, b)
+        center = edge.line().center()
+        def pixel_below_line():
+            # Knapp unter der waagrechten Linie färbt nur die Plakette ein
+            image = QImage(20, 20, QImage.Format.Format_ARGB32)
+            image.fill(Qt.GlobalColor.white)
+            painter = QPainter(image)
+            canvas.scene.render(painter, QRectF(0, 0, 20, 20), QRectF(center.x() - 10, center.y() - 10, 20, 20))
+            painter.end()
+            return image.pixelColor(10, 14)
+        assert pixel_below_line().lightness() > 200
+        canvas.add_new_edge(a, b)
+        assert pixel_below_line().lightness() < 100
+
+
+class TestBulkLoad:
+    """Tests für die Richtlinien beim Import und im virtualisierten Modus."""
+
+    def test_collapse_parallel_edges(self):
+        """Test ob Duplikate in O(E) entfernt bzw. gezählt werden."""
+        graph = parallel_graph()
+        graph.collapse_parallel_edges(merge=True)
+        assert list(zip(graph.sources, graph.targets, graph.counts)) == [(0, 1, 3), (1, 0, 1)]
+        graph = parallel_graph()
+        graph.collapse_parallel_edges(merge=False)
+        assert list(zip(graph.sources, graph.targets)) == [(0, 1), (1, 0)] and graph.counts is None
+
+    def test_import_and_json_roundtrip(self, qapp, tmp_path):
+        """Test ob Import und JSON-Laden die Richtlinie anwenden und die Anzahl erhalten bleibt."""
+        window = MainWindow()
+        window.edge_policy_actions["merge"].trigger()
+        assert window.canvas.edge_policy == "merge"
+        path = tmp_path / "kanten.csv"
+        path.write_text("source,target\na,b\na,b\nb,a\na,b\n")
+        window.import_graph_file(path)
+        assert sorted(e.multiplicity for e in window.canvas.edges) == [1, 3]
+        window.save_json_file(tmp_path / "netz.json")
+        assert len(json.loads((tmp_path / "netz.json").read_text())["edges"]) == 4
+        window.load_json_file(tmp_path / "netz.json")
+        assert sorted(e.multiplicity for e in window.canvas.edges) == [1, 3]
+        window.edge_policy_actions["allow"].trigger()
+        window.load_json_file(tmp_path / "netz.json")
+        assert len(window.canvas.edges) == 4
+        window.close()
+
+    def test_virtual_mode(self, qapp):
+        """Test ob Vielfachheiten den Wechsel in den virtualisierten Modus und zurück überstehen."""
+        canvas = NetworkCanvas()
+        canvas.resize(600, 400)
+        graph = parallel_graph()
+        graph.collapse_parallel_edges()
+        canvas.set_model(GraphModel.from_graph(graph))
+        canvas.set_edge_policy("merge")
+        canvas.centerOn(0, 0)
+        canvas.update_virtual_items()
+        a, b = sorted(canvas.virtual_nodes.values(), key=lambda node: node.label_text)
+        edge = canvas.add_new_edge(a, b)
+        assert edge.multiplicity == 4 and canvas.model.m == 2
+        canvas.set_edge_policy("reject")
+        assert canvas.add_new_edge(b, a) is None
+        canvas.set_virtual(False)
+        assert sorted(e.multiplicity for e in canvas.edges) == [1, 4]
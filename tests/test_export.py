@@ -0,0 +1,185 @@
+import pytest
+import json
+import sys
+import threading
+import types
+from pathlib import Path
+from PyQt6.QtWidgets import QApplication
+
+# Importiere die Klassen aus ndraw.py
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from ndraw import (MainWindow, GraphModel, GraphSnapshot, graphml_lines, csv_lines, dot_quote, read_graph_file,
+                   write_graph_file, write_json_file)
+import ndraw
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Erstelle eine QApplication Instanz für alle Tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+@pytest.fixture
+def main_window(qapp):
+    """Erstelle ein MainWindow mit einem kleinen Netzwerk."""
+    window = MainWindow()
+    canvas = window.canvas
+    a = canvas.add_new_node(0, 0, 0, 'A "&" <B>')
+    b = canvas.add_new_node(100, 50, 1, "b,c")
+    canvas.add_new_node(200, 0, 2, "allein")
+    canvas.add_new_edge(a, b)
+    canvas.add_new_edge(b, a)
+    yield window
+    window.close()
+
+
+def labels_and_edges(graph):
+    edges = {(graph.labels[s], graph.labels[t]) for s, t in zip(graph.sources, graph.targets)}
+    return set(graph.labels), edges
+
+
+class TestStreamingExport:
+    """Tests für die Export-Generatoren."""
+
+    def test_writers_are_generators(self):
+        """Test ob die Schreiber das Dokument schrittweise liefern."""
+        lines = graphml_lines(iter([(0, "a", 0.0, 0.0)]), iter([]))
+        assert isinstance(lines, types.GeneratorType)
+        assert next(lines).startswith("<?xml")
+
+    @pytest.mark.parametrize("suffix", [".graphml", ".dot"])
+    def test_roundtrip_with_labels_and_positions(self, main_window, tmp_path, suffix):
+        """Test ob GraphML und DOT Labels, Positionen und Kanten erhalten."""
+        path = str(tmp_path / f"net{suffix}")
+        main_window.export_graph_file(path)
+        graph = read_graph_file(path)
+        assert labels_and_edges(graph) == (
+            {'A "&" <B>', "b,c", "allein"},
+            {('A "&" <B>', "b,c"), ("b,c", 'A "&" <B>')})
+        b = graph.index["1"]
+        assert (graph.xs[b], graph.ys[b]) == (100, 50)
+
+    @pytest.mark.parametrize("suffix", [".csv", ".tsv"])
+    def test_roundtrip_edge_list(self, main_window, tmp_path, suffix):
+        """Test ob Kantenlisten Kanten und isolierte Knoten erhalten."""
+        path = str(tmp_path / f"net{suffix}")
+        main_window.export_graph_file(path)
+        graph = read_graph_file(path)
+        assert labels_and_edges(graph) == ({"0", "1", "2"}, {("0", "1"), ("1", "0")})
+
+    def test_csv_quoting(self):
+        """Test ob Trennzeichen und Anführungszeichen maskiert werden."""
+        lines = list(csv_lines([], [("a,b", 'c"d')]))
+        assert lines[1] == '"a,b","c""d"\n'
+
+    def test_dot_quoting(self, tmp_path):
+        """Test ob Backslashes, Anführungszeichen und Zeilenumbrüche gültiges DOT ergeben."""
+        assert dot_quote('a\\"b\nc') == '"a\\\\\\"b\\nc"'
+        labels = ["C:\\temp\\", 'zwei\nZeilen "x"', "\\n wörtlich"]
+        path = tmp_path / "escape.dot"
+        write_graph_file(path, [(i, label, 0.0, 0.0) for i, label in enumerate(labels)], [(0, 1)])
+        assert set(read_graph_file(path).labels) == set(labels)
+
+    def test_unknown_format(self, tmp_path):
+        """Test ob unbekannte Endungen abgelehnt werden."""
+        with pytest.raises(ValueError):
+            write_graph_file(str(tmp_path / "net.xyz"), [], [])
+
+
+class TestSvgFragments:
+    """Tests für die gecachten SVG-Fragmente."""
+
+    def test_move_reserializes_only_touched_elements(self, main_window, tmp_path):
+        """Test ob nach dem Verschieben nur Knoten und anliegende Kanten neu serialisiert werden."""
+        canvas = main_window.canvas
+        main_window.export_svg_file(str(tmp_path / "first.svg"))
+        fragments = [item.svg_fragment for item in canvas.nodes + canvas.edges]
+        assert all(fragments)
+        canvas.nodes[0].setPos(30, 40)
+        assert canvas.nodes[0].svg_fragment is None
+        assert all(edge.svg_fragment is None for edge in canvas.edges)
+        assert canvas.nodes[2].svg_fragment is fragments[2]
+        main_window.export_svg_file(str(tmp_path / "second.svg"))
+        text = (tmp_path / "second.svg").read_text()
+        assert 'cx="30.0" cy="40.0"' in text and 'cx="0.0"' not in text
+
+    def test_formatted_in_writer_thread(self, qapp, main_window, tmp_path, monkeypatch):
+        """Test ob fehlende Fragmente im Worker formatiert und danach wiederverwendet werden."""
+        calls = []
+        for name in ("svg_node_fragment", "svg_edge_fragment"):
+            def record(*args, original=getattr(ndraw, name)):
+                calls.append(threading.current_thread())
+                return original(*args)
+            monkeypatch.setattr(ndraw, name, record)
+        snapshot = main_window.canvas.snapshot(svg=True)
+        assert not calls
+        assert all(slot == [None] for slot in snapshot.node_svg + snapshot.edge_svg)
+        main_window.write_in_background(ndraw.write_svg_file, tmp_path / "first.svg", snapshot, "fertig").result(5)
+        assert len(calls) == len(snapshot.node_svg) + len(snapshot.edge_svg)
+        assert threading.main_thread() not in calls
+        calls.clear()
+        main_window.export_svg_file(str(tmp_path / "second.svg"))
+        assert not calls
+        assert (tmp_path / "second.svg").read_text() == (tmp_path / "first.svg").read_text()
+        qapp.processEvents()
+
+    def test_rename_invalidates(self, main_window, tmp_path):
+        """Test ob eine neue Beschriftung im nächsten Export erscheint."""
+        main_window.export_svg_file(str(tmp_path / "first.svg"))
+        main_window.canvas.nodes[2].set_label("neu")
+        main_window.export_svg_file(str(tmp_path / "second.svg"))
+        text = (tmp_path / "second.svg").read_text()
+        assert ">neu</text>" in text and ">allein</text>" not in text
+
+    def test_virtual_matches_items(self, main_window, tmp_path):
+        """Test ob der virtualisierte Export dasselbe Dokument liefert."""
+        canvas = main_window.canvas
+        main_window.export_svg_file(str(tmp_path / "items.svg"))
+        canvas.set_model(GraphModel.from_records(list(canvas.node_records()), list(canvas.edge_records())))
+        main_window.export_svg_file(str(tmp_path / "virtual.svg"))
+        assert (tmp_path / "virtual.svg").read_text() == (tmp_path / "items.svg").read_text()
+
+
+class TestBackgroundWrite:
+    """Tests für Speichern und Export im Hintergrund."""
+
+    def test_snapshot_ignores_later_edits(self, main_window):
+        """Test ob spätere Änderungen den Snapshot nicht verändern."""
+        canvas = main_window.canvas
+        snapshot = canvas.snapshot(svg=True)
+        before = (snapshot.nodes, snapshot.edges, list(snapshot.node_svg))
+        canvas.nodes[0].setPos(500, 500)
+        canvas.nodes[1].set_label("neu")
+        canvas.remove_edge(canvas.edges[0])
+        assert (snapshot.nodes, snapshot.edges, snapshot.node_svg) == before
+
+    def test_edit_while_saving(self, qapp, main_window, tmp_path):
+        """Test ob während des Schreibens weiterbearbeitet werden kann und der Stand beim Start gilt."""
+        release = threading.Event()
+        def slow_writer(path, snapshot):
+            release.wait(5)
+            write_json_file(path, snapshot)
+        path = tmp_path / "net.json"
+        future = main_window.write_in_background(slow_writer, path, main_window.canvas.snapshot(), "fertig")
+        main_window.canvas.add_new_node(300, 300, 3)
+        release.set()
+        future.result(5)
+        assert len(json.loads(path.read_text())["nodes"]) == 3
+        qapp.processEvents()
+        assert main_window.status_bar.currentMessage() == "fertig"
+
+    def test_failed_write_keeps_file(self, qapp, main_window, tmp_path):
+        """Test ob ein Fehler mitten im Schreiben die alte Datei unverändert lässt."""
+        path = tmp_path / "net.json"
+        main_window.save_json_file(path)
+        original = path.read_text()
+        broken = GraphSnapshot([(0, "a", 0.0, 0.0), (1, object(), 1.0, 1.0)], [])
+        future = main_window.write_in_background(write_json_file, path, broken, "fertig")
+        with pytest.raises(TypeError):
+            future.result(5)
+        assert path.read_text() == original
+        assert [p.name for p in tmp_path.iterdir()] == ["net.json"]
+        qapp.processEvents()
+        assert main_window.status_bar.currentMessage().startswith("❌")
+
@@ -0,0 +1,182 @@
+import random
+import re
+import pytest
+import sys
+from pathlib import Path
+from PyQt6.QtWidgets import QApplication
+
+# Importiere die Klassen aus ndraw.py
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from ndraw import NetworkCanvas, MainWindow, GraphData, GraphModel, BoundsIndex
+import ndraw
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Erstelle eine QApplication Instanz für alle Tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+@pytest.fixture
+def canvas(qapp):
+    """Canvas 800x600 mit drei Knoten zwischen (0, 0) und (1000, 500)."""
+    canvas = NetworkCanvas()
+    canvas.resize(800, 600)
+    for i, (x, y) in enumerate([(0, 0), (1000, 200), (400, 500)]):
+        canvas.add_new_node(x, y, i)
+    return canvas
+
+
+def rescan(points):
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def viewbox(path):
+    return [float(v) for v in re.search(r'viewBox="([^"]*)"', path.read_text()).group(1).split()]
+
+
+class TestBoundsIndex:
+    """Tests für das inkrementell gepflegte Begrenzungsrechteck."""
+
+    def test_matches_rescan(self):
+        """Test ob Setzen, Verschieben und Entfernen dasselbe liefern wie ein Durchlauf."""
+        rng = random.Random(7)
+        index = BoundsIndex()
+        points = {}
+        assert index.extent() is None
+        for step in range(3000):
+            key = rng.randrange(200)
+            if rng.random() < 0.2:
+                index.discard(key)
+                points.pop(key, None)
+            else:
+                points[key] = (rng.uniform(-1e4, 1e4), rng.uniform(-1e4, 1e4))
+                index.set(key, *points[key])
+            if step % 50 == 0 and points:
+                assert index.extent() == rescan(points.values())
+        # Verzögert gelöschte Einträge wachsen nicht unbegrenzt
+        assert len(index.heaps[0]) <= 2 * len(points) + 65
+
+    def test_subset_follows(self):
+        """Test ob die Teilmenge beim Verschieben und Entfernen mitgeführt wird."""
+        subset = BoundsIndex()
+        index = BoundsIndex(subset)
+        index.set("a", 0.0, 0.0)
+        index.set("b", 10.0, 10.0)
+        subset.set("a", 0.0, 0.0)
+        index.set("a", -5.0, 3.0)
+        index.set("b", 99.0, 99.0)
+        assert subset.extent() == (-5.0, 3.0, -5.0, 3.0)
+        index.discard("a")
+        assert subset.extent() is None
+
+
+class TestCanvasBounds:
+    """Tests für die Begrenzung von Inhalt und Auswahl im Canvas."""
+
+    def test_moves_and_deletes(self, canvas):
+        """Test ob Verschieben und Löschen von Knoten die Begrenzung nachführen."""
+        a, b, c = canvas.nodes
+        assert canvas.content_extent() == (0.0, 0.0, 1000.0, 500.0)
+        b.setPos(-300, 50)
+        assert canvas.content_extent() == (-300.0, 0.0, 400.0, 500.0)
+        canvas.remove_node(c)
+        canvas.remove_items([a])
+        assert canvas.content_extent() == (-300.0, 50.0, -300.0, 50.0)
+        canvas.clear_network()
+        assert canvas.content_extent() is None
+
+    def test_selection_bounds(self, canvas):
+        """Test ob die Auswahl-Begrenzung Auswahl und Verschieben folgt."""
+        a, b, c = canvas.nodes
+        canvas.select_items([a, c])
+        assert canvas.selection_extent() == (0.0, 0.0, 400.0, 500.0)
+        c.setPos(600, 100)
+        b.setPos(5000, 5000)
+        assert canvas.selection_extent() == (0.0, 0.0, 600.0, 100.0)
+        canvas.select_items([canvas.add_new_edge(a, b)])
+        assert canvas.selection_extent() == (0.0, 0.0, 5000.0, 5000.0)
+
+
+class TestFit:
+    """Tests für Alles anzeigen, Auswahl anzeigen und Originalgröße."""
+
+    def test_fit_all(self, canvas):
+        """Test ob der gesamte Inhalt sichtbar ist und zoom_factor zur Transformation passt."""
+        assert canvas.fit_all()
+        assert canvas.zoom_factor == pytest.approx(canvas.transform().m11())
+        assert canvas.zoom_factor < 1.0
+        visible = canvas.mapToScene(canvas.viewport().rect()).boundingRect()
+        for node in canvas.nodes:
+            assert visible.contains(node.pos())
+
+    def test_fit_selection_clamped(self, canvas):
+        """Test ob ein einzelner Knoten höchstens auf max_zoom vergrößert wird."""
+        canvas.select_items([canvas.nodes[1]])
+        canvas.max_zoom = 2.0
+        assert canvas.fit_selection()
+        assert canvas.zoom_factor == pytest.approx(2.0) == pytest.approx(canvas.transform().m11())
+        center = canvas.mapToScene(canvas.viewport().rect().center())
+        assert abs(center.x() - 1000) < 2 and abs(center.y() - 200) < 2
+
+    def test_fit_all_clamped_and_reset(self, canvas):
+        """Test ob sehr große Netze auf min_zoom begrenzt werden und 100% wiederhergestellt wird."""
+        canvas.add_new_node(1e6, 1e6, 3)
+        canvas.fit_all()
+        assert canvas.zoom_factor == pytest.approx(canvas.min_zoom)
+        canvas.zoom_reset()
+        assert canvas.transform().m11() == pytest.approx(1.0) and canvas.zoom_factor == 1.0
+
+    def test_nothing_to_fit(self, qapp):
+        """Test ob leere Canvas und leere Auswahl gemeldet werden."""
+        canvas = NetworkCanvas()
+        messages = []
+        canvas.status_message.connect(lambda text, ok: messages.append(ok))
+        assert not canvas.fit_all()
+        assert not canvas.fit_selection()
+        assert messages == [False, False]
+
+    def test_virtual_mode(self, qapp):
+        """Test ob im virtualisierten Modus das Modell die Begrenzung liefert."""
+        canvas = NetworkCanvas()
+        canvas.resize(800, 600)
+        graph = GraphData()
+        for i in range(100):
+            graph.node(str(i), None, i * 100.0, (i % 10) * 30.0)
+        canvas.set_model(GraphModel.from_graph(graph))
+        assert canvas.content_extent() == (0.0, 0.0, 9900.0, 270.0)
+        canvas.fit_all()
+        canvas.update_virtual_items()
+        canvas.select_items([canvas.virtual_nodes[0], canvas.virtual_nodes[1]])
+        assert canvas.selection_extent() == (0.0, 0.0, 100.0, 30.0)
+
+    def test_menu_actions(self, qapp):
+        """Test ob die Ansicht-Aktionen den Zoom setzen."""
+        window = MainWindow()
+        window.canvas.add_new_node(0, 0, 0)
+        window.canvas.add_new_node(5000, 0, 1)
+        actions = {action.text(): action for action in window.menuBar().actions()[1].menu().actions()}
+        actions["Alles anzeigen"].trigger()
+        assert window.canvas.zoom_factor < 1.0
+        actions["Originalgröße"].trigger()
+        assert window.canvas.zoom_factor == 1.0
+        window.close()
+
+
+class TestSvgViewBox:
+    """Tests für den viewBox des SVG-Exports aus der gepflegten Begrenzung."""
+
+    def test_viewbox_from_bounds(self, canvas, tmp_path):
+        """Test ob der viewBox nach Verschieben dem Inhalt plus Rand entspricht."""
+        canvas.nodes[0].setPos(-100, -50)
+        snapshot = canvas.snapshot(svg=True)
+        assert snapshot.extent == (-100.0, -50.0, 1000.0, 500.0)
+        ndraw.write_svg_file(tmp_path / "netz.svg", snapshot)
+        assert viewbox(tmp_path / "netz.svg") == [-130.0, -80.0, 1160.0, 610.0]
+        # Ohne bekannte Begrenzung ergibt der Durchlauf dasselbe
+        snapshot.extent = None
+        ndraw.write_svg_file(tmp_path / "scan.svg", snapshot)
+        assert (tmp_path / "scan.svg").read_text() == (tmp_path / "netz.svg").read_text()
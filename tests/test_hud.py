@@ -0,0 +1,93 @@
+import pytest
+import sys
+from pathlib import Path
+from PyQt6.QtWidgets import QApplication
+
+# Importiere die Klassen aus ndraw.py
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from ndraw import NetworkCanvas, MainWindow, GraphData, GraphModel
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Erstelle eine QApplication Instanz für alle Tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+@pytest.fixture
+def canvas(qapp):
+    """Erstelle eine sichtbare NetworkCanvas Instanz für jeden Test."""
+    canvas = NetworkCanvas()
+    canvas.resize(400, 300)
+    canvas.show()
+    qapp.processEvents()
+    yield canvas
+    canvas.close()
+
+
+class TestStatisticsOverlay:
+    """Tests für das Frame-Time-Overlay."""
+
+    def test_hud_hidden_by_default(self, canvas):
+        """Test ob das Overlay standardmäßig aus ist."""
+        assert canvas.show_hud == False
+        assert not canvas.hud_timer.isActive()
+
+    def test_toggle_hud(self, canvas):
+        """Test ob das Overlay ein- und ausgeschaltet werden kann."""
+        canvas.set_hud_visible(True)
+        assert canvas.show_hud and canvas.hud_timer.isActive()
+        canvas.set_hud_visible(False)
+        assert not canvas.show_hud and not canvas.hud_timer.isActive()
+
+    def test_paint_records_frame(self, qapp, canvas):
+        """Test ob ein Paint-Event als Frame gezählt wird."""
+        canvas.add_new_node(0, 0, 0)
+        canvas.set_hud_visible(True)
+        canvas.viewport().repaint()
+        assert len(canvas.frame_times) >= 1
+        assert canvas.last_paint_ms > 0
+        assert canvas.items_painted == 1
+
+    def test_hud_refresh_is_not_a_frame(self, canvas):
+        """Test ob reine HUD-Aktualisierungen nicht als Frame zählen."""
+        canvas.set_hud_visible(True)
+        canvas.viewport().repaint()
+        frames = len(canvas.frame_times)
+        canvas.viewport().repaint(canvas.hud_rect)
+        assert len(canvas.frame_times) == frames
+
+    def test_fps_window(self, canvas):
+        """Test ob nur Frames der letzten Sekunde gezählt werden."""
+        canvas.frame_times.extend([0.0, 9.5, 9.8, 10.0])
+        assert canvas.current_fps(now=10.0) == 3
+
+    def test_hud_lines(self, canvas):
+        """Test ob das Overlay Zoom und Item-Zahlen anzeigt."""
+        canvas.add_new_node(0, 0, 0)
+        canvas.zoom_factor = 2.0
+        lines = canvas.hud_lines()
+        assert "Zoom: 200%" in lines
+        assert any(line.startswith("Items:") and line.endswith("/ 1") for line in lines)
+
+    def test_hud_lines_virtual(self, canvas):
+        """Test ob im virtualisierten Modus das ganze Modell gezählt wird."""
+        graph = GraphData()
+        for i in range(300):
+            graph.node(str(i), None, i * 200.0, 0.0)
+            graph.edge(str(i), str((i + 1) % 300))
+        canvas.set_model(GraphModel.from_graph(graph))
+        canvas.centerOn(0, 0)
+        canvas.update_virtual_items()
+        assert len(canvas.nodes) < 300
+        assert any(line.startswith("Items:") and line.endswith("/ 600") for line in canvas.hud_lines())
+
+    def test_menu_action_toggles_hud(self, qapp):
+        """Test ob die Menüaktion das Overlay steuert."""
+        window = MainWindow()
+        window.action_hud.setChecked(True)
+        assert window.canvas.show_hud
+        window.action_hud.setChecked(False)
+        assert not window.canvas.show_hud
+        window.close()
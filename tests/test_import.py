@@ -0,0 +1,193 @@
+import pytest
+import sys
+from pathlib import Path
+from PyQt6.QtWidgets import QApplication
+
+# Importiere die Klassen aus ndraw.py
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from ndraw import NetworkCanvas, MainWindow, GraphData, read_graph_file, read_csv_edges, dot_tokens
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Erstelle eine QApplication Instanz für alle Tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+@pytest.fixture
+def canvas(qapp):
+    """Erstelle eine neue NetworkCanvas Instanz für jeden Test."""
+    return NetworkCanvas()
+
+@pytest.fixture
+def main_window(qapp):
+    """Erstelle ein MainWindow für jeden Test."""
+    window = MainWindow()
+    yield window
+    window.close()
+
+
+def write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def edges_by_label(graph):
+    return [(graph.labels[s], graph.labels[t]) for s, t in zip(graph.sources, graph.targets)]
+
+
+GRAPHML = """<?xml version="1.0" encoding="UTF-8"?>
+<graphml xmlns="http://graphml.graphdrawing.org/xmlns">
+  <key id="d0" for="node" attr.name="label" attr.type="string"/>
+  <key id="d1" for="node" attr.name="x" attr.type="double"/>
+  <key id="d2" for="node" attr.name="y" attr.type="double"/>
+  <graph id="G" edgedefault="directed">
+    <node id="n0"><data key="d0">Start</data><data key="d1">10</data><data key="d2">20</data></node>
+    <node id="n1"><data key="d0">Ziel</data></node>
+    <edge source="n0" target="n1"/>
+    <edge source="n1" target="n2"/>
+  </graph>
+</graphml>
+"""
+
+
+class TestGraphML:
+    """Tests für den GraphML-Import."""
+
+    def test_labels_positions_and_edges(self, tmp_path):
+        """Test ob Labels, Positionen und Kanten gelesen werden."""
+        graph = read_graph_file(write(tmp_path, "g.graphml", GRAPHML))
+        assert graph.labels == ["Start", "Ziel", "n2"]
+        assert (graph.xs[0], graph.ys[0]) == (10, 20)
+        assert edges_by_label(graph) == [("Start", "Ziel"), ("Ziel", "n2")]
+
+    def test_yed_geometry(self, tmp_path):
+        """Test ob yEd-Geometrie als Knotenmittelpunkt übernommen wird."""
+        text = """<graphml xmlns="http://graphml.graphdrawing.org/xmlns"
+                           xmlns:y="http://www.yworks.com/xml/graphml">
+          <key id="d6" for="node" yfiles.type="nodegraphics"/>
+          <graph><node id="a"><data key="d6"><y:ShapeNode>
+            <y:Geometry x="100" y="50" width="30" height="20"/>
+            <y:NodeLabel>Alpha</y:NodeLabel>
+          </y:ShapeNode></data></node></graph></graphml>"""
+        graph = read_graph_file(write(tmp_path, "y.graphml", text))
+        assert graph.labels == ["Alpha"]
+        assert (graph.xs[0], graph.ys[0]) == (115, 60)
+
+
+class TestDot:
+    """Tests für den DOT-Import."""
+
+    def test_tokens_across_chunks(self, tmp_path):
+        """Test ob Tokens über Blockgrenzen hinweg korrekt erkannt werden."""
+        path = write(tmp_path, "t.dot", 'digraph { "lange ID" -> b /* x */ }')
+        with open(path) as f:
+            tokens = list(dot_tokens(f, chunk_size=3))
+        assert tokens == [("id", "digraph"), ("punct", "{"), ("string", "lange ID"),
+                          ("edgeop", "->"), ("id", "b"), ("punct", "}")]
+
+    def test_chains_subgraphs_and_attributes(self, tmp_path):
+        """Test ob Kantenketten, Subgraphen und Label/pos übernommen werden."""
+        text = """// Kommentar
+        strict digraph G {
+            node [shape=box];
+            a [label="Alpha", pos="10,20!"];
+            a -> b -> {c d};
+            subgraph cluster_0 { e -> a }
+            f [label=<<b>F</b>>]
+            rankdir = LR
+        }"""
+        graph = read_graph_file(write(tmp_path, "g.dot", text))
+        assert set(graph.labels) == {"Alpha", "b", "c", "d", "e", "<b>F</b>"}
+        a = graph.index["a"]
+        assert (graph.xs[a], graph.ys[a]) == (10, -20)
+        assert sorted(edges_by_label(graph)) == [
+            ("Alpha", "b"), ("b", "c"), ("b", "d"), ("e", "Alpha")]
+
+    def test_syntax_error(self, tmp_path):
+        """Test ob fehlerhaftes DOT abgelehnt wird."""
+        with pytest.raises(ValueError):
+            read_graph_file(write(tmp_path, "bad.dot", "digraph { a -> "))
+
+
+class TestCsv:
+    """Tests für den Import von Kantenlisten."""
+
+    def test_header_and_delimiter(self, tmp_path):
+        """Test ob Kopfzeile und Semikolon erkannt werden."""
+        text = "source;target\na;b\n# Kommentar\n\nb;c\nd\n"
+        graph = read_graph_file(write(tmp_path, "e.csv", text))
+        assert graph.labels == ["a", "b", "c", "d"]
+        assert edges_by_label(graph) == [("a", "b"), ("b", "c")]
+
+    def test_whitespace_separated_without_header(self, tmp_path):
+        """Test ob Kantenlisten ohne Kopfzeile mit Leerzeichen gelesen werden."""
+        graph = read_graph_file(write(tmp_path, "e.txt", "1 2\n2 3\n"))
+        assert edges_by_label(graph) == [("1", "2"), ("2", "3")]
+
+    def test_chunk_boundaries(self, tmp_path):
+        """Test ob beim blockweisen Lesen keine Zeilen verloren gehen."""
+        text = "".join(f"{i},{i + 1}\n" for i in range(2500))
+        graph = GraphData()
+        read_csv_edges(write(tmp_path, "e.csv", text), graph, chunk_rows=1000)
+        assert len(graph.sources) == 2500
+
+
+class TestDefaultLayout:
+    """Tests für das Standard-Layout von Knoten ohne Position."""
+
+    def test_unplaced_nodes_get_distinct_positions(self):
+        """Test ob Knoten ohne Position auf verschiedene Rasterplätze kommen."""
+        graph = GraphData()
+        for i in range(9):
+            graph.edge(i, i + 1)
+        graph.layout_unplaced(spacing=10)
+        positions = set(zip(graph.xs, graph.ys))
+        assert len(positions) == 10
+        assert max(graph.xs) <= 30 and max(graph.ys) <= 30
+
+    def test_placed_nodes_are_kept(self):
+        """Test ob vorhandene Positionen erhalten bleiben."""
+        graph = GraphData()
+        graph.node("a", x=500, y=500)
+        graph.edge("a", "b")
+        graph.layout_unplaced()
+        assert (graph.xs[0], graph.ys[0]) == (500, 500)
+        assert graph.xs[1] > 500
+
+
+class TestImportIntoCanvas:
+    """Tests für das Einfügen importierter Graphen."""
+
+    def test_add_graph(self, canvas):
+        """Test ob add_graph Knoten, Kanten und Label-Index füllt."""
+        graph = GraphData()
+        graph.edge("a", "b")
+        nodes = canvas.add_graph(graph)
+        assert [n.node_id for n in nodes] == [0, 1]
+        assert canvas.edges[0].source is nodes[0]
+        assert nodes[0].lines == nodes[1].lines == canvas.edges
+        assert canvas.label_index.search("b") == [nodes[1]]
+
+    def test_id_allocator(self, canvas):
+        """Test ob neue IDs nach den vorhandenen vergeben werden."""
+        canvas.add_new_node(0, 0, 7)
+        assert canvas.allocate_node_id() == 8
+        assert canvas.allocate_node_id(3) == 9
+        assert canvas.allocate_node_id() == 12
+
+    def test_import_replaces_network(self, main_window, tmp_path):
+        """Test ob der Import das bestehende Netzwerk ersetzt."""
+        main_window.canvas.add_new_node(0, 0, 42)
+        path = write(tmp_path, "g.graphml", GRAPHML)
+        nodes = main_window.import_graph_file(path)
+        assert main_window.canvas.nodes == nodes
+        assert len(main_window.canvas.edges) == 2
+        assert main_window.canvas.next_node_id == 3
+
+    def test_unknown_format(self, main_window, tmp_path):
+        """Test ob unbekannte Endungen abgelehnt werden."""
+        with pytest.raises(ValueError):
+            main_window.import_graph_file(write(tmp_path, "g.xyz", ""))
@@ -0,0 +1,83 @@
+import pytest
+import sys
+from pathlib import Path
+from PyQt6.QtWidgets import QApplication, QGraphicsItem
+from PyQt6.QtGui import QColor
+
+# Importiere die Klassen aus ndraw.py
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from ndraw import Node, DirectedEdge, NetworkCanvas, MainWindow, NODE_BRUSH, NODE_PEN
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Erstelle eine QApplication Instanz für alle Tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+@pytest.fixture
+def canvas(qapp):
+    """Erstelle eine neue NetworkCanvas Instanz für jeden Test."""
+    return NetworkCanvas()
+
+
+class TestItemCache:
+    """Tests für das Pixmap-Caching von Knoten und Kanten."""
+
+    def test_off_by_default(self, qapp, canvas):
+        """Test ob der Cache standardmäßig aus ist, auch im Menü."""
+        node = canvas.add_new_node(0, 0, 0)
+        assert node.cacheMode() == QGraphicsItem.CacheMode.NoCache
+        window = MainWindow()
+        assert not window.action_item_cache.isChecked()
+        window.close()
+
+    def test_enable_caches_nodes_only(self, canvas):
+        """Test ob nur Knoten den Device-Cache nutzen, Kanten nie."""
+        node1 = canvas.add_new_node(0, 0, 0)
+        node2 = canvas.add_new_node(100, 0, 1)
+        edge = canvas.add_new_edge(node1, node2)
+        canvas.set_item_caching(True)
+        mode = QGraphicsItem.CacheMode.DeviceCoordinateCache
+        assert node1.cacheMode() == mode
+        assert edge.cacheMode() == QGraphicsItem.CacheMode.NoCache
+        node3 = canvas.add_new_node(200, 0, 2)
+        assert node3.cacheMode() == mode
+        assert canvas.add_new_edge(node1, node3).cacheMode() == QGraphicsItem.CacheMode.NoCache
+
+    def test_disable_caching(self, canvas):
+        """Test ob der Cache für alle Knoten wieder abgeschaltet werden kann."""
+        node1 = canvas.add_new_node(0, 0, 0)
+        canvas.set_item_caching(True)
+        canvas.set_item_caching(False)
+        assert node1.cacheMode() == QGraphicsItem.CacheMode.NoCache
+        node2 = canvas.add_new_node(200, 0, 2)
+        assert node2.cacheMode() == QGraphicsItem.CacheMode.NoCache
+
+    def test_unchanged_style_does_not_invalidate(self, qapp):
+        """Test ob ein unveränderter Stil Brush und Pen nicht neu setzt."""
+        node = Node(0, 0, 0)
+        calls = []
+        node.setBrush = lambda brush: calls.append(brush)
+        node.setPen = lambda pen: calls.append(pen)
+        node.update_selection_style()
+        assert calls == []
+
+    def test_changed_style_is_applied(self, qapp):
+        """Test ob ein Stilwechsel weiterhin übernommen wird."""
+        node = Node(0, 0, 0)
+        node.setSelected(True)
+        node.update_selection_style()
+        assert node.brush().color() == QColor("#e3f2fd")
+        node.setSelected(False)
+        node.update_selection_style()
+        assert node.brush() == NODE_BRUSH
+        assert node.pen() == NODE_PEN
+
+    def test_edge_bounds_include_arrow(self, qapp):
+        """Test ob die Pfeilspitze horizontaler Kanten im boundingRect liegt."""
+        source = Node(0, 0, 0)
+        target = Node(200, 0, 1)
+        edge = DirectedEdge(source, target)
+        assert edge.boundingRect().height() >= 2 * edge.arrow_size
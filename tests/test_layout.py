@@ -0,0 +1,148 @@
+import multiprocessing
+import pytest
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QEventLoop, QTimer
+
+# Importiere die Klassen aus ndraw.py
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from ndraw import NetworkCanvas, MainWindow, GraphData, GraphModel
+import ndraw
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Erstelle eine QApplication Instanz für alle Tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+def islands(count=12, size=6):
+    """count Ringe aus je size Knoten, alle übereinander bei (0, 0)."""
+    graph = GraphData()
+    for c in range(count):
+        for i in range(size):
+            graph.node(f"{c}-{i}", None, 0.0, 0.0)
+            graph.edge(f"{c}-{i}", f"{c}-{(i + 1) % size}")
+    return graph
+
+@pytest.fixture
+def canvas(qapp):
+    canvas = NetworkCanvas()
+    canvas.resize(800, 600)
+    canvas.add_graph(islands())
+    return canvas
+
+
+def component_boxes(canvas):
+    """Begrenzungsrechteck je Ring, nach Label-Präfix gruppiert."""
+    boxes = {}
+    for node in canvas.nodes:
+        key = node.label_text.split("-")[0]
+        x, y = node.pos().x(), node.pos().y()
+        x0, y0, x1, y1 = boxes.get(key, (x, y, x, y))
+        boxes[key] = (min(x0, x), min(y0, y), max(x1, x), max(y1, y))
+    return boxes
+
+
+def overlaps(a, b):
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+class TestPacking:
+    """Tests für das Packen der Komponenten-Rechtecke."""
+
+    def test_no_overlap_and_compact(self):
+        """Test ob gepackte Rechtecke sich nicht überlappen und etwa quadratisch liegen."""
+        sizes = [(w, h) for w in (10, 50, 200) for h in (0, 30, 120)] * 5
+        corners = ndraw.pack_rectangles(sizes, gap=5)
+        rects = [(x, y, x + w, y + h) for (x, y), (w, h) in zip(corners, sizes)]
+        for i, a in enumerate(rects):
+            for b in rects[i + 1:]:
+                assert not overlaps(a, b)
+        width = max(r[2] for r in rects)
+        height = max(r[3] for r in rects)
+        assert max(width, height) < 3 * min(width, height)
+        assert ndraw.pack_rectangles([]) == []
+
+
+class TestComponentLayout:
+    """Tests für das Layout je Zusammenhangskomponente."""
+
+    def test_components_separated(self, canvas):
+        """Test ob Komponenten auseinander liegen und Knoten einer Komponente nicht aufeinander."""
+        canvas.layout_components()
+        boxes = list(component_boxes(canvas).values())
+        assert len(boxes) == 12
+        for i, a in enumerate(boxes):
+            for b in boxes[i + 1:]:
+                assert not overlaps(a, b)
+        positions = {(round(n.pos().x()), round(n.pos().y())) for n in canvas.nodes}
+        assert len(positions) == len(canvas.nodes)
+
+    def test_bounds_and_edges_follow(self, canvas):
+        """Test ob Begrenzung und Kanten nach dem Stapel-Setzen stimmen."""
+        canvas.layout_components()
+        xs = [n.pos().x() for n in canvas.nodes]
+        ys = [n.pos().y() for n in canvas.nodes]
+        assert canvas.content_extent() == (min(xs), min(ys), max(xs), max(ys))
+        edge = canvas.edges[0]
+        assert edge.line().length() > 0
+        assert not canvas.clusters.built
+
+    def test_process_pool_matches_serial(self, canvas):
+        """Test ob das Ergebnis mit Worker-Prozessen dem seriellen gleicht."""
+        snapshot = canvas.adjacency()
+        serial = ndraw.component_layout(snapshot)
+        with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("spawn")) as pool:
+            parallel = ndraw.component_layout(snapshot, pool, workers=2, parallel_min=0)
+        assert (serial[0] == parallel[0]).all() and (serial[1] == parallel[1]).all()
+
+    def test_large_component_uses_grid(self, qapp, monkeypatch):
+        """Test ob Komponenten über LAYOUT_FORCE_LIMIT auf das BFS-Raster gelegt werden."""
+        monkeypatch.setattr(ndraw, "LAYOUT_FORCE_LIMIT", 4)
+        canvas = NetworkCanvas()
+        canvas.add_graph(islands(count=1, size=9))
+        canvas.layout_components()
+        xs = sorted({n.pos().x() for n in canvas.nodes})
+        assert xs == [0.0, ndraw.LAYOUT_SPACING, 2.0 * ndraw.LAYOUT_SPACING]
+
+    def test_virtual_mode(self, qapp):
+        """Test ob im virtualisierten Modus das Modell die Positionen erhält."""
+        canvas = NetworkCanvas()
+        canvas.resize(800, 600)
+        canvas.set_model(GraphModel.from_graph(islands()))
+        canvas.update_virtual_items()
+        canvas.layout_components()
+        model = canvas.model
+        assert len({(round(x), round(y)) for x, y in zip(model.xs[:model.n], model.ys[:model.n])}) == model.n
+        for i, node in canvas.virtual_nodes.items():
+            assert (node.pos().x(), node.pos().y()) == (model.xs[i], model.ys[i])
+
+    def test_menu_runs_in_background(self, qapp):
+        """Test ob die Menüaktion im Hintergrund rechnet und das Ergebnis übernimmt."""
+        window = MainWindow()
+        window.canvas.add_graph(islands())
+        future = window.layout_components()
+        future.result(timeout=30)
+        loop = QEventLoop()
+        QTimer.singleShot(0, loop.quit)
+        loop.exec()
+        assert len(component_boxes(window.canvas)) == 12
+        assert window.status_bar.currentMessage().startswith("✓")
+        window.close()
+
+    def test_stale_result_discarded(self, qapp):
+        """Test ob ein Layout verworfen wird, wenn sich das Netz inzwischen geändert hat."""
+        window = MainWindow()
+        canvas = window.canvas
+        canvas.add_graph(islands())
+        snapshot = canvas.adjacency()
+        positions = ndraw.component_layout(snapshot)
+        canvas.add_new_node(0, 0, 999)
+        window.apply_layout(snapshot, positions)
+        assert canvas.nodes[0].pos().x() == 0.0
+        assert not window.status_bar.currentMessage().startswith("✓")
+        window.close()
@@ -0,0 +1,224 @@
+import numpy as np
+import pytest
+import random
+import sys
+from pathlib import Path
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QRectF, QPointF
+from PyQt6.QtGui import QColor
+
+# Importiere die Klassen aus ndraw.py
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from ndraw import MainWindow, MINIMAP_TILE, GraphData, GraphModel
+import ndraw
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Erstelle eine QApplication Instanz für alle Tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+@pytest.fixture
+def main_window(qapp):
+    """Erstelle ein sichtbares MainWindow für jeden Test."""
+    window = MainWindow()
+    window.show()
+    qapp.processEvents()
+    yield window
+    window.close()
+
+
+def render_all(minimap):
+    while minimap.dirty_tiles:
+        minimap.render_dirty_tiles(budget_ms=1e6)
+
+
+class TestMinimap:
+    """Tests für die Übersichtskarte."""
+
+    def test_initially_all_tiles_dirty(self, qapp):
+        """Test ob beim Start die ganze Scene gezeichnet werden muss."""
+        window = MainWindow()
+        minimap = window.minimap
+        assert len(minimap.dirty_tiles) == minimap.rows * minimap.cols
+        window.close()
+
+    def test_changed_region_marks_only_affected_tiles(self, main_window):
+        """Test ob nur Kacheln im geänderten Bereich neu gezeichnet werden."""
+        minimap = main_window.minimap
+        render_all(minimap)
+        minimap.mark_dirty([QRectF(0, 0, 1, 1)])
+        assert len(minimap.dirty_tiles) == 1
+
+    def test_node_is_drawn(self, qapp, main_window):
+        """Test ob ein neuer Knoten nach dem Nachzeichnen sichtbar ist."""
+        minimap = main_window.minimap
+        render_all(minimap)
+        rendered = minimap.tiles_rendered
+        main_window.canvas.add_new_node(1000, 1000, 0)
+        qapp.processEvents()
+        render_all(minimap)
+        pos = minimap.scene_to_image().map(QPointF(1000, 1000)).toPoint()
+        assert minimap.image.pixelColor(pos) != QColor("white")
+        assert 0 < minimap.tiles_rendered - rendered < 10
+
+    def test_budget_limits_tiles_per_tick(self, main_window):
+        """Test ob bei erschöpftem Budget genau eine Kachel gezeichnet wird."""
+        minimap = main_window.minimap
+        before = len(minimap.dirty_tiles)
+        minimap.render_dirty_tiles(budget_ms=0)
+        assert len(minimap.dirty_tiles) == before - 1
+        assert minimap.render_timer.isActive()
+
+    def test_hidden_minimap_does_not_render(self, main_window):
+        """Test ob eine ausgeblendete Übersicht keine Zeit kostet."""
+        minimap = main_window.minimap
+        main_window.minimap_dock.hide()
+        before = len(minimap.dirty_tiles)
+        minimap.render_dirty_tiles()
+        assert len(minimap.dirty_tiles) == before
+
+    def test_scene_growth_resets_image(self, main_window):
+        """Test ob ein Knoten außerhalb der Scene diese und das Bild vergrößert."""
+        minimap = main_window.minimap
+        render_all(minimap)
+        main_window.canvas.add_new_node(20000, 0, 0)
+        assert main_window.canvas.scene.sceneRect().contains(20000, 0)
+        assert len(minimap.dirty_tiles) == minimap.rows * minimap.cols
+
+    def test_drag_pans_canvas(self, main_window):
+        """Test ob ein Klick in die Übersicht die Ansicht dorthin verschiebt."""
+        minimap = main_window.minimap
+        canvas = main_window.canvas
+        target = (minimap.scene_to_image() * minimap.image_to_widget()).map(QPointF(2000, -1500))
+        minimap.center_canvas_at(target)
+        center = canvas.mapToScene(canvas.viewport().rect().center())
+        assert abs(center.x() - 2000) < 100 and abs(center.y() + 1500) < 100
+        assert minimap.viewport_rect().contains(target)
+
+    def test_menu_action_toggles_dock(self, main_window):
+        """Test ob die Menüaktion die Übersicht ein- und ausblendet."""
+        main_window.action_minimap.trigger()
+        assert not main_window.minimap_dock.isVisible()
+        main_window.action_minimap.trigger()
+        assert main_window.minimap_dock.isVisible()
+
+
+def random_model(n=2000, m=3000, seed=3):
+    """Zufällige Knoten auf 20.000 x 20.000 und Kanten beliebiger Länge."""
+    rng = random.Random(seed)
+    graph = GraphData()
+    for i in range(n):
+        graph.node(str(i), None, rng.uniform(-10000, 10000), rng.uniform(-10000, 10000))
+    for _ in range(m):
+        a = rng.randrange(n)
+        # Überwiegend kurze Kanten zu Nachbarn im Index, einige lange
+        b = rng.randrange(n) if rng.random() < 0.1 else min(n - 1, a + 1)
+        graph.edge(str(a), str(b))
+    return GraphModel.from_graph(graph)
+
+
+class TestModelGrid:
+    """Tests für den Gitterindex des Modells im virtualisierten Modus."""
+
+    def assert_matches_scan(self, model, grid, seed=0):
+        rng = random.Random(seed)
+        for _ in range(30):
+            x, y = rng.uniform(-12000, 12000), rng.uniform(-12000, 12000)
+            rect = QRectF(x, y, rng.uniform(1, 3000), rng.uniform(1, 3000))
+            assert np.array_equal(grid.nodes_in(rect), model.nodes_in(rect))
+            assert np.array_equal(grid.edges_in(rect), model.edges_in(rect))
+
+    def test_matches_scan(self):
+        """Test ob Abfragen dieselben Knoten und Kanten liefern wie der Durchlauf."""
+        model = random_model()
+        grid = model.grid()
+        assert len(grid.edge_cells) > 1
+        self.assert_matches_scan(model, grid)
+
+    def test_long_edges_skipped_by_span(self):
+        """Test ob max_span genau die langen Kanten auslässt."""
+        model = random_model()
+        grid = model.grid()
+        rect = QRectF(-3000, -3000, 6000, 6000)
+        span = 8 * grid.cell
+        found = set(grid.edges_in(rect, max_span=span).tolist())
+        s, t = model.sources[:model.m], model.targets[:model.m]
+        length = np.maximum(np.abs(model.xs[s] - model.xs[t]), np.abs(model.ys[s] - model.ys[t]))
+        for e in model.edges_in(rect).tolist():
+            if length[e] > span:
+                assert e not in found
+            elif length[e] <= span / 2 - grid.cell:
+                assert e in found
+
+    def test_stop_after(self):
+        """Test ob stop_after nach genügend Treffern abbricht und sonst alles liefert."""
+        model = random_model()
+        grid = model.grid()
+        rect = QRectF(-5000, -5000, 10000, 10000)
+        full = model.edges_in(rect)
+        partial = grid.edges_in(rect, stop_after=10)
+        assert 10 < len(partial) < len(full)
+        assert set(partial.tolist()) <= set(full.tolist())
+        assert np.array_equal(grid.edges_in(rect, stop_after=len(full)), full)
+
+    def test_changes_after_build(self):
+        """Test ob Verschieben, Einfügen und Löschen ohne Neuaufbau berücksichtigt werden."""
+        model = random_model()
+        grid = model.grid()
+        rng = random.Random(5)
+        for i in range(50):
+            model.move_node(rng.randrange(model.n), rng.uniform(-10000, 10000), rng.uniform(-10000, 10000))
+        a = model.add_node(123.0, 456.0, "neu")
+        model.add_edge(a, 0)
+        model.remove(nodes=[1, 2], edges=[5])
+        assert model.grid() is grid
+        self.assert_matches_scan(model, grid, seed=1)
+
+    def test_rebuilt_on_overflow_and_bulk_moves(self):
+        """Test ob zu viel Überlauf und Massenverschieben neu aufbauen."""
+        model = random_model()
+        grid = model.grid()
+        model.move_nodes(np.arange(10), np.zeros(10), np.zeros(10))
+        assert model.grid() is not grid
+        model = random_model(n=ndraw.GRID_OVERFLOW_MIN + 100, m=10)
+        grid = model.grid()
+        for i in range(ndraw.GRID_OVERFLOW_MIN):
+            model.move_node(i, 0.0, float(i))
+        assert model.grid() is grid
+        model.move_node(ndraw.GRID_OVERFLOW_MIN, 0.0, 0.0)
+        assert model.grid() is not grid
+
+    def test_built_in_background(self):
+        """Test ob der Aufbau im Executor läuft und Änderungen währenddessen zählen."""
+        class Executor:
+            def __init__(self):
+                self.jobs = []
+            def submit(self, fn):
+                self.jobs.append(fn)
+        executor = Executor()
+        model = random_model()
+        assert model.grid(executor) is None
+        assert model.grid(executor) is None and len(executor.jobs) == 1
+        model.move_node(7, 4321.0, -1234.0)
+        executor.jobs[0]()
+        grid = model.grid(executor)
+        assert grid is not None and len(executor.jobs) == 1
+        self.assert_matches_scan(model, grid, seed=2)
+
+    def test_minimap_tiles_use_grid(self, qapp, main_window, monkeypatch):
+        """Test ob Kacheln im virtualisierten Modus ohne Durchlauf des Modells gezeichnet werden."""
+        canvas = main_window.canvas
+        canvas.set_model(random_model())
+        def scan(*args):
+            raise AssertionError("Modell vollständig durchlaufen")
+        monkeypatch.setattr(GraphModel, "nodes_in", scan)
+        monkeypatch.setattr(GraphModel, "edges_in", scan)
+        minimap = main_window.minimap
+        minimap.reset_image()
+        render_all(minimap)
+        x, y = canvas.model.xs[0], canvas.model.ys[0]
+        pos = minimap.scene_to_image().map(QPointF(x, y)).toPoint()
+        assert minimap.image.pixelColor(pos) != QColor("white")
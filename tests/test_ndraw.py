@@ -63,7 +63,7 @@ class TestNode:
         node = Node(0, 0, 1)
         node.set_label("Neues Label")
         assert node.label_text == "Neues Label"
-        assert node.label.toPlainText() == "Neues Label"
+        assert node.label_static.text() == "Neues Label"
     
     def test_node_movable(self, qapp):
         """Test ob Node als movable markiert ist."""
@@ -107,11 +107,10 @@ class TestNode:
     def test_node_label_positioning(self, qapp):
         """Test ob Label-Position korrekt zentriert wird."""
         node = Node(0, 0, 0)
-        br = node.label.boundingRect()
-        expected_x = -br.width() / 2
-        expected_y = -br.height() / 2
-        assert abs(node.label.pos().x() - expected_x) < 0.1
-        assert abs(node.label.pos().y() - expected_y) < 0.1
+        rect = node.label_rect
+        assert rect.width() > 0
+        assert abs(rect.center().x()) < 0.1
+        assert abs(rect.center().y()) < 0.1
 
 
 class TestDirectedEdge:
@@ -311,7 +310,7 @@ class TestNetworkCanvas:
         canvas.edit_node_label(node)
         
         assert node.is_editing == True
-        assert node.label.textInteractionFlags() & Qt.TextInteractionFlag.TextEditorInteraction
+        assert node.label_editor.textInteractionFlags() & Qt.TextInteractionFlag.TextEditorInteraction
     
     def test_finish_label_edit(self, canvas):
         """Test ob Label-Editing korrekt beendet wird."""
@@ -319,7 +318,7 @@ class TestNetworkCanvas:
         canvas.edit_node_label(node)
         
         # Simuliere Textänderung
-        node.label.setPlainText("Neuer Text")
+        node.label_editor.setPlainText("Neuer Text")
         
         # Simuliere FocusOut Event
         from PyQt6.QtGui import QFocusEvent
@@ -329,7 +328,8 @@ class TestNetworkCanvas:
         
         assert node.is_editing == False
         assert node.label_text == "Neuer Text"
-        assert not (node.label.textInteractionFlags() & Qt.TextInteractionFlag.TextEditorInteraction)
+        assert node.label_editor is None
+        assert node.label_static.text() == "Neuer Text"
 
 
 class TestMainWindow:
@@ -622,14 +622,15 @@ class TestEdgeCases:
         """Test Node mit leerem Label."""
         node = Node(0, 0, 0, label="")
         assert node.label_text == ""
-        assert node.label.toPlainText() == ""
+        assert node.label_static.text() == ""
     
     def test_node_with_long_label(self, qapp):
         """Test Node mit sehr langem Label."""
         long_label = "A" * 100
         node = Node(0, 0, 0, label=long_label)
         assert node.label_text == long_label
-        assert len(node.label.toPlainText()) == 100
+        assert len(node.label_static.text()) == 100
+        assert node.boundingRect().contains(node.label_rect)
     
     def test_multiple_delete_operations(self, canvas):
         """Test mehrfache Löschoperationen."""
@@ -0,0 +1,139 @@
+import pytest
+import sys
+import random
+from pathlib import Path
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QColor
+
+# Importiere die Klassen aus ndraw.py
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from ndraw import NetworkCanvas, MainWindow, AdjacencySnapshot
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Erstelle eine QApplication Instanz für alle Tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+@pytest.fixture
+def canvas(qapp):
+    """Erstelle eine neue NetworkCanvas Instanz für jeden Test."""
+    return NetworkCanvas()
+
+@pytest.fixture
+def diamond(canvas):
+    """0 -> 1 -> 3, 0 -> 2 -> 4 -> 3, 5 -> 0 sowie isolierter Knoten 6."""
+    nodes = [canvas.add_new_node(i * 100, 0, i) for i in range(7)]
+    pairs = [(0, 1), (1, 3), (0, 2), (2, 4), (4, 3), (5, 0)]
+    edges = [canvas.add_new_edge(nodes[a], nodes[b]) for a, b in pairs]
+    return nodes, edges
+
+
+class FakeEdge:
+    def __init__(self, source, target):
+        self.source = source
+        self.target = target
+
+
+def bfs_distance(n, pairs, source, target):
+    """Referenz: einfache Vorwärts-BFS."""
+    adjacency = [[] for _ in range(n)]
+    for a, b in pairs:
+        adjacency[a].append(b)
+    dist = {source: 0}
+    queue = [source]
+    for node in queue:
+        for other in adjacency[node]:
+            if other not in dist:
+                dist[other] = dist[node] + 1
+                queue.append(other)
+    return dist.get(target)
+
+
+class TestShortestPath:
+    """Tests für die bidirektionale Breitensuche."""
+
+    def test_path_edges_in_order(self, canvas, diamond):
+        """Test ob der kürzere von zwei Wegen in Reihenfolge geliefert wird."""
+        nodes, edges = diamond
+        adjacency = canvas.adjacency()
+        path = [adjacency.edges[i] for i in adjacency.shortest_path(0, 3)]
+        assert path == [edges[0], edges[1]]
+
+    def test_no_path_against_direction(self, canvas, diamond):
+        """Test ob Kanten nicht gegen ihre Richtung genutzt werden."""
+        adjacency = canvas.adjacency()
+        assert adjacency.shortest_path(3, 0) is None
+        assert adjacency.shortest_path(0, 6) is None
+        assert adjacency.shortest_path(2, 2) == []
+
+    def test_matches_reference_bfs(self, qapp):
+        """Test ob die Weglängen auf Zufallsgraphen mit einer einfachen BFS übereinstimmen."""
+        rng = random.Random(7)
+        n = 200
+        nodes = [object() for _ in range(n)]
+        pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(400)]
+        adjacency = AdjacencySnapshot(nodes, [FakeEdge(nodes[a], nodes[b]) for a, b in pairs])
+        for _ in range(100):
+            s, t = rng.randrange(n), rng.randrange(n)
+            path = adjacency.shortest_path(s, t)
+            expected = bfs_distance(n, pairs, s, t)
+            assert (None if path is None else len(path)) == expected
+            if path:
+                assert adjacency.sources[path[0]] == s and adjacency.targets[path[-1]] == t
+                for a, b in zip(path, path[1:]):
+                    assert adjacency.targets[a] == adjacency.sources[b]
+
+
+class TestHighlighting:
+    """Tests für die Hervorhebung von Wegen und Erreichbarkeit."""
+
+    def test_path_mode_highlights_path(self, qapp, canvas, diamond):
+        """Test ob zwei nacheinander gewählte Knoten den Weg hervorheben."""
+        nodes, edges = diamond
+        canvas.set_path_mode(True)
+        canvas.select_items([nodes[0]])
+        canvas.select_items([nodes[3]], extend=True)
+        assert set(canvas.scene.selectedItems()) == {nodes[0], nodes[1], nodes[3], edges[0], edges[1]}
+        assert edges[1].pen().color() == QColor("#2196f3")
+
+    def test_selection_order_gives_direction(self, canvas, diamond):
+        """Test ob der zuerst gewählte Knoten der Start ist."""
+        nodes, _ = diamond
+        messages = []
+        canvas.status_message.connect(lambda text, ok: messages.append(ok))
+        canvas.set_path_mode(True)
+        canvas.select_items([nodes[3]])
+        canvas.select_items([nodes[0]], extend=True)
+        assert set(canvas.scene.selectedItems()) == {nodes[0], nodes[3]}
+        assert messages == [False]
+
+    def test_path_mode_off(self, canvas, diamond):
+        """Test ob ohne Wegmodus nur die Auswahl bleibt."""
+        nodes, _ = diamond
+        canvas.select_items([nodes[0]])
+        canvas.select_items([nodes[3]], extend=True)
+        assert len(canvas.scene.selectedItems()) == 2
+
+    def test_downstream(self, canvas, diamond):
+        """Test ob alle Nachfolger samt Kanten hervorgehoben werden."""
+        nodes, edges = diamond
+        canvas.select_items([nodes[2]])
+        canvas.highlight_reachable("out")
+        assert set(canvas.scene.selectedItems()) == {nodes[2], nodes[4], nodes[3], edges[3], edges[4]}
+
+    def test_upstream(self, canvas, diamond):
+        """Test ob alle Vorgänger samt Kanten hervorgehoben werden."""
+        nodes, edges = diamond
+        canvas.select_items([nodes[1]])
+        canvas.highlight_reachable("in")
+        assert set(canvas.scene.selectedItems()) == {nodes[1], nodes[0], nodes[5], edges[0], edges[5]}
+
+    def test_menu_path_mode(self, qapp):
+        """Test ob die Menüaktion den Wegmodus schaltet."""
+        window = MainWindow()
+        window.action_path_mode.setChecked(True)
+        assert window.canvas.path_mode
+        window.close()
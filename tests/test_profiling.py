@@ -0,0 +1,136 @@
+import pytest
+import sys
+import json
+from pathlib import Path
+from PyQt6.QtWidgets import QApplication
+
+# Importiere die Klassen aus ndraw.py
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import ndraw
+from ndraw import PerfRegistry, timed, MainWindow
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Erstelle eine QApplication Instanz für alle Tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+@pytest.fixture
+def perf(monkeypatch):
+    """Ersetze die globale Registry durch eine frische Instanz."""
+    registry = PerfRegistry()
+    monkeypatch.setattr(ndraw, "PERF", registry)
+    yield registry
+    registry.stop_profiling()
+
+@pytest.fixture
+def main_window(qapp):
+    """Erstelle ein MainWindow für jeden Test."""
+    window = MainWindow()
+    yield window
+    window.close()
+
+
+class TestPerfRegistry:
+    """Tests für die Laufzeit-Registry."""
+
+    def test_disabled_by_default(self):
+        """Test ob die Registry standardmäßig nichts aufzeichnet."""
+        registry = PerfRegistry()
+        assert registry.enabled == False
+        assert registry.profiler is None
+
+    def test_record_aggregates(self):
+        """Test ob Zähler, Summe und Maximum korrekt gebildet werden."""
+        registry = PerfRegistry()
+        registry.record("op", 0.002)
+        registry.record("op", 0.004)
+        summary = registry.summary()["op"]
+        assert summary["count"] == 2
+        assert abs(summary["total_ms"] - 6.0) < 1e-9
+        assert abs(summary["max_ms"] - 4.0) < 1e-9
+
+    def test_configure_from_env(self):
+        """Test ob Umgebungsvariablen Timing bzw. Profiling aktivieren."""
+        registry = PerfRegistry()
+        registry.configure_from_env({"NDRAW_PERF": "1"})
+        assert registry.enabled and registry.profiler is None
+
+        registry = PerfRegistry()
+        registry.configure_from_env({"NDRAW_PROFILE": "1"})
+        assert registry.enabled and registry.profiler is not None
+        registry.stop_profiling()
+
+    def test_toggle_off_and_on(self):
+        """Test ob erneutes Einschalten weiter aufzeichnet und NDRAW_PERF-Zeiten erhalten bleiben."""
+        registry = PerfRegistry()
+        registry.configure_from_env({"NDRAW_PERF": "1"})
+        registry.start_profiling()
+        registry.stop_profiling()
+        assert registry.enabled and not registry.profiling
+        registry.start_profiling()
+        sorted(range(10))
+        registry.stop_profiling()
+        registry.profiler.create_stats()
+        assert any(func[2] == "<built-in method builtins.sorted>" for func in registry.profiler.stats)
+        assert registry.enabled
+
+        registry = PerfRegistry()
+        registry.start_profiling()
+        registry.stop_profiling()
+        assert not registry.enabled
+
+    def test_export_writes_json_and_profile(self, tmp_path):
+        """Test ob Export JSON und cProfile-Daten schreibt."""
+        registry = PerfRegistry()
+        registry.start_profiling()
+        registry.record("save_json", 0.01)
+        registry.export(tmp_path / "stats.json")
+        registry.stop_profiling()
+
+        data = json.loads((tmp_path / "stats.json").read_text())
+        assert data["operations"]["save_json"]["count"] == 1
+        assert (tmp_path / "stats.prof").exists()
+
+
+class TestTimedDecorator:
+    """Tests für den timed-Dekorator."""
+
+    def test_no_recording_when_disabled(self, perf):
+        """Test ob deaktiviertes Timing nichts aufzeichnet."""
+        @timed("noop")
+        def noop():
+            return 42
+        assert noop() == 42
+        assert perf.stats == {}
+
+    def test_recording_when_enabled(self, perf):
+        """Test ob aktiviertes Timing Aufrufe zählt."""
+        perf.enabled = True
+        @timed("noop")
+        def noop():
+            return 42
+        noop()
+        noop()
+        assert perf.stats["noop"][0] == 2
+
+    def test_recording_on_exception(self, perf):
+        """Test ob auch fehlgeschlagene Aufrufe gemessen werden."""
+        perf.enabled = True
+        @timed("fails")
+        def fails():
+            raise ValueError()
+        with pytest.raises(ValueError):
+            fails()
+        assert perf.stats["fails"][0] == 1
+
+    def test_main_entry_points_instrumented(self, perf, main_window, tmp_path):
+        """Test ob Speichern und Zusammenhangsprüfung erfasst werden."""
+        perf.enabled = True
+        main_window.canvas.add_new_node(0, 0, 0)
+        main_window.is_connected()
+        main_window.save_json_file(tmp_path / "net.json")
+        assert "is_connected" in perf.stats
+        assert "save_json" in perf.stats
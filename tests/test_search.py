@@ -0,0 +1,193 @@
+import pytest
+import sys
+import json
+from pathlib import Path
+from PyQt6.QtWidgets import QApplication
+
+# Importiere die Klassen aus ndraw.py
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from ndraw import LabelIndex, Node, NetworkCanvas, MainWindow, GraphData, GraphModel
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Erstelle eine QApplication Instanz für alle Tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+@pytest.fixture
+def canvas(qapp):
+    """Erstelle eine neue NetworkCanvas Instanz für jeden Test."""
+    return NetworkCanvas()
+
+@pytest.fixture
+def main_window(qapp):
+    """Erstelle ein MainWindow für jeden Test."""
+    window = MainWindow()
+    yield window
+    window.close()
+
+
+def labels(nodes):
+    return [node.label_text for node in nodes]
+
+
+class TestLabelIndex:
+    """Tests für den Label-Suchindex."""
+
+    def test_prefix_before_substring(self, canvas):
+        """Test ob Präfix-Treffer vor Teilstring-Treffern kommen."""
+        for i, label in enumerate(["Gateway", "Router B", "Core Router", "router a"]):
+            canvas.add_new_node(i * 50, 0, i, label)
+        assert labels(canvas.label_index.search("rout")) == ["router a", "Router B", "Core Router"]
+
+    def test_case_insensitive_substring(self, canvas):
+        """Test ob Teilstrings ohne Groß-/Kleinschreibung gefunden werden."""
+        canvas.add_new_node(0, 0, 0, "Edge-Server")
+        canvas.add_new_node(50, 0, 1, "Client")
+        assert labels(canvas.label_index.search("SERV")) == ["Edge-Server"]
+        assert canvas.label_index.search("") == []
+
+    def test_limit(self, canvas):
+        """Test ob höchstens limit Treffer geliefert werden."""
+        for i in range(20):
+            canvas.add_new_node(i * 50, 0, i, f"n{i}")
+        assert len(canvas.label_index.search("n", limit=5)) == 5
+
+    def test_set_label_updates_index(self, canvas):
+        """Test ob Umbenennen den Index aktualisiert."""
+        node = canvas.add_new_node(0, 0, 0, "alt")
+        node.set_label("neu")
+        assert canvas.label_index.search("alt") == []
+        assert canvas.label_index.search("neu") == [node]
+
+    def test_rename_after_flush(self, canvas):
+        """Test ob Änderungen nach dem Einsortieren gefunden werden."""
+        nodes = [canvas.add_new_node(i * 50, 0, i, f"host{i}") for i in range(3)]
+        canvas.label_index.flush()
+        nodes[1].set_label("backup")
+        assert labels(canvas.label_index.search("host")) == ["host0", "host2"]
+        assert canvas.label_index.search("back") == [nodes[1]]
+
+    def test_removed_nodes_not_found(self, canvas):
+        """Test ob gelöschte Knoten nicht mehr gefunden werden."""
+        node1 = canvas.add_new_node(0, 0, 0, "alpha")
+        node2 = canvas.add_new_node(50, 0, 1, "alpha2")
+        canvas.label_index.flush()
+        canvas.remove_node(node1)
+        canvas.remove_items([node2])
+        assert canvas.label_index.search("alpha") == []
+        assert len(canvas.label_index) == 0
+
+    def test_flush_compacts_stale_keys(self, qapp):
+        """Test ob verworfene Schlüssel beim Einsortieren entfernt werden."""
+        index = LabelIndex()
+        nodes = [Node(0, 0, i) for i in range(10)]
+        for node in nodes:
+            index.add(node)
+        index.flush()
+        for node in nodes[:8]:
+            index.discard(node)
+        index.flush()
+        assert len(index.keys) == 2
+        assert index.search("9") == [nodes[9]]
+
+    def test_load_rebuilds_index(self, main_window, tmp_path):
+        """Test ob Laden den Index neu aufbaut."""
+        main_window.canvas.add_new_node(0, 0, 0, "vorher")
+        path = tmp_path / "net.json"
+        path.write_text(json.dumps({"nodes": [{"id": 0, "x": 0, "y": 0, "label": "Server"}],
+                                    "edges": []}))
+        main_window.load_json_file(path)
+        assert main_window.canvas.label_index.search("vorher") == []
+        assert labels(main_window.canvas.label_index.search("server")) == ["Server"]
+
+
+class TestJumpToNode:
+    """Tests für die Suche im Hauptfenster."""
+
+    def test_jump_centres_and_selects(self, qapp, main_window):
+        """Test ob der gewählte Knoten ausgewählt und zentriert wird."""
+        canvas = main_window.canvas
+        canvas.add_new_node(0, 0, 0, "Start")
+        target = canvas.add_new_node(3000, 2000, 1, "Ziel")
+        canvas.scale(0.5, 0.5)
+        canvas.zoom_factor = 0.5
+        main_window.update_search("zi")
+        main_window.jump_to_search_result("Ziel (#1)")
+
+        assert canvas.scene.selectedItems() == [target]
+        assert canvas.zoom_factor == 1.0
+        center = canvas.mapToScene(canvas.viewport().rect().center())
+        assert abs(center.x() - 3000) < 50 and abs(center.y() - 2000) < 50
+
+    def test_return_jumps_to_first_match(self, main_window):
+        """Test ob Enter zum ersten Treffer springt."""
+        node = main_window.canvas.add_new_node(0, 0, 0, "Datenbank")
+        main_window.update_search("daten")
+        main_window.jump_to_search_result("daten")
+        assert main_window.canvas.scene.selectedItems() == [node]
+
+    def test_no_match_reports_status(self, main_window):
+        """Test ob ohne Treffer eine Statusmeldung erscheint."""
+        main_window.update_search("nichts")
+        main_window.jump_to_search_result("nichts")
+        assert "Kein Knoten" in main_window.status_bar.currentMessage()
+
+
+class TestVirtualSearch:
+    """Tests für die Suche im virtualisierten Modus."""
+
+    def test_search_and_jump(self, qapp, main_window):
+        """Test ob Modellknoten gefunden, angelegt, ausgewählt und zentriert werden."""
+        graph = GraphData()
+        for i in range(500):
+            graph.node(str(i), f"Knoten {i}", (i % 50) * 400.0, (i // 50) * 400.0)
+        canvas = main_window.canvas
+        canvas.resize(800, 600)
+        canvas.set_model(GraphModel.from_graph(graph))
+        assert 437 not in canvas.virtual_nodes
+
+        main_window.update_search("knoten 437")
+        assert list(main_window.search_results) == ["Knoten 437 (#437)"]
+        main_window.jump_to_search_result("Knoten 437 (#437)")
+        node = canvas.virtual_nodes[437]
+        assert canvas.scene.selectedItems() == [node]
+        center = canvas.mapToScene(canvas.viewport().rect().center())
+        assert abs(center.x() - 37 * 400) < 50 and abs(center.y() - 8 * 400) < 50
+
+    def test_index_follows_model(self, qapp, canvas):
+        """Test ob Hinzufügen, Umbenennen und Löschen im Modell den Index nachführen."""
+        graph = GraphData()
+        graph.node("a", "Alpha", 0.0, 0.0)
+        graph.node("b", "Beta", 100.0, 0.0)
+        canvas.resize(800, 600)
+        canvas.set_model(GraphModel.from_graph(graph))
+        canvas.update_virtual_items()
+        assert canvas.label_index.search("alp") == [0]
+
+        canvas.virtual_nodes[0].set_label("Gamma")
+        assert canvas.label_index.search("alp") == []
+        assert canvas.label_index.search("gam") == [0]
+        node = canvas.add_new_node(200, 0, 7, "Delta")
+        assert canvas.label_index.search("del") == [node.model_index]
+        canvas.remove_items([canvas.virtual_nodes[1]])
+        assert canvas.label_index.search("bet") == []
+        assert len(canvas.label_index) == 2
+
+    def test_index_built_on_first_search(self, qapp, canvas):
+        """Test ob set_model den Index erst bei der ersten Suche aufbaut."""
+        graph = GraphData()
+        graph.node("a", "Alpha", 0.0, 0.0)
+        graph.node("b", "Beta", 100.0, 0.0)
+        canvas.resize(800, 600)
+        canvas.set_model(GraphModel.from_graph(graph))
+        assert not canvas.label_index.entries and not canvas.label_index.keys
+        canvas.update_virtual_items()
+        canvas.virtual_nodes[0].set_label("Gamma")
+        canvas.remove_items([canvas.virtual_nodes[1]])
+        assert not canvas.label_index.entries
+        assert canvas.label_index.search("gam") == [0]
+        assert canvas.label_index.search("alp") == canvas.label_index.search("bet") == []
+
@@ -0,0 +1,135 @@
+import pytest
+import sys
+from pathlib import Path
+from PyQt6.QtWidgets import QApplication, QGraphicsView
+from PyQt6.QtCore import Qt, QPoint
+from PyQt6.QtGui import QColor
+from PyQt6.QtTest import QTest
+
+# Importiere die Klassen aus ndraw.py
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from ndraw import NetworkCanvas, MainWindow, NODE_BRUSH, EDGE_PEN
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Erstelle eine QApplication Instanz für alle Tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+@pytest.fixture
+def canvas(qapp):
+    """Erstelle eine neue NetworkCanvas Instanz für jeden Test."""
+    return NetworkCanvas()
+
+@pytest.fixture
+def chain(canvas):
+    """Kette 0 -> 1 -> 2 -> 3 sowie ein isolierter Knoten 4."""
+    nodes = [canvas.add_new_node(i * 100, 0, i) for i in range(5)]
+    edges = [canvas.add_new_edge(nodes[i], nodes[i + 1]) for i in range(3)]
+    return nodes, edges
+
+
+class TestBatchedSelectionStyle:
+    """Tests für gesammelte Stil-Updates nach Auswahländerungen."""
+
+    def test_style_applied_after_selection_settles(self, qapp, canvas, chain):
+        """Test ob der Stil erst nach Abschluss der Auswahländerung gesetzt wird."""
+        nodes, edges = chain
+        nodes[0].setSelected(True)
+        edges[0].setSelected(True)
+        assert nodes[0].brush() == NODE_BRUSH
+        qapp.processEvents()
+        assert nodes[0].brush().color() == QColor("#e3f2fd")
+        assert edges[0].pen().width() == 4
+
+    def test_deselection_resets_style(self, canvas, chain):
+        """Test ob abgewählte Items wieder den Normalstil erhalten."""
+        nodes, edges = chain
+        canvas.select_items([nodes[0], edges[0]])
+        canvas.scene.clearSelection()
+        canvas.apply_selection_styles()
+        assert nodes[0].brush() == NODE_BRUSH
+        assert edges[0].pen() == EDGE_PEN
+
+    def test_only_changed_items_restyled(self, canvas, chain):
+        """Test ob unveränderte Items nicht erneut gestylt werden."""
+        nodes, _ = chain
+        canvas.select_items([nodes[0]])
+        calls = []
+        nodes[0].update_selection_style = lambda: calls.append(nodes[0])
+        canvas.select_items([nodes[1]], extend=True)
+        assert calls == []
+
+
+class TestBulkSelection:
+    """Tests für Massenauswahl."""
+
+    def test_select_all(self, canvas, chain):
+        """Test ob alle Knoten und Kanten ausgewählt werden."""
+        canvas.select_all()
+        assert len(canvas.scene.selectedItems()) == 8
+
+    def test_invert_selection(self, canvas, chain):
+        """Test ob die Auswahl umgekehrt wird."""
+        nodes, edges = chain
+        canvas.select_items(nodes)
+        canvas.invert_selection()
+        assert set(canvas.scene.selectedItems()) == set(edges)
+
+    def test_select_component(self, canvas, chain):
+        """Test ob die Zusammenhangskomponente ohne Richtung gewählt wird."""
+        nodes, edges = chain
+        canvas.select_items([nodes[2]])
+        canvas.select_neighbourhood()
+        assert set(canvas.scene.selectedItems()) == set(nodes[:4]) | set(edges)
+
+    def test_select_k_hop(self, canvas, chain):
+        """Test ob die k-Nachbarschaft samt verbindender Kanten gewählt wird."""
+        nodes, edges = chain
+        canvas.select_items([nodes[0]])
+        canvas.select_neighbourhood(1)
+        assert set(canvas.scene.selectedItems()) == {nodes[0], nodes[1], edges[0]}
+
+    def test_neighbourhood_from_selected_edge(self, canvas, chain):
+        """Test ob eine gewählte Kante ihre Endknoten als Start nutzt."""
+        nodes, edges = chain
+        canvas.select_items([edges[2]])
+        canvas.select_neighbourhood(0)
+        assert set(canvas.scene.selectedItems()) == {nodes[2], nodes[3], edges[2]}
+
+    def test_menu_select_all(self, qapp):
+        """Test ob die Menüaktion alles auswählt."""
+        window = MainWindow()
+        window.canvas.add_new_node(0, 0, 0)
+        actions = {a.text(): a for a in window.menuBar().actions()[0].menu().actions()}
+        actions["Alles auswählen"].trigger()
+        assert len(window.canvas.scene.selectedItems()) == 1
+        window.close()
+
+
+class TestRubberBand:
+    """Tests für die Rechteckauswahl."""
+
+    def test_shift_drag_selects_area(self, qapp, canvas, chain):
+        """Test ob Shift+Ziehen auf freier Fläche ein Rechteck auswählt."""
+        nodes, _ = chain
+        canvas.resize(800, 400)
+        canvas.show()
+        canvas.centerOn(200, 0)
+        qapp.processEvents()
+        start = canvas.mapFromScene(-50, -50)
+        end = canvas.mapFromScene(150, 50)
+        shift = Qt.KeyboardModifier.ShiftModifier
+        QTest.mousePress(canvas.viewport(), Qt.MouseButton.LeftButton, shift, start)
+        QTest.mouseMove(canvas.viewport(), QPoint(start.x() + 10, start.y() + 10))
+        QTest.mouseMove(canvas.viewport(), end)
+        QTest.mouseRelease(canvas.viewport(), Qt.MouseButton.LeftButton, shift, end)
+        qapp.processEvents()
+
+        assert len(canvas.nodes) == 5
+        assert {nodes[0], nodes[1]} <= set(canvas.scene.selectedItems())
+        assert nodes[2] not in canvas.scene.selectedItems()
+        assert canvas.dragMode() == QGraphicsView.DragMode.NoDrag
+        canvas.close()
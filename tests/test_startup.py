@@ -0,0 +1,126 @@
+import json
+import pytest
+import subprocess
+import sys
+from pathlib import Path
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QTimer
+
+# Importiere die Klassen aus ndraw.py
+SRC = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(SRC))
+from ndraw import MainWindow
+import ndraw
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Erstelle eine QApplication Instanz für alle Tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+@pytest.fixture(autouse=True)
+def icon_cache(tmp_path, monkeypatch):
+    """Icon-Cache im temporären Verzeichnis statt unter ~/.cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    ndraw.app_icon.cache_clear()
+    yield tmp_path / "cache"
+    ndraw.app_icon.cache_clear()
+
+@pytest.fixture
+def network_file(tmp_path):
+    """Kette aus drei Knoten als JSON-Datei."""
+    path = tmp_path / "kette.json"
+    data = {
+        "nodes": [{"id": i, "x": i * 100, "y": 0, "label": f"n{i}"} for i in range(3)],
+        "edges": [{"from": 0, "to": 1}, {"from": 1, "to": 2}],
+    }
+    path.write_text(json.dumps(data))
+    return path
+
+
+class TestLazyImports:
+    """Tests für das verzögerte Laden selten gebrauchter Module."""
+
+    def test_import_skips_numpy_and_xml(self):
+        """Test ob NumPy und die XML-Module erst bei Bedarf geladen werden."""
+        code = (f"import sys; sys.path.insert(0, {str(SRC)!r}); import ndraw\n"
+                "print(sorted({'numpy', 'xml.etree.ElementTree', 'xml.sax.saxutils'} & set(sys.modules)))\n"
+                "ndraw.np.zeros(1)\n"
+                "print(ndraw.np is sys.modules['numpy'])\n")
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.split("\n")[:2] == ["[]", "True"]
+
+
+class TestStartup:
+    """Tests für Einstiegspunkt, Icon und das Öffnen von Dateien."""
+
+    def test_main_loads_file_after_first_frame(self, qapp, network_file):
+        """Test ob das Fenster zuerst leer gezeichnet und die Datei danach geladen wird."""
+        seen = []
+        before = set(qapp.topLevelWidgets())
+        def poll():
+            windows = [w for w in qapp.topLevelWidgets()
+                       if isinstance(w, MainWindow) and w.isVisible() and w not in before]
+            if windows:
+                canvas = windows[0].canvas
+                seen.append((canvas.painted, canvas.stats.node_count))
+                if canvas.stats.node_count:
+                    windows[0].close()
+                    qapp.quit()
+        timer = QTimer()
+        timer.timeout.connect(poll)
+        timer.start(0)
+        QTimer.singleShot(10000, qapp.quit)
+        assert ndraw.main(["ndraw", str(network_file)]) == 0
+        timer.stop()
+        assert seen[0][1] == 0
+        assert seen[-1] == (True, 3)
+        assert all(painted for painted, count in seen if count)
+
+    def test_open_file_reports_errors(self, qapp, tmp_path):
+        """Test ob eine fehlerhafte Datei gemeldet statt geworfen wird."""
+        window = MainWindow()
+        path = tmp_path / "kaputt.json"
+        path.write_text("{")
+        assert not window.open_file(path)
+        assert not window.open_file(tmp_path / "fehlt.graphml")
+        assert window.status_bar.currentMessage().startswith("❌")
+        window.close()
+
+
+class TestIconCache:
+    """Tests für den gemeinsamen Icon-Cache."""
+
+    def test_first_start_fills_cache(self, qapp, icon_cache):
+        """Test ob beim ersten Start alle Größen gezeichnet und abgelegt werden."""
+        icon = ndraw.app_icon()
+        directory = ndraw.icon_cache_dir()
+        assert directory.parent == icon_cache / "ndraw" / "icons"
+        assert sorted(p.name for p in directory.iterdir()) == sorted(
+            f"ndraw_icon_{size}.png" for size in ndraw.ICON_SIZES)
+        assert len(icon.availableSizes()) == len(ndraw.ICON_SIZES)
+
+    def test_repeat_start_draws_nothing(self, qapp, monkeypatch):
+        """Test ob Folgestarts nur die Dateien laden und nichts zeichnen."""
+        ndraw.app_icon()
+        ndraw.app_icon.cache_clear()
+        def fail(*args):
+            raise AssertionError("Icon neu gezeichnet")
+        monkeypatch.setattr(ndraw, "draw_app_icon", fail)
+        icon = ndraw.app_icon()
+        assert icon.pixmap(48, 48).width() == 48
+
+    def test_key_follows_style(self):
+        """Test ob geänderte Zeichenparameter einen neuen Cache-Schlüssel ergeben."""
+        changed = dict(ndraw.ICON_STYLE, background="#000000")
+        assert ndraw.icon_cache_key(changed) != ndraw.icon_cache_key()
+        assert ndraw.icon_cache_key(sizes=(16,)) != ndraw.icon_cache_key()
+
+    def test_unwritable_cache(self, qapp, icon_cache):
+        """Test ob ein nicht beschreibbarer Cache nur zum Zeichnen im Speicher führt."""
+        icon_cache.write_text("kein Verzeichnis")
+        icon = ndraw.app_icon()
+        assert not icon.isNull()
+        assert len(icon.availableSizes()) == len(ndraw.ICON_SIZES)
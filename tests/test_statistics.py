@@ -0,0 +1,187 @@
+import pytest
+import sys
+import random
+from pathlib import Path
+from PyQt6.QtWidgets import QApplication
+
+# Importiere die Klassen aus ndraw.py
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from ndraw import NetworkCanvas, MainWindow, StatisticsPanel, AdjacencySnapshot
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Erstelle eine QApplication Instanz für alle Tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+@pytest.fixture
+def canvas(qapp):
+    """Erstelle eine neue NetworkCanvas Instanz für jeden Test."""
+    return NetworkCanvas()
+
+@pytest.fixture
+def network(canvas):
+    """Zyklus 0 -> 1 -> 2 -> 0, 2 -> 3, Schleife an 4, isolierter Knoten 5."""
+    nodes = [canvas.add_new_node(i * 100, 0, i) for i in range(6)]
+    pairs = [(0, 1), (1, 2), (2, 0), (2, 3), (4, 4)]
+    edges = [canvas.add_new_edge(nodes[a], nodes[b]) for a, b in pairs]
+    return nodes, edges
+
+
+class FakeEdge:
+    def __init__(self, source, target):
+        self.source = source
+        self.target = target
+
+
+def reference_components(n, pairs):
+    """Referenz: Komponenten über gegenseitige Erreichbarkeit (nur für kleine n)."""
+    reach = [{i} for i in range(n)]
+    changed = True
+    while changed:
+        changed = False
+        for a, b in pairs:
+            if not reach[b] <= reach[a]:
+                reach[a] |= reach[b]
+                changed = True
+    strong = {frozenset(j for j in reach[i] if i in reach[j]) for i in range(n)}
+    parent = list(range(n))
+    def find(x):
+        while parent[x] != x:
+            x = parent[x]
+        return x
+    for a, b in pairs:
+        parent[find(a)] = find(b)
+    return len({find(i) for i in range(n)}), len(strong)
+
+
+class TestIncrementalStats:
+    """Tests für die fortgeschriebenen Kennzahlen."""
+
+    def test_counts(self, canvas, network):
+        """Test ob Zähler, Quellen, Senken und Schleifen stimmen."""
+        stats = canvas.stats
+        assert (stats.node_count, stats.edge_count, stats.self_loops) == (6, 5, 1)
+        assert (stats.sources, stats.sinks, stats.isolated) == (0, 1, 1)
+        assert stats.out_histogram == {0: 2, 1: 3, 2: 1}
+        assert stats.in_histogram == {0: 1, 1: 5}
+
+    def test_remove_edge_and_node(self, canvas, network):
+        """Test ob Löschen die Kennzahlen zurückschreibt."""
+        nodes, edges = network
+        canvas.remove_edge(edges[2])
+        assert (canvas.stats.sources, canvas.stats.sinks) == (1, 1)
+        canvas.remove_node(nodes[2])
+        assert (canvas.stats.node_count, canvas.stats.edge_count) == (5, 2)
+        assert canvas.stats.isolated == 2
+
+    def test_batch_delete(self, canvas, network):
+        """Test ob remove_items die Kennzahlen fortschreibt."""
+        nodes, _ = network
+        canvas.remove_items(nodes[:3])
+        stats = canvas.stats
+        assert (stats.node_count, stats.edge_count, stats.isolated) == (3, 1, 2)
+        assert sum(stats.in_histogram.values()) == 3
+
+    def test_clear(self, canvas, network):
+        """Test ob clear_network die Kennzahlen zurücksetzt."""
+        canvas.clear_network()
+        assert canvas.stats.node_count == 0 and not canvas.stats.in_histogram
+
+
+class TestComponents:
+    """Tests für schwache und starke Zusammenhangskomponenten."""
+
+    def test_small_network(self, canvas, network):
+        """Test ob Komponenten im Beispielnetz erkannt werden."""
+        adjacency = canvas.adjacency()
+        weak, labels = adjacency.weak_components()
+        assert weak == 3
+        assert labels[0] == labels[3] != labels[5]
+        strong, labels = adjacency.strong_components()
+        assert strong == 4
+        assert labels[0] == labels[1] == labels[2] != labels[3]
+
+    def test_matches_reference(self):
+        """Test ob die Komponenten auf Zufallsgraphen der Referenz entsprechen."""
+        rng = random.Random(3)
+        for _ in range(20):
+            n = rng.randrange(1, 40)
+            nodes = [object() for _ in range(n)]
+            pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(rng.randrange(60))]
+            adjacency = AdjacencySnapshot(nodes, [FakeEdge(nodes[a], nodes[b]) for a, b in pairs])
+            assert (adjacency.weak_components()[0], adjacency.strong_components()[0]) == \
+                reference_components(n, pairs)
+
+
+class TestStatisticsPanel:
+    """Tests für das Statistik-Panel."""
+
+    def test_components_in_background(self, qapp, canvas, network):
+        """Test ob die Komponenten im Worker berechnet und angezeigt werden."""
+        panel = StatisticsPanel(canvas)
+        panel.refresh()
+        assert panel.labels["nodes"].text() == "6"
+        panel.future.result(timeout=10)
+        qapp.processEvents()
+        assert panel.labels["weak"].text() == "3"
+        assert panel.labels["strong"].text() == "4"
+
+    def test_components_cached_until_change(self, qapp, canvas, network):
+        """Test ob ohne Änderung keine neue Berechnung startet."""
+        nodes, _ = network
+        panel = StatisticsPanel(canvas)
+        panel.refresh()
+        first = panel.future
+        first.result(timeout=10)
+        qapp.processEvents()
+        panel.refresh()
+        assert panel.future is first
+        canvas.add_new_edge(nodes[3], nodes[5])
+        panel.refresh()
+        assert panel.future is not first
+        panel.future.result(timeout=10)
+        qapp.processEvents()
+        assert panel.labels["weak"].text() == "2"
+
+    def test_components_failure(self, qapp, canvas, network, monkeypatch):
+        """Test ob ein Fehler im Worker angezeigt wird und die nächste Änderung neu rechnet."""
+        nodes, _ = network
+        def fail(self):
+            raise MemoryError("zu groß")
+        monkeypatch.setattr(AdjacencySnapshot, "strong_components", fail)
+        panel = StatisticsPanel(canvas)
+        panel.refresh()
+        panel.future.result(timeout=10)
+        qapp.processEvents()
+        assert panel.pending_version is None
+        assert panel.labels["strong"].text() == "Fehler"
+        assert panel.labels["strong"].toolTip() == "zu groß"
+        first = panel.future
+        panel.refresh()
+        assert panel.future is first
+        monkeypatch.undo()
+        canvas.add_new_edge(nodes[3], nodes[5])
+        panel.refresh()
+        panel.future.result(timeout=10)
+        qapp.processEvents()
+        assert panel.labels["weak"].text() == "2"
+        assert panel.labels["strong"].toolTip() == ""
+
+    def test_histogram_text(self, canvas, network):
+        """Test ob die Gradverteilung angezeigt wird."""
+        panel = StatisticsPanel(canvas)
+        panel.refresh()
+        assert panel.labels["out_degree"].text() == "0×2  1×3  2×1"
+
+    def test_menu_toggles_dock(self, qapp):
+        """Test ob die Menüaktion das Statistik-Dock anzeigt."""
+        window = MainWindow()
+        window.show()
+        assert not window.statistics_dock.isVisible()
+        window.action_statistics.trigger()
+        assert window.statistics_dock.isVisible()
+        assert window.statistics.refresh_timer.isActive()
+        window.close()
@@ -0,0 +1,158 @@
+import pytest
+import sys
+from pathlib import Path
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QPointF
+
+# Importiere die Klassen aus ndraw.py
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from ndraw import NetworkCanvas, MainWindow, GraphData, GraphModel, read_graph_file
+import ndraw
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Erstelle eine QApplication Instanz für alle Tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+@pytest.fixture
+def canvas(qapp):
+    """Canvas im virtualisierten Modus mit einer Kette von 400 Knoten im Abstand 100."""
+    canvas = NetworkCanvas()
+    canvas.resize(800, 600)
+    graph = GraphData()
+    for i in range(399):
+        graph.edge(str(i), str(i + 1))
+    for i in range(400):
+        graph.xs[i], graph.ys[i] = i * 100, 0
+    canvas.set_model(GraphModel.from_graph(graph))
+    canvas.centerOn(0, 0)
+    canvas.update_virtual_items()
+    return canvas
+
+
+def model_ids(canvas):
+    return sorted(node.model_index for node in canvas.nodes)
+
+
+class TestMaterialization:
+    """Tests für das Anlegen der Items im sichtbaren Bereich."""
+
+    def test_only_visible_items(self, canvas):
+        """Test ob nur Knoten im Viewport plus Rand als Items existieren."""
+        assert 0 < len(canvas.nodes) < 40
+        rect = canvas.visible_scene_rect(ndraw.VIRTUAL_MARGIN_PX)
+        for node in canvas.nodes:
+            assert rect.adjusted(-100, 0, 100, 0).contains(node.pos())
+        assert canvas.stats.node_count == 400
+        assert len(canvas.edges) == len(canvas.nodes) - 1
+
+    def test_pan_recycles_items(self, canvas):
+        """Test ob beim Verschieben Items aus dem Pool wiederverwendet werden."""
+        canvas.centerOn(10000, 0)
+        canvas.update_virtual_items()
+        before = len(canvas.scene.items())
+        canvas.centerOn(20000, 0)
+        canvas.update_virtual_items()
+        assert min(model_ids(canvas)) > 150
+        assert len(canvas.scene.items()) == before
+        assert all(not item.isVisible() for item in canvas.node_pool)
+
+    def test_selected_node_stays(self, canvas):
+        """Test ob ausgewählte Knoten beim Verschieben erhalten bleiben."""
+        first = canvas.virtual_nodes[0]
+        canvas.select_items([first])
+        canvas.centerOn(20000, 0)
+        canvas.update_virtual_items()
+        assert canvas.virtual_nodes[0] is first and first.isVisible()
+
+    def test_overview_when_zoomed_out(self, canvas, monkeypatch):
+        """Test ob zu viele sichtbare Knoten die Rasterübersicht auslösen."""
+        monkeypatch.setattr(ndraw, "VIRTUAL_ITEM_LIMIT", 3)
+        canvas.update_virtual_items()
+        assert canvas.virtual_overview and not canvas.nodes
+        canvas.grab()
+
+
+    def test_viewport_uses_grid(self, canvas, monkeypatch):
+        """Test ob der Abgleich nach dem Aufbau des Gitterindex das Modell nicht mehr durchläuft."""
+        canvas.grid_builder.submit(lambda: None).result(timeout=10)  # Aufbau abwarten
+        def scan(*args):
+            raise AssertionError("Modell vollständig durchlaufen")
+        monkeypatch.setattr(GraphModel, "nodes_in", scan)
+        monkeypatch.setattr(GraphModel, "edges_in", scan)
+        canvas.centerOn(20000, 0)
+        canvas.update_virtual_items()
+        assert min(model_ids(canvas)) > 150
+        assert len(canvas.edges) == len(canvas.nodes) - 1
+
+
+class TestWriteBack:
+    """Tests für das Zurückschreiben von Änderungen ins Modell."""
+
+    def test_move_and_label(self, canvas):
+        """Test ob Verschieben und Umbenennen im Modell landen."""
+        node = canvas.virtual_nodes[2]
+        node.setPos(QPointF(205, 30))
+        node.set_label("Neu")
+        model = canvas.model
+        assert (model.xs[2], model.ys[2], model.labels[2]) == (205, 30, "Neu")
+
+    def test_add_and_connect(self, canvas):
+        """Test ob neue Knoten und Kanten ins Modell eingefügt werden."""
+        node = canvas.add_new_node(50, 50, canvas.allocate_node_id())
+        canvas.add_new_edge(canvas.virtual_nodes[0], node)
+        assert node.node_id == 400 and canvas.model.n == 401
+        assert canvas.stats.edge_count == 400
+        assert (0, 400) in set(canvas.edge_records())
+
+    def test_delete(self, canvas):
+        """Test ob Löschen Modell und Kennzahlen fortschreibt und Items freigibt."""
+        canvas.remove_items([canvas.virtual_nodes[1]])
+        assert 1 not in canvas.virtual_nodes
+        assert canvas.stats.node_count == 399 and canvas.stats.edge_count == 397
+        assert not canvas.adjacency().is_connected()
+        assert len(canvas.virtual_nodes[0].lines) == 0
+
+    def test_delete_self_loops(self, canvas):
+        """Test ob gelöschte Schleifen (auch an großen Modellindizes) abgezogen werden."""
+        canvas.add_new_edge(canvas.virtual_nodes[3], canvas.virtual_nodes[3])
+        canvas.centerOn(30000, 0)
+        canvas.update_virtual_items()
+        canvas.add_new_edge(canvas.virtual_nodes[300], canvas.virtual_nodes[300])
+        assert canvas.stats.self_loops == 2
+        canvas.remove_items([canvas.virtual_nodes[300]])
+        assert canvas.stats.self_loops == 1
+        canvas.centerOn(0, 0)
+        canvas.update_virtual_items()
+        canvas.remove_items([canvas.virtual_nodes[3]])
+        assert canvas.stats.self_loops == 0
+        assert canvas.stats.edge_count == 395
+
+    def test_toggle_back_materializes_all(self, canvas):
+        """Test ob das Abschalten alle Elemente mit ihren IDs anlegt."""
+        canvas.virtual_nodes[3].set_label("drei")
+        canvas.set_virtual(False)
+        assert canvas.model is None
+        assert len(canvas.nodes) == 400 and len(canvas.edges) == 399
+        assert canvas.nodes[3].label_text == "drei"
+
+
+class TestVirtualImport:
+    """Tests für den automatisch virtualisierten Import."""
+
+    def test_large_import_is_virtual(self, qapp, tmp_path, monkeypatch):
+        """Test ob große Importe virtualisiert und vollständig exportiert werden."""
+        monkeypatch.setattr(ndraw, "VIRTUAL_IMPORT_THRESHOLD", 100)
+        path = tmp_path / "g.csv"
+        path.write_text("".join(f"{i},{i + 1}\n" for i in range(300)), encoding="utf-8")
+        window = MainWindow()
+        window.import_graph_file(str(path))
+        assert window.canvas.model is not None and window.action_virtual.isChecked()
+        assert len(window.canvas.nodes) < 301
+        out = str(tmp_path / "out.graphml")
+        window.export_graph_file(out)
+        assert len(read_graph_file(out).sources) == 300
+        window.close()